@@ -6,18 +6,14 @@ import matplotlib.dates as mdates  # <-- NEW
 
 from src.data_core.reader import DataReader
 from src.data_core.adjustments import TableRefiner
-from src.intelligence.header import HeaderDetector
-from src.intelligence.columns import ConsumptionColumnDetector, TimeColumnDetector
-
-from src.intelligence.columns.time import (
-    Preference_Date_And_Hour,
-    Preference_SingleDateTime,
-)
-
 from src.data_core.writer import TableWriter
+from src.data_core.cache import PipelineCache
+from src.pipeline import run_automatic_pipeline, apply_time_preference
+from src.profiling import PipelineProfiler
 
 # --- plotting helper class ---
 from src.plot.data_plotter import DataPlotter
+from src.plot.render_cache import PlotRenderCache
 
 
 # ==============================================================================
@@ -39,7 +35,11 @@ def init_state():
         "log": [],
         "save_name": "",
         "saved_path": None,
+        "save_jobs": [],  # background saves: [{"label", "future", "writer"}]
+        "save_done": [],  # finished saves not shown yet
+        "csv_compression": "none",
         "pipeline_summary": None,  # still stored, but not shown
+        "time_stages": [],  # profiler records of the last time interpretation
 
         # --- keep temp file across reruns (needed for multi-sheet pick) ---
         "uploaded_temp_path": None,
@@ -65,7 +65,7 @@ def init_state():
 
         # --- plot flow state ---
         "plot_wants": "No",  # "No" | "Yes"
-        "random_week_info": None,  # dict or None
+        "random_week_info": None,  # dict (week_index, start, end, total_weeks) or None
         "random_week_clicks": 0,
     }
     for k, v in defaults.items():
@@ -100,61 +100,102 @@ def _format_datetime_xaxis(fig):
     return fig
 
 
+# Append per-stage profiler records here (JSON lines), e.g. for monitoring
+PROFILE_JSONL = os.environ.get("PIPELINE_PROFILE_JSONL")
+
+# Compact mode for the in-flight tables (helper columns dropped as soon as "moment"
+# is built); COMPACT_FLOAT32=1 also stores consumption as float32 when lossless.
+COMPACT_TABLES = os.environ.get("COMPACT_TABLES", "1") != "0"
+COMPACT_FLOAT32 = os.environ.get("COMPACT_FLOAT32", "0") == "1"
+
+# ARROW_STRINGS=1: text columns are Arrow-backed (string[pyarrow]) from reading through detection
+ARROW_STRINGS = os.environ.get("ARROW_STRINGS", "0") == "1"
+
+
+def _log_stages(stages, context: dict) -> None:
+    for rec in stages or []:
+        log(f"[stage] {PipelineProfiler.record_text(rec)}")
+    if PROFILE_JSONL and stages:
+        try:
+            PipelineProfiler.write_jsonl(PROFILE_JSONL, stages, **context)
+        except Exception as e:
+            log(f"Could not write profile records: {e}")
+
+
+def _warn_unparsed_moments(nat_rate: float) -> None:
+    if nat_rate > 0:
+        st.warning(
+            f"{nat_rate:.1%} of the rows have no timestamp (their date/time could not be parsed). "
+            "Check the selected time columns before saving."
+        )
+
+
+def _write_stats_text(stats) -> str:
+    if not stats:
+        return ""
+    sheets = f" on {stats['sheets']} sheet(s)" if stats.get("sheets") else ""
+    return (
+        f"{stats['rows']:,} rows{sheets} in {stats['seconds']:.2f}s "
+        f"({stats['rows_per_sec'] or 0:,} rows/s, {stats['mb_per_sec'] or 0} MB/s)"
+    )
+
+
+def _submit_save(label: str, df: pd.DataFrame, fmt: str, **kwargs):
+    """
+    Start a background save (TableWriter.save_async); the UI polls it below.
+    """
+    writer = TableWriter()
+    future = writer.save_async(df, st.session_state.save_name.strip(), fmt, index=False, **kwargs)
+    st.session_state.save_jobs.append({"label": label, "future": future, "writer": writer})
+
+
+def _save_jobs_status(polling: bool):
+    """
+    Show finished saves and the ones still running. Runs as a fragment: while
+    saves are pending it reruns on its own (not the whole script) until they
+    are done, then triggers one full rerun to show the results.
+    """
+    jobs = st.session_state.save_jobs
+    st.session_state.save_done += [j for j in jobs if j["future"].done()]
+    pending = [j for j in jobs if not j["future"].done()]
+    st.session_state.save_jobs = pending
+
+    if polling and not pending:
+        st.rerun()  # stop polling; the full rerun shows the results
+
+    for job in st.session_state.save_done:
+        try:
+            out_path = job["future"].result()
+            st.session_state.saved_path = str(out_path)
+            st.success(f"Saved! File written to: `{out_path}`")
+            st.caption(_write_stats_text(job["writer"].write_stats.get(str(out_path))))
+        except Exception as e:
+            st.error(f"Could not save {job['label']}: {e}")
+    st.session_state.save_done = []
+
+    if pending:
+        st.info("Saving " + ", ".join(j["label"] for j in pending) + " in the background...")
+
+
+def _show_save_jobs(poll_seconds: float = 0.5):
+    """
+    Save status; polled every `poll_seconds` (fragment rerun, no sleep) while a save is running.
+    """
+    polling = any(not j["future"].done() for j in st.session_state.save_jobs)
+    st.fragment(_save_jobs_status, run_every=poll_seconds if polling else None)(polling)
+
+
 # ==============================================================================
-# Core pipeline (automatic)
+# Core pipeline (automatic) -> src/pipeline.py
 # ==============================================================================
-def run_automatic_pipeline(file_path: str) -> dict:
-    reader = DataReader(file_path)
-    df_processed = reader.read_data()
-
-    table = getattr(reader, "table", None)
-    if table is None:
-        table = df_processed
-
-    raw_table = table.copy()
-    raw_shape = raw_table.shape
-
-    refiner1 = TableRefiner(table)
-    refiner1.clean_table()
-    table = refiner1.table
-    clean1_shape = table.shape
-
-    header_det = HeaderDetector(table)
-    header_det.apply_header()
-    table = header_det.table
-    header_shape = table.shape
-
-    refiner2 = TableRefiner(table)
-    refiner2.clean_table()
-    table = refiner2.table
-    clean2_shape = table.shape
-
-    cons_det = ConsumptionColumnDetector(table)
-    consumption_col = cons_det.detect_consumption_column()
-    _cons_kwh_series = cons_det.to_kwh()
-    final_table = cons_det.table
-    final_shape = final_table.shape
-
-    time_det = TimeColumnDetector(final_table)
-    time_candidates = time_det.detect_time_columns()
-
-    summary = {
-        "raw_shape": raw_shape,
-        "clean1_shape": clean1_shape,
-        "header_shape": header_shape,
-        "clean2_shape": clean2_shape,
-        "final_shape": final_shape,
-        "consumption_col": consumption_col,
-        "time_candidates_count": len(time_candidates) if time_candidates else 0,
-    }
+@st.cache_resource
+def _pipeline_cache() -> PipelineCache:
+    return PipelineCache()
 
-    return {
-        "df_raw": raw_table,
-        "df_processed": final_table,
-        "consumption_col": consumption_col,
-        "time_candidates": time_candidates,
-        "summary": summary,
-    }
+
+@st.cache_resource
+def _plot_cache() -> PlotRenderCache:
+    return PlotRenderCache()
 
 
 # ==============================================================================
@@ -189,13 +230,22 @@ if st.session_state.step == 0:
 
             temp_path = st.session_state.uploaded_temp_path
 
-            results = run_automatic_pipeline(temp_path)
+            # Sheet settled before reading (asks for multi-sheet workbooks), so it is part of the cache key
+            sheet_name = DataReader(temp_path).choose_sheet()
+            results = run_automatic_pipeline(
+                temp_path, cache=_pipeline_cache(), sheet_name=sheet_name, arrow_strings=ARROW_STRINGS
+            )
 
             st.session_state.df_raw = results["df_raw"]
             st.session_state.df_processed = results["df_processed"]
             st.session_state.consumption_col = results["consumption_col"]
             st.session_state.time_candidates = results["time_candidates"]
             st.session_state.pipeline_summary = results.get("summary")
+            st.session_state.time_stages = []
+            _log_stages(
+                (results.get("summary") or {}).get("stages"),
+                {"file": st.session_state.uploaded_file_name, "sheet": sheet_name},
+            )
 
             st.session_state.time_selected = []
             st.session_state.time_pair_mode = None
@@ -206,6 +256,8 @@ if st.session_state.step == 0:
 
             st.session_state.save_name = ""
             st.session_state.saved_path = None
+            st.session_state.save_jobs = []
+            st.session_state.save_done = []
 
             st.session_state.plot_wants = "No"
             st.session_state.random_week_info = None
@@ -330,23 +382,20 @@ if st.session_state.step == 1:
             else:
                 if single_mode.startswith("It contains both date and hour information"):
                     try:
-                        pref = Preference_SingleDateTime(df, datetime_col=single_col)
-                        pref.extract_date_and_hour()
-                        pref.create_moment_column()
-
-                        refiner2 = TableRefiner(pref.table)
-                        refiner2.keep_only_moment_and_consumption(
-                            moment_col="moment",
-                            consumption_col="consumption_kwh",
+                        profiler = PipelineProfiler()
+                        st.session_state.df_processed, nat_rate = apply_time_preference(
+                            df,
+                            "single",
+                            datetime_col=single_col,
+                            profiler=profiler,
+                            compact=COMPACT_TABLES,
+                            float32=COMPACT_FLOAT32,
                         )
-                        refiner2.drop_trailing_empty_rows()
-                        refiner2.drop_empty_columns()
-                        pref.table = refiner2.table
-
-                        st.session_state.df_processed = pref.table
+                        st.session_state.time_stages = profiler.as_dicts()
                         df = st.session_state.df_processed
 
                         st.success("Success! Your final table is ready.")
+                        _warn_unparsed_moments(nat_rate)
                     except Exception as e:
                         st.error(f"I couldn't normalize the single datetime column: {e}")
 
@@ -447,24 +496,21 @@ if st.session_state.step == 1:
                     st.warning("Confirm date/hour to proceed with merging & parsing.")
                 else:
                     try:
-                        pref = Preference_Date_And_Hour(df, date_col=date_col, hour_col=hour_col)
-                        pref.detect_date_dtype()
-                        pref.normalize_hour_column()
-                        pref.create_moment_column(out_col="moment")
-
-                        refiner2 = TableRefiner(pref.table)
-                        refiner2.keep_only_moment_and_consumption(
-                            moment_col="moment",
-                            consumption_col="consumption_kwh",
+                        profiler = PipelineProfiler()
+                        st.session_state.df_processed, nat_rate = apply_time_preference(
+                            df,
+                            "date_hour",
+                            date_col=date_col,
+                            hour_col=hour_col,
+                            profiler=profiler,
+                            compact=COMPACT_TABLES,
+                            float32=COMPACT_FLOAT32,
                         )
-                        refiner2.drop_trailing_empty_rows()
-                        refiner2.drop_empty_columns()
-                        pref.table = refiner2.table
-
-                        st.session_state.df_processed = pref.table
+                        st.session_state.time_stages = profiler.as_dicts()
                         df = st.session_state.df_processed
 
                         st.success("Success! Your final table is ready.")
+                        _warn_unparsed_moments(nat_rate)
                     except Exception as e:
                         st.error(f"I couldn't normalize/merge date+hour: {e}")
 
@@ -518,30 +564,53 @@ if st.session_state.step == 1:
 
         if st.session_state.plot_wants == "Yes":
             try:
-                plotter = DataPlotter(df)
+                # Rendered PNGs are cached by (data hash, view, week index);
+                # the plotter is only built when something has to be drawn.
+                plot_cache = _plot_cache()
+                data_key = PlotRenderCache.data_key(df)
+                plotters = []
+
+                def get_plotter() -> DataPlotter:
+                    if not plotters:
+                        plotters.append(DataPlotter(df, render_dpi=plot_cache.dpi))
+                    return plotters[0]
+
+                def week_figure(week_index: int) -> dict:
+                    info = get_plotter().plot_week(week_index)
+                    info["fig"] = _format_datetime_xaxis(info["fig"])
+                    return info
+
+                def render_week(week_index: int):
+                    return plot_cache.render((data_key, "week", week_index), lambda: week_figure(week_index))
 
                 st.markdown("#### Full time range")
-                fig_full = plotter.plot_full()
-                fig_full = _format_datetime_xaxis(fig_full)  # <-- NEW
-                st.pyplot(fig_full, use_container_width=True)
+                png_full, full_info = plot_cache.render(
+                    (data_key, "full", None),
+                    lambda: {
+                        "fig": _format_datetime_xaxis(get_plotter().plot_full()),
+                        "total_weeks": get_plotter().total_weeks(),
+                    },
+                )
+                st.image(png_full, use_container_width=True)
 
-                total_weeks = plotter.total_weeks()
+                total_weeks = full_info["total_weeks"]
                 st.info(f"Total available weeks in this dataset: **{total_weeks}**")
+                if total_weeks == 0:
+                    raise ValueError("No weekly segments found in the dataset.")
 
                 st.markdown("#### Last week")
-                last_info = plotter.plot_last_week()
-                last_info["fig"] = _format_datetime_xaxis(last_info["fig"])  # <-- NEW
+                png_last, last_info = render_week(total_weeks)
                 st.info(
                     f"Plotting last week: **Week {last_info['week_index']} / {last_info.get('total_weeks', total_weeks)}** "
                     f"({last_info['start']} → {last_info['end']})"
                 )
-                st.pyplot(last_info["fig"], use_container_width=True)
+                st.image(png_last, use_container_width=True)
 
                 c1, c2 = st.columns(2)
                 with c1:
                     if st.button("Plot another random week"):
                         st.session_state.random_week_clicks += 1
-                        st.session_state.random_week_info = plotter.plot_random_week()
+                        st.session_state.random_week_info = render_week(DataPlotter.pick_random_week(total_weeks))[1]
                         st.rerun()
 
                 with c2:
@@ -554,8 +623,8 @@ if st.session_state.step == 1:
                         f"Randomly selected: **Week {info['week_index']} / {info.get('total_weeks', total_weeks)}** "
                         f"({info['start']} → {info['end']})"
                     )
-                    fig_rand = _format_datetime_xaxis(info["fig"])  # <-- NEW
-                    st.pyplot(fig_rand, use_container_width=True)
+                    png_rand, _ = render_week(info["week_index"])
+                    st.image(png_rand, use_container_width=True)
 
             except Exception as e:
                 st.error(f"Plotting failed: {e}")
@@ -576,27 +645,32 @@ if st.session_state.step == 1:
 
         save_disabled = (st.session_state.save_name.strip() == "")
 
+        st.session_state.csv_compression = st.radio(
+            "CSV compression:",
+            ["none", "gzip", "zstd"],
+            index=["none", "gzip", "zstd"].index(st.session_state.csv_compression),
+            horizontal=True,
+        )
+        csv_compression = None if st.session_state.csv_compression == "none" else st.session_state.csv_compression
+
+        # Saves run in a background thread pool; both formats can be written at once
         s1, s2 = st.columns(2)
         with s1:
             if st.button("Save as Excel (.xlsx)", disabled=save_disabled):
                 try:
-                    writer = TableWriter()
-                    out_path = writer.save_xlsx(df, st.session_state.save_name.strip(), index=False)
-                    st.session_state.saved_path = str(out_path)
-                    st.success(f"Saved! File written to: `{st.session_state.saved_path}`")
+                    _submit_save("Excel (.xlsx)", df, "xlsx")
                 except Exception as e:
                     st.error(f"Could not save file: {e}")
 
         with s2:
             if st.button("Save as CSV (.csv)", disabled=save_disabled):
                 try:
-                    writer = TableWriter()
-                    out_path = writer.save_csv(df, st.session_state.save_name.strip(), index=False)
-                    st.session_state.saved_path = str(out_path)
-                    st.success(f"Saved! File written to: `{st.session_state.saved_path}`")
+                    _submit_save("CSV (.csv)", df, "csv", compression=csv_compression)
                 except Exception as e:
                     st.error(f"Could not save file: {e}")
 
+        _show_save_jobs()
+
     st.write("---")
 
     colA, colB = st.columns(2)
@@ -615,7 +689,10 @@ if st.session_state.step == 1:
             st.session_state.time_col = None
             st.session_state.save_name = ""
             st.session_state.saved_path = None
+            st.session_state.save_jobs = []
+            st.session_state.save_done = []
             st.session_state.pipeline_summary = None
+            st.session_state.time_stages = []
 
             st.session_state.plot_wants = "No"
             st.session_state.random_week_info = None
@@ -651,3 +728,9 @@ if st.session_state.step == 1:
 
     with st.expander("Debug log"):
         st.write(st.session_state.log)
+
+        stages = list((st.session_state.pipeline_summary or {}).get("stages") or [])
+        stages += st.session_state.time_stages or []
+        if stages:
+            st.markdown("**Stage timings**")
+            st.dataframe(pd.DataFrame(stages), use_container_width=True)
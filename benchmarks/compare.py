@@ -0,0 +1,74 @@
+# benchmarks/compare.py
+"""
+Compare two benchmark reports (see benchmarks/run.py) stage by stage.
+
+    python -m benchmarks.compare reports/base.json reports/HEAD.json --threshold 0.10
+
+Prints head/base ratios of the median wall time per case and stage; with
+--fail-on-regression the exit code is 1 when any stage (or total) is slower
+than base by more than the threshold (and above --min-seconds, to ignore noise).
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+
+
+def _load(path: str) -> dict:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare(base: dict, head: dict, threshold: float = 0.10, min_seconds: float = 0.005) -> list:
+    """
+    Rows of (case, stage, base_s, head_s, ratio, regressed) for cases / stages present in both reports.
+    """
+    base_cases = {c["case"]: c for c in base["cases"] if c.get("status") == "ok"}
+    rows = []
+
+    for case in head["cases"]:
+        b = base_cases.get(case["case"])
+        if b is None or case.get("status") != "ok":
+            continue
+
+        pairs = [
+            (stage, b["stages"][stage]["wall_s_median"], rec["wall_s_median"])
+            for stage, rec in case["stages"].items()
+            if stage in b["stages"]
+        ]
+        pairs.append(("TOTAL", b["total_wall_s_median"], case["total_wall_s_median"]))
+
+        for stage, base_s, head_s in pairs:
+            ratio = head_s / base_s if base_s > 0 else None
+            regressed = ratio is not None and ratio > 1 + threshold and head_s - base_s > min_seconds
+            rows.append((case["case"], stage, base_s, head_s, ratio, regressed))
+    return rows
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.compare", description="Compare two benchmark reports.")
+    parser.add_argument("base")
+    parser.add_argument("head")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Relative slowdown that counts as a regression.")
+    parser.add_argument("--min-seconds", type=float, default=0.005, help="Ignore slowdowns smaller than this.")
+    parser.add_argument("--fail-on-regression", action="store_true")
+    args = parser.parse_args(argv)
+
+    base, head = _load(args.base), _load(args.head)
+    print(f"base: {base['environment'].get('git_commit')}  head: {head['environment'].get('git_commit')}")
+
+    rows = compare(base, head, args.threshold, args.min_seconds)
+    width = max((len(r[0]) for r in rows), default=10)
+    for case, stage, base_s, head_s, ratio, regressed in rows:
+        ratio_text = f"{ratio:6.2f}x" if ratio is not None else "    n/a"
+        flag = "  REGRESSION" if regressed else ""
+        print(f"{case:<{width}}  {stage:<14} {base_s:9.4f}s -> {head_s:9.4f}s  {ratio_text}{flag}")
+
+    n_regressed = sum(r[5] for r in rows)
+    print(f"\n{n_regressed} regression(s) above {args.threshold:.0%}.")
+    return 1 if args.fail_on_regression and n_regressed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
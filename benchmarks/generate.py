@@ -0,0 +1,335 @@
+# benchmarks/generate.py
+"""
+Deterministic generator of messy meter exports (CSV / XLSX) for the benchmarks.
+
+    python -m benchmarks.generate --suite quick --out benchmarks/data
+
+Every file is described by a `MessySpec` (language, time layout, unit, separator,
+encoding, size, resolution ...) and generated from a seed derived from its name,
+so the same spec always produces the same bytes.
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import io
+import zlib
+from dataclasses import asdict, dataclass, replace
+from pathlib import Path
+from typing import List, Literal, Optional
+
+import numpy as np
+import pandas as pd
+
+
+# Sizes: label -> period length (pandas offset alias)
+SPANS = {"1m": "1MS", "1y": "1YS", "5y": "5YS", "10y": "10YS"}
+
+# Resolutions: label -> step
+RESOLUTIONS = {"15min": "15min", "1min": "1min"}
+
+START = pd.Timestamp("2020-01-01 00:00")
+
+# Last row an XLSX sheet can hold (preamble + header + data + blanks must fit)
+XLSX_MAX_ROWS = 1_048_576
+
+# Header names / formats per language
+LANGUAGES = {
+    "de": {
+        "date": "Datum",
+        "hour": "Uhrzeit",
+        "datetime": "Zeitstempel",
+        "kwh": "Verbrauch (kWh)",
+        "kw": "Wirkleistung (kW)",
+        "status": "Status",
+        "channel": "Spannung L{i} (V)",
+        "date_format": "%d.%m.%Y",
+        "datetime_format": "%d.%m.%Y %H:%M",
+        "preamble": [
+            ["Zählpunkt", "DE0001234567890000000000000012345"],
+            ["Kunde", "Müller Gießerei GmbH"],
+            ["Zeitraum", "{start} - {end}"],
+            ["Einheit", "{unit}"],
+            [],
+        ],
+    },
+    "en": {
+        "date": "Date",
+        "hour": "Time",
+        "datetime": "Timestamp",
+        "kwh": "Consumption (kWh)",
+        "kw": "Power (kW)",
+        "status": "Status",
+        "channel": "Voltage L{i} (V)",
+        "date_format": "%Y-%m-%d",
+        "datetime_format": "%Y-%m-%d %H:%M:%S",
+        "preamble": [
+            ["Metering point", "GB-0042-7781-0099"],
+            ["Customer", "Acme Foundry Ltd."],
+            ["Period", "{start} - {end}"],
+            ["Unit", "{unit}"],
+            [],
+        ],
+    },
+}
+
+
+@dataclass(frozen=True)
+class MessySpec:
+    """
+    One synthetic input file.
+
+    layout:     "split" (date column + hour column) or "single" (one datetime column)
+    unit:       "kwh" (energy per step) or "kw" (average power per step)
+    decimal:    decimal mark of the numbers in CSV files ("." or ",")
+    channels:   extra numeric measurement columns (wide exports; read raw, each is
+                a mixed column: header text above numbers)
+    """
+    fmt: Literal["csv", "xlsx"] = "csv"
+    language: Literal["de", "en"] = "de"
+    layout: Literal["split", "single"] = "split"
+    unit: Literal["kwh", "kw"] = "kwh"
+    sep: str = ";"
+    encoding: str = "utf-8"
+    decimal: str = "."
+    span: str = "1m"
+    resolution: str = "15min"
+    preamble: bool = True
+    trailing_blank_rows: int = 3
+    channels: int = 0
+    seed: Optional[int] = None
+
+    @property
+    def name(self) -> str:
+        sep_name = {",": "comma", ";": "semicolon", "\t": "tab", "|": "pipe"}.get(self.sep, "sep")
+        parts = [self.language, self.layout, self.unit, self.span, self.resolution]
+        if self.fmt == "csv":
+            parts += [sep_name, self.encoding.replace("-", "")]
+            if self.decimal != ".":
+                parts.append("deccomma")
+        if self.channels:
+            parts.append(f"{self.channels}ch")
+        if not self.preamble:
+            parts.append("nopreamble")
+        return "_".join(parts) + f".{self.fmt}"
+
+    @property
+    def time_mode(self) -> str:
+        return "date_hour" if self.layout == "split" else "single"
+
+    def time_columns(self) -> dict:
+        """
+        Keyword arguments for `apply_time_preference` (names as normalized by HeaderDetector).
+        """
+        names = LANGUAGES[self.language]
+        if self.layout == "split":
+            return {"date_col": names["date"].lower(), "hour_col": names["hour"].lower()}
+        return {"datetime_col": names["datetime"].lower()}
+
+    def n_rows(self) -> int:
+        end = START + pd.tseries.frequencies.to_offset(SPANS[self.span])
+        return int((end - START) / pd.Timedelta(RESOLUTIONS[self.resolution]))
+
+    def fits(self) -> bool:
+        """
+        XLSX is limited to XLSX_MAX_ROWS rows per sheet.
+        """
+        return self.fmt != "xlsx" or self.n_rows() + 10 < XLSX_MAX_ROWS
+
+    def to_dict(self) -> dict:
+        return {"name": self.name, "rows": self.n_rows(), **asdict(self)}
+
+
+# ==============================================================================
+# Content
+# ==============================================================================
+def _seed(spec: MessySpec) -> int:
+    return spec.seed if spec.seed is not None else zlib.crc32(spec.name.encode())
+
+
+def _number_text(spec: MessySpec, values: np.ndarray, decimals: int) -> np.ndarray:
+    """
+    Values as text with `decimals` decimals, in the spec's decimal mark.
+    """
+    text = np.char.mod(f"%.{decimals}f", values.round(decimals))
+    if spec.decimal != ".":
+        text = np.char.replace(text, ".", spec.decimal)
+    return text
+
+
+def expected_moments(spec: MessySpec) -> pd.DatetimeIndex:
+    """
+    The timestamps written into the file, i.e. what the parsed `moment` column must hold.
+    """
+    return pd.date_range(START, periods=spec.n_rows(), freq=RESOLUTIONS[spec.resolution])
+
+
+def make_table(spec: MessySpec) -> pd.DataFrame:
+    """
+    Clean data as text columns (header names of the spec's language), before any messiness.
+    """
+    rng = np.random.default_rng(_seed(spec))
+    names = LANGUAGES[spec.language]
+
+    moments = expected_moments(spec)
+    n = len(moments)
+    steps_per_hour = pd.Timedelta("1h") / pd.Timedelta(RESOLUTIONS[spec.resolution])
+
+    # Load profile: base load + daily / weekly cycle + noise, in kW
+    hours = moments.hour.to_numpy() + moments.minute.to_numpy() / 60
+    weekday = moments.dayofweek.to_numpy()
+    power = (
+        40
+        + 25 * np.clip(np.sin((hours - 6) / 24 * 2 * np.pi), 0, None)
+        - 10 * (weekday >= 5)
+        + rng.gamma(2.0, 2.0, n)
+    )
+    values = power if spec.unit == "kw" else power / steps_per_hour
+    text = _number_text(spec, values, 3)
+
+    # Occasional replacement values, flagged as in real exports
+    status = np.where(rng.random(n) < 0.002, "E", "W")
+
+    table = {}
+    if spec.layout == "split":
+        table[names["date"]] = moments.strftime(names["date_format"])
+        table[names["hour"]] = moments.strftime("%H:%M")
+    else:
+        table[names["datetime"]] = moments.strftime(names["datetime_format"])
+    for i in range(1, spec.channels + 1):
+        table[names["channel"].format(i=i)] = _number_text(spec, 230 + rng.normal(0, 2, n), 1)
+    table[names[spec.unit]] = text
+    table[names["status"]] = status
+    return pd.DataFrame(table)
+
+
+def _preamble_rows(spec: MessySpec, table: pd.DataFrame) -> List[list]:
+    if not spec.preamble:
+        return []
+    first, last = table.iloc[0, 0], table.iloc[-1, 0]
+    unit = "kWh" if spec.unit == "kwh" else "kW"
+    return [[cell.format(start=first, end=last, unit=unit) for cell in row] for row in LANGUAGES[spec.language]["preamble"]]
+
+
+# ==============================================================================
+# Files
+# ==============================================================================
+def _write_csv(spec: MessySpec, table: pd.DataFrame, path: Path) -> None:
+    buf = io.StringIO()
+    writer = csv.writer(buf, delimiter=spec.sep, lineterminator="\r\n")
+    for row in _preamble_rows(spec, table):
+        writer.writerow(row)
+
+    table.to_csv(buf, sep=spec.sep, index=False, lineterminator="\r\n")
+
+    # Trailing blanks: rows of empty fields and empty lines
+    for i in range(spec.trailing_blank_rows):
+        buf.write(spec.sep * (table.shape[1] - 1) + "\r\n" if i % 2 == 0 else "\r\n")
+
+    path.write_bytes(buf.getvalue().encode(spec.encoding))
+
+
+def _write_xlsx(spec: MessySpec, table: pd.DataFrame, path: Path) -> None:
+    from openpyxl import Workbook
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Export")
+
+    for row in _preamble_rows(spec, table):
+        ws.append(row)
+    ws.append(list(table.columns))
+
+    # Numbers as numbers, dates / hours as text (as most meter portals export them)
+    n_text = 1 if spec.layout == "single" else 2
+    cols = [table.iloc[:, j].to_numpy() for j in range(table.shape[1])]
+    for j in range(n_text, table.shape[1] - 1):
+        cols[j] = table.iloc[:, j].str.replace(spec.decimal, ".", regex=False).astype(float).tolist()
+    for row in zip(*cols):
+        ws.append(list(row))
+
+    for _ in range(spec.trailing_blank_rows):
+        ws.append([None] * table.shape[1])
+    wb.save(path)
+
+
+def generate(spec: MessySpec, out_dir: str | Path, overwrite: bool = False) -> Path:
+    """
+    Write the file for `spec` into `out_dir` (reused when it already exists).
+    """
+    if not spec.fits():
+        raise ValueError(f"{spec.name}: {spec.n_rows()} rows do not fit in one XLSX sheet.")
+
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    path = out_dir / spec.name
+    if path.exists() and not overwrite:
+        return path
+
+    table = make_table(spec)
+    tmp = path.with_name(f".{path.name}.tmp")
+    if spec.fmt == "csv":
+        _write_csv(spec, table, tmp)
+    else:
+        _write_xlsx(spec, table, tmp)
+    tmp.replace(path)
+    return path
+
+
+# ==============================================================================
+# Suites
+# ==============================================================================
+# File variants: the messy parts each one exercises
+VARIANTS = [
+    MessySpec(fmt="csv", language="de", layout="split", unit="kwh", sep=";", encoding="cp1252"),
+    MessySpec(fmt="csv", language="en", layout="single", unit="kw", sep=",", encoding="utf-8"),
+    MessySpec(fmt="csv", language="de", layout="single", unit="kw", sep="\t", encoding="utf-8-sig"),
+    MessySpec(fmt="csv", language="en", layout="split", unit="kwh", sep="|", encoding="latin1", preamble=False),
+    MessySpec(fmt="csv", language="de", layout="split", unit="kw", sep=";", encoding="utf-8", decimal=","),
+    MessySpec(fmt="xlsx", language="de", layout="split", unit="kwh"),
+    MessySpec(fmt="xlsx", language="en", layout="single", unit="kw"),
+    MessySpec(fmt="xlsx", language="de", layout="single", unit="kwh", channels=16),
+]
+
+# Suite -> (span, resolution) sizes; XLSX variants skip sizes that do not fit / take too long
+SUITES = {
+    "quick": [("1m", "15min"), ("1m", "1min")],
+    "default": [("1m", "15min"), ("1y", "15min"), ("1m", "1min"), ("1y", "1min")],
+    "full": [
+        ("1m", "15min"), ("1y", "15min"), ("5y", "15min"), ("10y", "15min"),
+        ("1m", "1min"), ("1y", "1min"), ("5y", "1min"), ("10y", "1min"),
+    ],
+}
+
+# XLSX generation / reading is slow: larger sizes are CSV only
+XLSX_MAX_BENCH_ROWS = 400_000
+
+
+def suite_specs(suite: str) -> List[MessySpec]:
+    if suite not in SUITES:
+        raise ValueError(f"Unknown suite: {suite!r}. Use one of {', '.join(SUITES)}.")
+
+    specs = []
+    for span, resolution in SUITES[suite]:
+        for variant in VARIANTS:
+            spec = replace(variant, span=span, resolution=resolution)
+            if spec.fmt == "xlsx" and spec.n_rows() > XLSX_MAX_BENCH_ROWS:
+                continue
+            specs.append(spec)
+    return specs
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.generate", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--suite", choices=list(SUITES), default="quick")
+    parser.add_argument("--out", default=str(Path(__file__).resolve().parent / "data"))
+    parser.add_argument("--overwrite", action="store_true")
+    args = parser.parse_args(argv)
+
+    for spec in suite_specs(args.suite):
+        path = generate(spec, args.out, overwrite=args.overwrite)
+        print(f"{path} ({spec.n_rows():,} rows, {path.stat().st_size / 1e6:.1f} MB)", flush=True)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
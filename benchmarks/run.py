@@ -0,0 +1,181 @@
+# benchmarks/run.py
+"""
+Stage benchmark over generated messy meter files.
+
+    python -m benchmarks.run --suite default --repeat 3 --output reports/HEAD.json
+    python -m benchmarks.compare reports/base.json reports/HEAD.json
+
+Each case runs the same chain as the batch CLI (read, clean, header,
+consumption, time detection, time parsing, final cleanup, optional write),
+timed per stage with PipelineProfiler. The JSON report holds, per case and
+stage, the median / min wall time over the repeats, the median CPU time and
+the max RSS peak, plus environment info (git commit, library versions) so
+reports from different commits can be compared.
+
+A case whose parsed `moment` column differs from the timestamps the
+generator wrote (`moment_nat` unparsed values, `moment_wrong` rows that are
+missing or hold another timestamp) is marked "invalid": its timings are kept
+but describe a failed parse, so it is left out of comparisons and the run
+exits with 1.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.generate import SUITES, MessySpec, expected_moments, generate, suite_specs
+from src.data_core.writer import FORMATS, TableWriter
+from src.pipeline import apply_time_preference, finalize_table, run_automatic_pipeline
+from src.profiling import PipelineProfiler
+
+REPORT_VERSION = 1
+
+
+def _git(*args) -> Optional[str]:
+    try:
+        out = subprocess.run(["git", *args], capture_output=True, text=True, check=True, cwd=Path(__file__).parent)
+        return out.stdout.strip()
+    except Exception:
+        return None
+
+
+def environment() -> dict:
+    import pyarrow
+
+    return {
+        "git_commit": _git("rev-parse", "HEAD"),
+        "git_dirty": bool(_git("status", "--porcelain", "--untracked-files=no")),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+        "pyarrow": pyarrow.__version__,
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def run_case(path: Path, spec: MessySpec, write_fmt: Optional[str] = None) -> dict:
+    """
+    One pass over one file: {"stages": [...records...], "rows_out": int}.
+    """
+    profiler = PipelineProfiler()
+    results = run_automatic_pipeline(str(path), profiler=profiler)
+    table, _ = apply_time_preference(results["df_processed"], spec.time_mode, **spec.time_columns(), profiler=profiler)
+    table = finalize_table(table, profiler=profiler)
+
+    if write_fmt:
+        with tempfile.TemporaryDirectory() as out_dir, profiler.stage("write", table):
+            TableWriter(output_dir_name=out_dir).save(table, "bench", write_fmt)
+
+    moment = table["moment"].to_numpy(dtype="datetime64[ns]")
+    expected = expected_moments(spec).to_numpy()
+    n = min(len(moment), len(expected))
+    wrong = int((moment[:n] != expected[:n]).sum()) + abs(len(moment) - len(expected))
+
+    return {
+        "stages": profiler.as_dicts(),
+        "rows_out": len(table),
+        "moment_nat": int(np.isnat(moment).sum()),
+        "moment_wrong": wrong,
+        "consumption_col": results["consumption_col"],
+        "consumption_unit": results["consumption_unit"],
+    }
+
+
+def aggregate(runs: List[dict]) -> dict:
+    """
+    Per stage: median / min wall time, median CPU time, max RSS peak over the repeats.
+    """
+    stages = {}
+    for name in [s["stage"] for s in runs[0]["stages"]]:
+        recs = [next(s for s in run["stages"] if s["stage"] == name) for run in runs]
+        walls = [r["wall_s"] for r in recs]
+        stages[name] = {
+            "wall_s_median": round(statistics.median(walls), 4),
+            "wall_s_min": round(min(walls), 4),
+            "cpu_s_median": round(statistics.median(r["cpu_s"] for r in recs), 4),
+            "rss_peak_mb_max": max(r["rss_peak_mb"] for r in recs),
+            "rows_in": recs[0]["rows_in"],
+            "rows_out": recs[0]["rows_out"],
+        }
+
+    totals = [sum(s["wall_s"] for s in run["stages"]) for run in runs]
+    return {"stages": stages, "total_wall_s_median": round(statistics.median(totals), 4)}
+
+
+def run_suite(suite: str, data_dir: Path, repeat: int, write_fmt: Optional[str], match: Optional[str]) -> List[dict]:
+    cases = []
+    for spec in suite_specs(suite):
+        if match and match not in spec.name:
+            continue
+
+        path = generate(spec, data_dir)
+        case = {"case": spec.name, "spec": spec.to_dict(), "bytes": path.stat().st_size}
+        try:
+            runs = [run_case(path, spec, write_fmt) for _ in range(repeat)]
+            case.update(aggregate(runs))
+            case.update({k: runs[0][k] for k in ("rows_out", "moment_nat", "moment_wrong", "consumption_col", "consumption_unit")})
+            case["status"] = "ok"
+            if case["moment_wrong"] > 0:
+                case["status"] = "invalid"
+                case["error"] = (
+                    f"{case['moment_wrong']} of {spec.n_rows()} moments differ from the generated timestamps "
+                    f"({case['moment_nat']} NaT)"
+                )
+        except Exception as e:
+            case["status"] = "error"
+            case["error"] = f"{type(e).__name__}: {e}"
+
+        detail = f"{case['total_wall_s_median']:.3f}s" if case["status"] == "ok" else case["error"]
+        if case["status"] == "invalid":
+            detail = f"{case['total_wall_s_median']:.3f}s, {case['error']}"
+        print(f"{case['status'].upper():5} {spec.name}: {detail}", flush=True)
+        cases.append(case)
+    return cases
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.run", description="Per-stage pipeline benchmark.")
+    parser.add_argument("--suite", choices=list(SUITES), default="quick")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per case (median is reported).")
+    parser.add_argument("--write", choices=list(FORMATS), help="Also time writing the result in this format.")
+    parser.add_argument("--match", help="Only cases whose name contains this text.")
+    parser.add_argument("--data-dir", default=str(Path(__file__).resolve().parent / "data"))
+    parser.add_argument("--output", help="JSON report path (default: print to stdout).")
+    args = parser.parse_args(argv)
+
+    report = {
+        "version": REPORT_VERSION,
+        "suite": args.suite,
+        "repeat": args.repeat,
+        "write": args.write,
+        "environment": environment(),
+        "cases": run_suite(args.suite, Path(args.data_dir), max(1, args.repeat), args.write, args.match),
+    }
+
+    text = json.dumps(report, indent=2, default=str)
+    if args.output:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.output).write_text(text, encoding="utf-8")
+        print(f"Report written to {args.output}")
+    else:
+        print(text)
+
+    return 0 if all(c["status"] == "ok" for c in report["cases"]) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,402 @@
+# src/cli.py
+"""
+Headless batch runner (no Streamlit).
+
+    python -m src.cli exports/ more/meter_17.csv --mapping mapping.json --workers 8
+
+Every input file goes through the full chain (see src/pipeline.py) and is
+saved with TableWriter. Sheet choice and time-column interpretation come
+from a JSON mapping file, or from the automatic rules below:
+
+    {
+      "default": {"sheet": null, "time": {"mode": "auto"}},
+      "files": {
+        "meter_*.xlsx": {"sheet": "Data",
+                         "time": {"mode": "date_hour", "date_col": "datum", "hour_col": "zeit"}},
+        "export.csv":   {"time": {"mode": "single", "datetime_col": "zeitstempel"},
+                         "output_name": "ContractNumber_89578345"}
+      }
+    }
+
+"files" keys are matched against the file name: exact names first, then
+glob patterns in file order. Column names are compared after the same
+normalization as the header (stripped, lowercase).
+
+Automatic time rules ("mode": "auto"):
+  - one time candidate  -> "single" (date and hour in one column)
+  - two time candidates -> "date_hour"; the date column is the one whose name
+    mentions a date ("date"/"datum"), else the first one (as in the app)
+"""
+from __future__ import annotations
+
+import argparse
+import fnmatch
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from src.data_core.cache import PipelineCache
+from src.data_core.reader import DataReader
+from src.data_core.writer import CSV_COMPRESSION_SUFFIX, FORMATS, TableWriter
+from src.intelligence.header import HeaderDetector
+from src.profiling import PipelineProfiler
+from src.pipeline import TIME_MODES, apply_time_preference, finalize_table, run_automatic_pipeline
+
+
+SUPPORTED_EXTENSIONS = (".xlsx", ".xls", ".csv")
+
+# Name fragments that mark the DATE column of a date + hour pair
+DATE_NAME_KEYS = ("date", "datum")
+
+# Share of rows whose moment may be unparsed (NaT) before a file counts as failed
+DEFAULT_MAX_NAT_RATE = 0.05
+
+
+# ==============================================================================
+# Inputs + rules
+# ==============================================================================
+def collect_inputs(inputs: List[str], file_list: Optional[str] = None, recursive: bool = False) -> List[str]:
+    """
+    Expand files / directories (+ an optional text file with one path per line)
+    into a sorted, de-duplicated list of supported data files.
+    """
+    paths = list(inputs)
+    if file_list:
+        with open(file_list, "r", encoding="utf-8") as f:
+            paths += [line.strip() for line in f if line.strip() and not line.startswith("#")]
+
+    files = []
+    for p in map(Path, paths):
+        if p.is_dir():
+            found = p.rglob("*") if recursive else p.glob("*")
+            files += [q for q in found if q.is_file() and q.suffix.lower() in SUPPORTED_EXTENSIONS]
+        elif p.is_file():
+            files.append(p)
+        else:
+            raise FileNotFoundError(f"Input not found: {p}")
+
+    return sorted({str(f.resolve()) for f in files})
+
+
+def load_mapping(path: Optional[str]) -> dict:
+    if not path:
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        mapping = json.load(f)
+    if not isinstance(mapping, dict):
+        raise ValueError("Mapping file must contain a JSON object.")
+    return mapping
+
+
+def resolve_rule(file_path: str, mapping: dict) -> dict:
+    """
+    Default rule updated with the first matching "files" entry (exact name, then glob).
+    """
+    rule = {"sheet": None, "time": {"mode": "auto"}}
+    rule.update(mapping.get("default") or {})
+
+    name = os.path.basename(file_path)
+    files = mapping.get("files") or {}
+    match = files.get(name)
+    if match is None:
+        match = next((r for pat, r in files.items() if fnmatch.fnmatch(name, pat)), None)
+
+    if match:
+        rule.update(match)
+    return rule
+
+
+def resolve_sheet(file_path: str, rule: dict):
+    """
+    Sheet from the rule; otherwise the only sheet. Never asks interactively.
+    """
+    reader = DataReader(file_path)
+    if reader.file_extension not in (".xlsx", ".xls"):
+        return None
+    if rule.get("sheet") is not None:
+        return rule["sheet"]
+
+    sheet_names = reader.sheet_names()
+    if len(sheet_names) > 1:
+        raise ValueError(
+            f"Workbook has multiple sheets {sheet_names}; set 'sheet' for this file in the mapping file."
+        )
+    return None
+
+
+def resolve_output_names(files: List[str], mapping: dict) -> Dict[str, str]:
+    """
+    Output name per file: the rule's "output_name", else the file stem.
+
+    Names that more than one input would get (same stem in different folders,
+    or a glob rule with one "output_name") are made unique with the parent
+    folder name, then with an index, so no output overwrites another.
+    """
+    def base_name(f: str) -> str:
+        try:
+            return resolve_rule(f, mapping).get("output_name") or Path(f).stem
+        except Exception:
+            return Path(f).stem  # the rule error is reported by process_file
+
+    names = {f: base_name(f) for f in files}
+
+    groups: Dict[str, List[str]] = {}
+    for f, name in names.items():
+        groups.setdefault(name.lower(), []).append(f)
+    for group in groups.values():
+        if len(group) > 1:
+            for f in group:
+                names[f] = f"{Path(f).parent.name}_{names[f]}"
+
+    groups = {}
+    for f, name in names.items():
+        groups.setdefault(name.lower(), []).append(f)
+    for group in groups.values():
+        if len(group) > 1:
+            for i, f in enumerate(group, start=1):
+                names[f] = f"{names[f]}_{i}"
+    return names
+
+
+def resolve_time(time_rule: dict, candidates: List[str]) -> dict:
+    """
+    Turn a time rule into keyword arguments for `apply_time_preference`.
+    """
+    time_rule = dict(time_rule or {"mode": "auto"})
+    mode = time_rule.pop("mode", "auto")
+
+    # Column names in the table are normalized by HeaderDetector
+    cols = {k: HeaderDetector._norm(v) for k, v in time_rule.items() if k.endswith("_col")}
+
+    if mode != "auto":
+        if mode not in TIME_MODES:
+            raise ValueError(f"Unknown time mode {mode!r} in mapping; expected 'auto' or one of {TIME_MODES}.")
+        return {"mode": mode, **cols}
+
+    candidates = list(candidates or [])
+    if len(candidates) == 1:
+        return {"mode": "single", "datetime_col": candidates[0]}
+
+    if len(candidates) == 2:
+        dated = [c for c in candidates if any(k in str(c) for k in DATE_NAME_KEYS)]
+        date_col = dated[0] if len(dated) == 1 else candidates[0]
+        hour_col = candidates[1] if date_col == candidates[0] else candidates[0]
+        return {"mode": "date_hour", "date_col": date_col, "hour_col": hour_col}
+
+    raise ValueError(
+        f"Found {len(candidates)} time-related columns {candidates}; "
+        "set 'time' for this file in the mapping file."
+    )
+
+
+# ==============================================================================
+# One file (runs in a worker process)
+# ==============================================================================
+def process_file(
+    file_path: str,
+    mapping: dict,
+    fmt: str,
+    output_dir: str,
+    use_cache: bool,
+    csv_compression: Optional[str] = None,
+    compact: bool = False,
+    float32: bool = False,
+    arrow_strings: bool = False,
+    output_name: Optional[str] = None,
+    max_nat_rate: float = DEFAULT_MAX_NAT_RATE,
+) -> dict:
+    """
+    Run the whole chain for one file and save the result.
+    `output_name` overrides the rule / file-stem name (see resolve_output_names).
+    A file whose share of unparsed moments is above `max_nat_rate` fails and is not written.
+    Never raises: errors are reported in the returned summary.
+    """
+    t0 = time.perf_counter()
+    summary = {"file": file_path, "status": "error", "output": None, "rows": None, "error": None}
+    profiler = PipelineProfiler()
+
+    try:
+        rule = resolve_rule(file_path, mapping)
+        summary["sheet"] = sheet_name = resolve_sheet(file_path, rule)
+
+        cache = PipelineCache() if use_cache else None
+        results = run_automatic_pipeline(
+            file_path, cache=cache, sheet_name=sheet_name, profiler=profiler, arrow_strings=arrow_strings
+        )
+        summary["consumption_col"] = results["consumption_col"]
+        summary["consumption_unit"] = results.get("consumption_unit")
+
+        time_kwargs = resolve_time(rule.get("time"), results["time_candidates"])
+        summary["time"] = time_kwargs
+
+        table, nat_rate = apply_time_preference(
+            results["df_processed"], **time_kwargs, profiler=profiler, compact=compact, float32=float32
+        )
+        summary["nat_rate"] = round(nat_rate, 4)
+        if nat_rate > max_nat_rate:
+            raise ValueError(
+                f"{nat_rate:.1%} of the timestamps could not be parsed (allowed: {max_nat_rate:.1%}); "
+                "check the time columns for this file in the mapping file."
+            )
+
+        table = finalize_table(table, profiler=profiler)
+        if table.empty:
+            raise ValueError("Final table is empty.")
+
+        name = output_name or rule.get("output_name") or Path(file_path).stem
+        writer = TableWriter(output_dir_name=output_dir)
+        compression = csv_compression if fmt == "csv" else None
+        out_path = writer.save(table, name, fmt, index=False, compression=compression)
+
+        summary.update(status="ok", output=str(out_path), rows=len(table), write=writer.last_write_stats)
+    except Exception as e:
+        summary["error"] = f"{type(e).__name__}: {e}"
+
+    summary["stages"] = profiler.as_dicts()
+    summary["seconds"] = round(time.perf_counter() - t0, 3)
+    return summary
+
+
+def run_batch(
+    files: List[str],
+    mapping: dict,
+    *,
+    fmt: str,
+    output_dir: str,
+    workers: int,
+    use_cache: bool,
+    csv_compression: Optional[str] = None,
+    compact: bool = False,
+    float32: bool = False,
+    arrow_strings: bool = False,
+    max_nat_rate: float = DEFAULT_MAX_NAT_RATE,
+) -> List[dict]:
+    """
+    Process files across a process pool (inline for workers=1); results in input order.
+    A worker that dies (e.g. out of memory) fails only the files it leaves unfinished.
+    """
+    args = (mapping, fmt, output_dir, use_cache, csv_compression, compact, float32, arrow_strings)
+    kwargs = {"max_nat_rate": max_nat_rate}
+    names = resolve_output_names(files, mapping)
+    results = {}
+
+    if workers <= 1:
+        for f in files:
+            results[f] = process_file(f, *args, output_name=names[f], **kwargs)
+            _print_progress(results[f], len(results), len(files))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(process_file, f, *args, output_name=names[f], **kwargs): f for f in files}
+            for fut in as_completed(futures):
+                f = futures[fut]
+                try:
+                    results[f] = fut.result()
+                except Exception as e:
+                    results[f] = {
+                        "file": f,
+                        "status": "error",
+                        "output": None,
+                        "rows": None,
+                        "error": f"{type(e).__name__}: {e}",
+                        "stages": [],
+                        "seconds": None,
+                    }
+                _print_progress(results[f], len(results), len(files))
+
+    return [results[f] for f in files]
+
+
+def _print_progress(summary: dict, done: int, total: int) -> None:
+    detail = f"{summary['rows']} rows -> {summary['output']}" if summary["status"] == "ok" else summary["error"]
+    seconds = f"{summary['seconds']}s" if summary["seconds"] is not None else "-"
+    print(f"[{done}/{total}] {summary['status'].upper():5} {summary['file']} ({seconds}): {detail}", flush=True)
+
+
+# ==============================================================================
+# Entry point
+# ==============================================================================
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.cli",
+        description="Refine consumption tables in batch (no UI).",
+    )
+    parser.add_argument("inputs", nargs="*", help="Data files and/or directories (XLSX/XLS/CSV).")
+    parser.add_argument("--file-list", help="Text file with one input path per line.")
+    parser.add_argument("--recursive", action="store_true", help="Search directories recursively.")
+    parser.add_argument("--mapping", help="JSON mapping file with sheet / time rules per file.")
+    parser.add_argument("--format", dest="fmt", choices=list(FORMATS), default="xlsx", help="Output format.")
+    parser.add_argument(
+        "--csv-compression", choices=list(CSV_COMPRESSION_SUFFIX), help="Compress CSV output (.csv.gz / .csv.zst)."
+    )
+    parser.add_argument("--output-dir", default="PreparedTables", help="Output directory (relative to the project root).")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Number of worker processes.")
+    parser.add_argument("--cache", action="store_true", help="Reuse / store pipeline results in the local cache.")
+    parser.add_argument(
+        "--compact", action="store_true", help="Drop helper columns as soon as the moment column is built."
+    )
+    parser.add_argument(
+        "--float32",
+        action="store_true",
+        help="With --compact: store consumption as float32 when no meter resolution is lost.",
+    )
+    parser.add_argument(
+        "--arrow-strings", action="store_true", help="Keep text columns Arrow-backed (string[pyarrow]) while detecting."
+    )
+    parser.add_argument(
+        "--max-nat-rate",
+        type=float,
+        default=DEFAULT_MAX_NAT_RATE,
+        help="Fail a file when more than this share (0..1) of its timestamps cannot be parsed "
+        f"(default: {DEFAULT_MAX_NAT_RATE}).",
+    )
+    parser.add_argument("--summary-json", help="Write the per-file summary to this JSON file.")
+    parser.add_argument("--profile-jsonl", help="Append per-stage timing / memory records to this JSON-lines file.")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+
+    files = collect_inputs(args.inputs, args.file_list, args.recursive)
+    if not files:
+        print("No input files found.", file=sys.stderr)
+        return 2
+
+    mapping = load_mapping(args.mapping)
+    results = run_batch(
+        files,
+        mapping,
+        fmt=args.fmt,
+        output_dir=args.output_dir,
+        workers=max(1, min(args.workers, len(files))),
+        use_cache=args.cache,
+        csv_compression=args.csv_compression,
+        compact=args.compact or args.float32,
+        float32=args.float32,
+        arrow_strings=args.arrow_strings,
+        max_nat_rate=args.max_nat_rate,
+    )
+
+    n_ok = sum(r["status"] == "ok" for r in results)
+    print(f"\nDone: {n_ok} ok, {len(results) - n_ok} failed, {len(results)} total.")
+    for r in results:
+        if r["status"] != "ok":
+            print(f"  FAILED {r['file']}: {r['error']}")
+
+    if args.summary_json:
+        with open(args.summary_json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, default=str)
+
+    if args.profile_jsonl:
+        for r in results:
+            PipelineProfiler.write_jsonl(args.profile_jsonl, r.get("stages") or [], file=r["file"], status=r["status"])
+
+    return 0 if n_ok == len(results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
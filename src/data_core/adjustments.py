@@ -1,4 +1,65 @@
+from typing import Optional, Tuple
+
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+from pandas.api.types import infer_dtype, is_object_dtype, is_string_dtype
+
+from .reader import ARROW_STRING
+
+
+# Inferred dtypes of object/string columns that may hold string cells
+_STR_INFERRED = ("string", "mixed", "mixed-integer")
+
+
+def _blank_strings(arr: pa.Array) -> np.ndarray:
+    """
+    Mask of strings that are empty after stripping whitespace (nulls -> False).
+    """
+    blank = pc.equal(pc.utf8_length(pc.utf8_trim_whitespace(arr)), 0)
+    return blank.fill_null(False).to_numpy(zero_copy_only=False)
+
+
+def _cell_masks(table: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Build the (rows x columns) boolean masks of NaN cells and of "empty" cells.
+
+    A cell is empty if it is NaN OR a string that is empty after stripping.
+    Both masks come out of a single column-wise pass; the whitespace check
+    runs as an Arrow compute kernel on the str cells only. Non-str cells of
+    mixed columns are never blank, so they are not stringified.
+    """
+    nan_mask = np.zeros(table.shape, dtype=bool, order="F")
+    empty_mask = np.zeros(table.shape, dtype=bool, order="F")
+
+    for j in range(table.shape[1]):
+        col = table.iloc[:, j]
+        nan = col.isna().to_numpy(dtype=bool)
+        empty = nan
+
+        # Arrow-backed text: the kernels run on the column's own buffers
+        if col.dtype == ARROW_STRING:
+            empty = nan | _blank_strings(pa.array(col.array))
+
+        # Only object/string columns can hold whitespace-only strings
+        elif (is_object_dtype(col.dtype) or is_string_dtype(col.dtype)) and not nan.all():
+            inferred = infer_dtype(col, skipna=True)
+            if inferred == "string":
+                empty = nan | _blank_strings(pa.array(col, type=pa.string(), from_pandas=True))
+            elif inferred in _STR_INFERRED:
+                # Mixed columns (e.g. a header string above numbers): only the
+                # str cells can be blank, every other cell is non-empty as-is
+                values = col.to_numpy(dtype=object)
+                is_str = np.fromiter((isinstance(v, str) for v in values), dtype=bool, count=len(values))
+                if is_str.any():
+                    empty = nan.copy()
+                    empty[is_str] = _blank_strings(pa.array(values[is_str], type=pa.string()))
+
+        nan_mask[:, j] = nan
+        empty_mask[:, j] = empty
+
+    return nan_mask, empty_mask
 
 
 class TableRefiner:
@@ -6,26 +67,101 @@ class TableRefiner:
         self.table = table
         self.columns = list(table.columns)
 
+        # Cached NaN / empty-cell masks, shared between the row and column passes.
+        # Every method that reassigns or edits `self.table` must call
+        # `_invalidate_masks` (or, like `_take`, keep the masks aligned);
+        # `_mask_table` additionally guards against the table being replaced.
+        # In-place edits of `refiner.table` from outside are not tracked.
+        self._nan_mask: Optional[np.ndarray] = None
+        self._empty_mask: Optional[np.ndarray] = None
+        self._mask_table: Optional[pd.DataFrame] = None
+
+    def _invalidate_masks(self) -> None:
+        self._nan_mask = self._empty_mask = self._mask_table = None
+
+    def _get_masks(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Return the (NaN, empty) cell masks for the current table (computed once per table).
+        """
+        if self._empty_mask is None or self._mask_table is not self.table:
+            self._nan_mask, self._empty_mask = _cell_masks(self.table)
+            self._mask_table = self.table
+        return self._nan_mask, self._empty_mask
+
+    def _take(self, rows=None, cols=None) -> pd.DataFrame:
+        """
+        Positionally select rows/columns (integer positions, None = all) with a
+        single copy, and keep the cached masks aligned with the new table.
+        """
+        has_masks = self._empty_mask is not None and self._mask_table is self.table
+        n_rows, n_cols = self.table.shape
+
+        rows = np.arange(n_rows) if rows is None else rows
+        cols = np.arange(n_cols) if cols is None else cols
+
+        # Integer take (never a view); shallow copy drops the parent reference
+        # so later column assignments do not raise SettingWithCopyWarning.
+        self.table = self.table.iloc[rows, cols].copy(deep=False)
+
+        if has_masks:
+            self._nan_mask = self._nan_mask[np.ix_(rows, cols)]
+            self._empty_mask = self._empty_mask[np.ix_(rows, cols)]
+            self._mask_table = self.table
+        else:
+            self._invalidate_masks()
+
+        self.columns = list(self.table.columns)
+        return self.table
+
+    def rebase_after_header(self, table: pd.DataFrame, header_row: int) -> "TableRefiner":
+        """
+        Return a refiner for the table produced by ``HeaderDetector.apply_header``
+        on this refiner's table, reusing the cell masks already computed here.
+
+        `apply_header` keeps every column and only removes the rows up to and
+        including `header_row`, so the data-row masks are still valid; the
+        following `clean_table` only re-evaluates which rows/columns became
+        empty, without scanning any cell again.
+        """
+        refiner = TableRefiner(table)
+
+        nan_mask, empty_mask = self._get_masks()
+        below = slice(header_row + 1, None)
+        if empty_mask[below].shape == table.shape:
+            refiner._nan_mask = nan_mask[below]
+            refiner._empty_mask = empty_mask[below]
+            refiner._mask_table = table
+
+        return refiner
+
     def clean_table(self) -> pd.DataFrame:
         """
         Remove columns/rows that are entirely empty (NaN),
         also treat empty/whitespace-only strings as empty,
         and trim trailing empty rows at the bottom.
+
+        Fused: the cell masks are computed in one pass, the rows/columns to
+        keep are derived from them, and the table is sliced once.
+        The table is returned as-is when nothing has to be dropped.
         """
-        # Drop columns that are completely NaN
-        self.table = self.table.dropna(axis=1, how="all")
+        nan_mask, empty_mask = self._get_masks()
 
-        # Drop columns that are empty strings / whitespace-only in every cell
-        self.drop_empty_columns()
+        # Columns that are empty (NaN or empty/whitespace-only strings) in every cell
+        keep_cols = ~empty_mask.all(axis=0)
 
-        # Drop rows that are completely NaN
-        self.table = self.table.dropna(axis=0, how="all")
+        # Rows that are completely NaN (within the kept columns)
+        keep_rows = ~nan_mask[:, keep_cols].all(axis=1)
 
         # Trim trailing empty rows at bottom (incl. empty strings)
-        self.drop_trailing_empty_rows()
+        non_empty_rows = (keep_rows & ~empty_mask[:, keep_cols].all(axis=1)).nonzero()[0]
+        last_keep_pos = non_empty_rows[-1] if len(non_empty_rows) else -1
+        keep_rows[last_keep_pos + 1 :] = False
 
-        self.columns = list(self.table.columns)
-        return self.table
+        if keep_rows.all() and keep_cols.all():
+            self.columns = list(self.table.columns)
+            return self.table
+
+        return self._take(rows=keep_rows.nonzero()[0], cols=keep_cols.nonzero()[0])
 
     def keep_only_moment_and_consumption(
         self,
@@ -38,34 +174,89 @@ class TableRefiner:
             raise KeyError(f"Missing required columns: {missing}")
 
         self.table = self.table[[moment_col, consumption_col]].copy()
+        self._invalidate_masks()
         self.columns = list(self.table.columns)
         return self.table
 
+    # ==========================================================================
+    # Compact mode
+    # ==========================================================================
+    @staticmethod
+    def memory_bytes(table: pd.DataFrame) -> int:
+        """
+        Memory used by a table, including the Python objects in object columns.
+        """
+        return int(table.memory_usage(index=True, deep=True).sum())
+
+    @staticmethod
+    def meter_decimals(values: np.ndarray, max_decimals: int = 6) -> Optional[int]:
+        """
+        Smallest number of decimals (0..max_decimals) that every finite value has,
+        i.e. the meter resolution; None if the values are finer than that.
+        """
+        finite = values[np.isfinite(values)]
+        tol = 1e-9 * np.maximum(1.0, np.abs(finite))
+        for d in range(max_decimals + 1):
+            if np.all(np.abs(np.round(finite, d) - finite) <= tol):
+                return d
+        return None
+
+    def compact_dtypes(self, *, consumption_col: str = "consumption_kwh", float32: bool = False) -> dict:
+        """
+        Optionally store the consumption column as float32.
+
+        The downcast is refused (column stays float64) unless every value still
+        rounds to the same number at the meter resolution (see `meter_decimals`).
+        Returns a report: {"float32", "decimals", "reason", "bytes_before", "bytes_after"}.
+        """
+        if consumption_col not in self.table.columns:
+            raise KeyError(f"Missing required column: {consumption_col}")
+
+        report = {
+            "float32": False,
+            "decimals": None,
+            "reason": None,
+            "bytes_before": self.memory_bytes(self.table),
+        }
+
+        values = self.table[consumption_col].to_numpy(dtype="float64")
+        if float32:
+            decimals = self.meter_decimals(values)
+            report["decimals"] = decimals
+
+            if decimals is None:
+                report["reason"] = "no fixed meter resolution (more than 6 decimals)"
+            else:
+                with np.errstate(over="ignore", invalid="ignore"):
+                    narrow = values.astype("float32")
+                    same = np.round(narrow.astype("float64"), decimals) == np.round(values, decimals)
+                lossless = np.all(same | (np.isnan(values) & np.isnan(narrow)))
+                if lossless:
+                    self.table[consumption_col] = pd.Series(narrow, index=self.table.index)
+                    self._invalidate_masks()
+                    report["float32"] = True
+                else:
+                    report["reason"] = f"float32 cannot hold {decimals}-decimal values of this magnitude"
+
+        report["bytes_after"] = self.memory_bytes(self.table)
+        return report
+
     def drop_trailing_empty_rows(self) -> pd.DataFrame:
         if self.table.empty:
             return self.table
 
-        def _cell_is_empty(x) -> bool:
-            if pd.isna(x):
-                return True
-            if isinstance(x, str) and x.strip() == "":
-                return True
-            return False
-
-        empty_row_mask = self.table.applymap(_cell_is_empty).all(axis=1)
+        _, empty_mask = self._get_masks()
+        empty_row_mask = empty_mask.all(axis=1)
 
         if not empty_row_mask.any():
             return self.table
 
-        non_empty_positions = (~empty_row_mask).to_numpy().nonzero()[0]
+        non_empty_positions = (~empty_row_mask).nonzero()[0]
         if len(non_empty_positions) == 0:
-            self.table = self.table.iloc[0:0].copy()
-        else:
-            last_keep_pos = non_empty_positions[-1]
-            self.table = self.table.iloc[: last_keep_pos + 1].copy()
+            return self._take(rows=np.arange(0))
 
-        self.columns = list(self.table.columns)
-        return self.table
+        last_keep_pos = non_empty_positions[-1]
+        return self._take(rows=np.arange(last_keep_pos + 1))
 
     def drop_empty_columns(self) -> pd.DataFrame:
         """
@@ -76,16 +267,10 @@ class TableRefiner:
         if self.table.empty:
             return self.table
 
-        def _cell_is_empty(x) -> bool:
-            if pd.isna(x):
-                return True
-            if isinstance(x, str) and x.strip() == "":
-                return True
-            return False
-
-        empty_col_mask = self.table.applymap(_cell_is_empty).all(axis=0)
+        _, empty_mask = self._get_masks()
+        empty_col_mask = empty_mask.all(axis=0)
         if empty_col_mask.any():
-            self.table = self.table.loc[:, ~empty_col_mask].copy()
+            self._take(cols=(~empty_col_mask).nonzero()[0])
 
         self.columns = list(self.table.columns)
         return self.table
@@ -129,6 +314,7 @@ class TableRefiner:
         # Apply rule
         if int(first_val.minute) == 15 and int(last_val.minute) == 0:
             self.table[moment_col] = s - pd.Timedelta(minutes=15)
+            self._invalidate_masks()
 
         self.columns = list(self.table.columns)
         return self.table
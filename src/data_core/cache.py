@@ -0,0 +1,270 @@
+# src/data_core/cache.py
+from __future__ import annotations
+
+import datetime
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from pandas.api.types import infer_dtype, is_object_dtype
+
+from .reader import ARROW_STRING
+from .writer import TableWriter
+
+
+# Bump when the pipeline output changes, so older entries are not reused
+CACHE_VERSION = 3
+
+# Tables stored in an entry (besides meta.json)
+_TABLES = ("df_raw", "df_processed")
+
+# Cell types of mixed object columns (code = position; 0 = missing) and their storage
+_KINDS = ("missing", "str", "int", "float", "bool", "datetime", "time")
+_KIND_OF_TYPE = {
+    str: 1, int: 2, np.int64: 2, float: 3, np.float64: 3, bool: 4, np.bool_: 4,
+    datetime.datetime: 5, pd.Timestamp: 5, datetime.time: 6,
+}
+_KIND_TYPE = {
+    "str": pa.large_string(), "int": pa.int64(), "float": pa.float64(), "bool": pa.bool_(),
+    "datetime": pa.timestamp("us"), "time": pa.time64("us"),
+}
+_KIND_PLACEHOLDER = {
+    "str": "", "int": 0, "float": 0.0, "bool": False,
+    "datetime": datetime.datetime(1970, 1, 1), "time": datetime.time(0),
+}
+
+
+@dataclass
+class PipelineCache:
+    """
+    Local on-disk cache for `run_automatic_pipeline` results.
+
+    - Key: hash of the file bytes + sheet name (+ CACHE_VERSION).
+    - One directory per entry in <project_root>/<cache_dir_name>:
+        df_raw / df_processed as Parquet (columns stored by position, labels
+        in meta.json; mixed-type object columns split by cell type), everything
+        else in meta.json. Entries hold data only (no pickle), so a writable
+        cache directory cannot inject code.
+    - Total size is capped at `max_bytes`; least recently used entries
+      are evicted first (an entry's mtime is refreshed on every hit).
+    """
+    cache_dir_name: str = ".pipeline_cache"
+    max_bytes: int = 512 * 1024 * 1024
+
+    def __post_init__(self):
+        here = Path(__file__).resolve()
+        project_root = TableWriter._find_project_root(here.parent)
+        self.cache_dir = project_root / self.cache_dir_name
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    # ==========================================================================
+    # Keys
+    # ==========================================================================
+    @staticmethod
+    def file_key(file_path: str, sheet_name=None, chunk_size: int = 1 << 20, variant: Optional[str] = None) -> str:
+        """
+        Content hash of the file bytes + sheet name (never the path or mtime).
+        `variant` separates results of the same file read with other options.
+        """
+        h = hashlib.blake2b(digest_size=20)
+        with open(file_path, "rb") as f:
+            for chunk in iter(lambda: f.read(chunk_size), b""):
+                h.update(chunk)
+
+        h.update(f"|sheet={sheet_name!r}|v={CACHE_VERSION}".encode())
+        if variant is not None:
+            h.update(f"|variant={variant}".encode())
+        return h.hexdigest()
+
+    # ==========================================================================
+    # Tables
+    # ==========================================================================
+    @staticmethod
+    def _cell_kind(v) -> int:
+        if v is None or v is pd.NaT or (isinstance(v, float) and v != v):
+            return 0
+        kind = _KIND_OF_TYPE.get(type(v))
+        if kind is None or (kind == _KINDS.index("datetime") and v.tzinfo is not None):
+            raise TypeError(f"Cannot cache cells of type {type(v).__name__}.")
+        return kind
+
+    @classmethod
+    def _encode_mixed(cls, values: np.ndarray) -> dict:
+        """
+        Object column with mixed cells -> {"kind": int8 codes, <kind>: typed column}:
+        one Arrow column per cell type, null where the cell has another type.
+        """
+        kinds = np.fromiter((cls._cell_kind(v) for v in values), dtype=np.int8, count=len(values))
+        parts = {"kind": pa.array(kinds)}
+        for k in np.unique(kinds):
+            if k == 0:
+                continue
+            name = _KINDS[k]
+            other = kinds != k
+            filled = values.copy()
+            filled[other] = _KIND_PLACEHOLDER[name]
+            parts[name] = pa.array(filled, type=_KIND_TYPE[name], mask=other)
+        return parts
+
+    @staticmethod
+    def _decode_mixed(parts: dict) -> np.ndarray:
+        kinds = parts["kind"].to_numpy()
+        out = np.full(len(kinds), np.nan, dtype=object)
+        for name, arr in parts.items():
+            if name != "kind":
+                mask = kinds == _KINDS.index(name)
+                out[mask] = arr.filter(pa.array(mask)).to_pylist()
+        return out
+
+    @classmethod
+    def _write_table(cls, table: pd.DataFrame, path: Path) -> dict:
+        """
+        Store `table` as Parquet under positional column names ("c0", "c1", ...).
+        Object columns with mixed cell types (e.g. raw Excel: header text above
+        numbers) go to <name>.mixed.parquet, split by cell type. Returns the
+        layout for meta.json: original column labels and the mixed columns.
+        """
+        labels = []
+        for c in table.columns:
+            if isinstance(c, (np.integer, np.str_)):
+                c = c.item()
+            if type(c) not in (str, int):
+                raise TypeError(f"Cannot cache column label {c!r}.")
+            labels.append(c)
+
+        plain, mixed = {}, {}
+        for j in range(table.shape[1]):
+            col = table.iloc[:, j]
+            if is_object_dtype(col.dtype) and infer_dtype(col, skipna=True) not in ("string", "empty"):
+                for part, arr in cls._encode_mixed(col.to_numpy()).items():
+                    mixed[f"c{j}.{part}"] = arr
+            else:
+                plain[f"c{j}"] = col.to_numpy() if is_object_dtype(col.dtype) else col.array
+
+        pd.DataFrame(plain, index=table.index).to_parquet(path.with_suffix(".parquet"), index=True)
+        if mixed:
+            pq.write_table(pa.table(mixed), path.with_suffix(".mixed.parquet"))
+
+        return {"columns": labels, "mixed": sorted({int(k.split(".")[0][1:]) for k in mixed})}
+
+    @classmethod
+    def _read_table(cls, path: Path, layout: dict) -> pd.DataFrame:
+        stored = pd.read_parquet(path.with_suffix(".parquet"))
+
+        mixed_parts = {}
+        if layout["mixed"]:
+            mixed_table = pq.read_table(path.with_suffix(".mixed.parquet"))
+            for name, arr in zip(mixed_table.column_names, mixed_table.columns):
+                j, part = name.split(".", 1)
+                mixed_parts.setdefault(int(j[1:]), {})[part] = arr
+
+        columns = {}
+        for j in range(len(layout["columns"])):
+            if j in mixed_parts:
+                columns[j] = cls._decode_mixed(mixed_parts[j])
+                continue
+
+            col = stored[f"c{j}"]
+            # Parquet nulls come back as None in object columns; the pipeline uses NaN.
+            # String columns come back Python-backed; the pipeline only writes Arrow-backed ones.
+            if is_object_dtype(col.dtype):
+                col = col.where(col.notna(), np.nan)
+            elif isinstance(col.dtype, pd.StringDtype) and col.dtype != ARROW_STRING:
+                col = col.astype(ARROW_STRING)
+            columns[j] = col.to_numpy() if is_object_dtype(col.dtype) else col.array
+
+        table = pd.DataFrame(columns, index=stored.index)
+        table.columns = pd.Index(layout["columns"]) if layout["columns"] else pd.Index([], dtype=object)
+        return table
+
+    # ==========================================================================
+    # Public API
+    # ==========================================================================
+    def get(self, key: str) -> Optional[dict]:
+        """
+        Return the cached pipeline result for `key`, or None on a miss
+        (an unreadable entry counts as a miss; the next `put` replaces it).
+        """
+        entry = self.cache_dir / key
+        if not (entry / "meta.json").exists():
+            return None
+
+        try:
+            with open(entry / "meta.json", "r", encoding="utf-8") as f:
+                result = json.load(f)
+            layouts = result.pop("_tables")
+            for name in _TABLES:
+                result[name] = self._read_table(entry / name, layouts[name])
+        except Exception:
+            return None
+
+        # JSON has no tuples: shapes come back as lists
+        summary = result.get("summary") or {}
+        for k, v in summary.items():
+            if k.endswith("_shape") and isinstance(v, list):
+                summary[k] = tuple(v)
+
+        now = time.time()
+        try:
+            os.utime(entry, (now, now))
+        except OSError:
+            pass  # replaced / evicted meanwhile
+        return result
+
+    def put(self, key: str, result: dict) -> None:
+        """
+        Store a pipeline result and evict least recently used entries above `max_bytes`.
+
+        The entry is written to a private temp dir; an existing entry is renamed
+        aside before the new one is renamed into place, so readers never see a
+        half-written or half-deleted entry. Raises TypeError for tables that
+        cannot be stored (nothing is cached then).
+        """
+        entry = self.cache_dir / key
+        tmp = Path(tempfile.mkdtemp(dir=self.cache_dir, prefix=f".{key}.", suffix=".tmp"))
+        old = self.cache_dir / f".{key}.{uuid.uuid4().hex}.old"
+
+        try:
+            meta = {k: v for k, v in result.items() if k not in _TABLES}
+            meta["_tables"] = {name: self._write_table(result[name], tmp / name) for name in _TABLES}
+            with open(tmp / "meta.json", "w", encoding="utf-8") as f:
+                json.dump(meta, f, default=str)
+
+            try:
+                os.replace(entry, old)
+            except FileNotFoundError:
+                pass
+            try:
+                os.replace(tmp, entry)
+            except OSError:
+                pass  # another put installed the same entry in between
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+            shutil.rmtree(old, ignore_errors=True)
+
+        self._evict()
+
+    def _evict(self) -> None:
+        entries = []
+        for p in self.cache_dir.iterdir():
+            if p.is_dir() and not p.name.startswith("."):
+                size = sum(f.stat().st_size for f in p.iterdir() if f.is_file())
+                entries.append((p.stat().st_mtime, size, p))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, p in sorted(entries, key=lambda e: e[0]):
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(p, ignore_errors=True)
+            total -= size
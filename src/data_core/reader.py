@@ -1,6 +1,59 @@
 import pandas as pd
+import numpy as np
 import os
+import io
+import re
 import csv
+import codecs
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+from pandas.api.types import infer_dtype, is_object_dtype
+
+
+# Candidate CSV encodings, in order of preference (latin1 decodes any byte sequence)
+CSV_ENCODINGS = ["utf-8-sig", "utf-8", "cp1252", "latin1"]
+
+# Candidate CSV delimiters (all single ASCII bytes, so they can be found in raw bytes)
+CSV_DELIMITERS = [",", ";", "\t", "|"]
+
+# pandas' default NA strings (read_csv keep_default_na=True), reused for the Arrow reader
+CSV_NA_VALUES = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan",
+    "1.#IND", "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None",
+    "n/a", "nan", "null",
+]
+
+# Arrow-backed text dtype for DataReader(arrow_strings=True)
+ARROW_STRING = pd.StringDtype("pyarrow")
+
+# Values pandas may read as numbers (superset; pd.to_numeric decides).
+# Used to skip the numeric attempt for text columns without creating Python strings.
+_NUMBER_LIKE = r"^\s*[+-]?(?:(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?|(?i:inf|infinity|nan))\s*$"
+
+# Cells that may be a number with "." / "," separators (number-format detection sample)
+_SEPARATED_NUMBER = re.compile(r"[+-]?\d[\d.,]*")
+
+# Sample size (cells) for number-format detection
+NUMBER_FORMAT_SAMPLE_CELLS = 5000
+
+# Sheet-picker previews, keyed by (path, mtime, size, sheet, n_rows); small LRU
+_PREVIEW_CACHE: "OrderedDict[tuple, tuple]" = OrderedDict()
+_PREVIEW_CACHE_SIZE = 16
+_PREVIEW_CACHE_LOCK = threading.Lock()  # Streamlit runs sessions in concurrent threads
+
+# Worksheet XML: <row> start tags, and the wrapper for a parsed tail fragment
+_XLSX_ROW_TAG = re.compile(rb"<row[ >]")
+_XLSX_FRAGMENT_HEAD = b'<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+_XLSX_FRAGMENT_TAIL = b"</sheetData></worksheet>"
+
+# One CSV record: quoted fields may contain newlines / delimiters
+_CSV_RECORD = re.compile(rb'(?:"[^"]*"|[^"\n])*\n')
+_CSV_QUOTED = re.compile(rb'"[^"]*"')
 
 
 class DataReader:
@@ -9,54 +62,747 @@ class DataReader:
     detect its format, and return a Pandas DataFrame.
     CSV support added with automatic separator detection.
 
+    CSV files are scanned as raw bytes to find the delimiter and the start of
+    the tabular block (skipping metadata preambles), and the block is parsed
+    with pyarrow's multithreaded CSV reader; pandas' python engine is only the
+    fallback.
+
     NEW:
     - If an Excel file contains multiple sheets and we're running inside Streamlit,
       it will ask the user to pick a sheet, preview first/last 20 rows, and require
       confirmation before continuing.
     - If not running in Streamlit, it will raise a ValueError asking for sheet_name.
+
+    .xlsx sheets are streamed with openpyxl (read-only, values only) in chunks of
+    `excel_chunk_rows` rows, so memory stays bounded while reading; the result is
+    the same DataFrame as pd.read_excel(header=None). `iter_excel_chunks` gives
+    the chunks themselves. Set `stream_excel=False` to use pd.read_excel.
+
+    With `arrow_strings=True`, text columns are Arrow-backed `string[pyarrow]`
+    (missing cells are <NA>) instead of object columns of Python strings: CSV
+    text goes from the Arrow reader into the table without Python objects, and
+    Excel columns that hold only text are converted after reading (columns that
+    mix text and numbers stay object).
     """
 
-    def __init__(self, file_path, sheet_name=None):
+    def __init__(
+        self,
+        file_path,
+        sheet_name=None,
+        stream_excel: bool = True,
+        excel_chunk_rows: int = 50_000,
+        arrow_strings: bool = False,
+    ):
         self.file_path = file_path
         self.file_extension = os.path.splitext(file_path)[1].lower()
         self.sheet_name = sheet_name  # str/int/None
         self.table = None
 
-    def _detect_csv_separator(self, sample_bytes: int = 65536) -> str:
+        self.stream_excel = stream_excel
+        self.excel_chunk_rows = excel_chunk_rows
+        self.arrow_strings = arrow_strings
+
+        # CSV only: detected text encoding and detection confidence (0..1)
+        self.encoding = None
+        self.encoding_confidence = None
+
+        # Detected number format of text cells: decimal mark and thousands separator (or None)
+        self.decimal = "."
+        self.thousands = None
+
+    def _detect_encoding(self, data: bytes, sample_bytes: int = 1 << 20) -> str:
         """
-        Detect CSV delimiter by sampling the file content.
-        Tries csv.Sniffer first; falls back to common delimiters.
+        Detect the text encoding once, from a bounded sample of the raw bytes.
+
+        The first candidate of CSV_ENCODINGS that strictly decodes the sample wins
+        (incremental decoding, so a multi-byte character cut at the sample border
+        is not an error). The confidence is 1.0 for BOM / UTF-8 and comes from
+        charset-normalizer's chaos measure for the single-byte fallbacks.
+        Stores the result in `self.encoding` / `self.encoding_confidence`.
         """
-        encodings_to_try = ["utf-8-sig", "utf-8", "cp1252", "latin1"]
+        sample = data[:sample_bytes]
+        final = len(data) <= sample_bytes
 
-        for enc in encodings_to_try:
+        for enc in CSV_ENCODINGS:
+            if enc == "utf-8-sig" and not sample.startswith(codecs.BOM_UTF8):
+                continue
             try:
-                with open(self.file_path, "r", encoding=enc, newline="") as f:
-                    sample = f.read(sample_bytes)
-
-                if not sample.strip():
-                    return ","
+                codecs.getincrementaldecoder(enc)(errors="strict").decode(sample, final=final)
+            except UnicodeDecodeError:
+                continue
 
+            confidence = 1.0
+            if enc not in ("utf-8-sig", "utf-8"):
                 try:
-                    dialect = csv.Sniffer().sniff(sample, delimiters=[",", ";", "\t", "|"])
-                    return dialect.delimiter
+                    from charset_normalizer import from_bytes
+
+                    match = from_bytes(sample, cp_isolation=[enc]).best()
+                    confidence = round(1.0 - match.chaos, 3) if match is not None else 0.0
                 except Exception:
-                    candidates = [",", ";", "\t", "|"]
-                    counts = {d: sample.count(d) for d in candidates}
-                    best = max(counts, key=counts.get)
-                    return best if counts[best] > 0 else ","
-            except Exception:
+                    confidence = None
+
+            self.encoding, self.encoding_confidence = enc, confidence
+            return enc
+
+        # Not reachable (latin1 accepts any byte); kept for safety
+        self.encoding, self.encoding_confidence = "latin1", 0.0
+        return self.encoding
+
+    def _scan_csv_layout(self, data: bytes, sample_bytes: int = 65536):
+        """
+        Raw-bytes scan of the first `sample_bytes` of a CSV file.
+
+        Metadata preambles ("Meter: 123", "Exported at ...") usually have a
+        different number of fields than the table below them. For every
+        candidate delimiter the sampled records are counted (quote-aware) and
+        the tabular block is the trailing run of records that all have the same
+        number of delimiters. The delimiter with the longest block wins.
+
+        Returns:
+            (sep, body_offset, n_fields) where body_offset is the byte offset at
+            which the tabular block starts and n_fields its number of fields,
+            or None if no delimiter gives a block.
+        """
+        sample = data[:sample_bytes]
+        if len(data) > sample_bytes:
+            # Only complete records are used (the last one may be cut off)
+            sample = sample[: sample.rfind(b"\n") + 1]
+        elif not sample.endswith(b"\n"):
+            sample = sample + b"\n"
+
+        records = []  # (start offset, unquoted content) of non-blank records
+        for m in _CSV_RECORD.finditer(sample):
+            content = _CSV_QUOTED.sub(b"", m.group()).rstrip(b"\r\n")
+            if m.group().strip():
+                records.append((m.start(), content))
+
+        if not records:
+            return None
+
+        best = None  # (block length, fields, sep, body_offset)
+        for sep in CSV_DELIMITERS:
+            counts = [content.count(sep.encode()) for _, content in records]
+            target = counts[-1]
+            if target == 0:
+                continue
+
+            start = len(counts) - 1
+            while start > 0 and counts[start - 1] == target:
+                start -= 1
+
+            cand = (len(counts) - start, target, sep, records[start][0])
+            if best is None or cand[:2] > best[:2]:
+                best = cand
+
+        if best is None:
+            return None
+        return best[2], best[3], best[1] + 1
+
+    @staticmethod
+    def _detect_number_format(columns, sep: Optional[str] = None):
+        """
+        Decimal mark and thousands separator of the number-like text cells in a sample
+        (`columns`: one list of cells per column; `sep`: the CSV delimiter, if any).
+
+        Cells with both "." and "," (e.g. "1.234,56"), grouped digits ("1,234,567")
+        and a single separator not followed by exactly three digits ("0,5", "12.25",
+        "0,125") are evidence. "12,345" / "1.500" could be either a decimal or a
+        thousands separator and are no evidence on their own. When the sample has
+        no other evidence, "12,345" cells are read as decimal commas if the file
+        context says so: a ";" delimiter (the decimal-comma convention), or a
+        column that has no "." anywhere. Otherwise the default (".", no thousands)
+        is kept, so such cells stay text instead of risking a factor-1000 error.
+
+        Returns:
+            (decimal, thousands) with decimal "." or "," and thousands "." / "," / None.
+        """
+        votes = {".": 0, ",": 0}  # decimal-mark evidence
+        grouped = {".": 0, ",": 0}  # thousands-separator evidence
+        ambiguous_comma = False  # "12,345" cells in a column without any "."
+
+        for cells in columns:
+            column_comma = column_dot = False
+            for cell in cells:
+                cell = cell.strip()
+                if not _SEPARATED_NUMBER.fullmatch(cell):
+                    continue
+                digits = cell.lstrip("+-")
+                has_dot, has_comma = "." in digits, "," in digits
+                column_dot |= has_dot
+
+                if has_dot and has_comma:
+                    dec = "," if digits.rfind(",") > digits.rfind(".") else "."
+                    other = "." if dec == "," else ","
+                    if re.fullmatch(rf"\d{{1,3}}(?:{re.escape(other)}\d{{3}})+{re.escape(dec)}\d+", digits):
+                        votes[dec] += 1
+                        grouped[other] += 1
+                elif has_dot or has_comma:
+                    mark = "." if has_dot else ","
+                    groups = digits.split(mark)
+                    if len(groups) > 2:
+                        # Several marks: thousands grouping ("1.234.567"), or not a number (dates)
+                        if len(groups[0]) <= 3 and all(len(g) == 3 for g in groups[1:]):
+                            grouped[mark] += 1
+                    elif len(groups[1]) != 3 or len(groups[0]) > 3 or groups[0].startswith("0"):
+                        votes[mark] += 1
+                    elif mark == ",":
+                        column_comma = True
+
+            ambiguous_comma |= column_comma and (sep == ";" or not column_dot)
+
+        if not any(votes.values()) and not any(grouped.values()) and ambiguous_comma:
+            return ",", None
+
+        decimal = "," if votes[","] > votes["."] else "."
+        other = "." if decimal == "," else ","
+        thousands = other if grouped[other] > 0 and grouped[other] >= grouped[decimal] else None
+        return decimal, thousands
+
+    @staticmethod
+    def _number_pattern(decimal: str, thousands: Optional[str]) -> str:
+        """
+        Regex for numbers written with `decimal` / `thousands` ("1.234,5", "-12,5", "7").
+        """
+        whole = r"\d+"
+        if thousands:
+            whole = rf"\d{{1,3}}(?:{re.escape(thousands)}\d{{3}})+|\d+"
+        return rf"^[+-]?(?:{whole})(?:{re.escape(decimal)}\d+)?$"
+
+    def _plain_numbers(self, arr):
+        """
+        (is_number, plain) for a string Arrow array: which cells are numbers in the
+        detected format, and the trimmed text with "1.234,5" written as "1234.5".
+        """
+        txt = pc.utf8_trim_whitespace(arr)
+        is_number = pc.fill_null(pc.match_substring_regex(txt, self._number_pattern(self.decimal, self.thousands)), False)
+
+        plain = txt
+        if self.thousands:
+            plain = pc.replace_substring(plain, self.thousands, "")
+        if self.decimal != ".":
+            plain = pc.replace_substring(plain, self.decimal, ".")
+        return is_number, plain
+
+    def _normalize_numbers(self, arr):
+        """
+        Rewrite number-like text cells of a string Arrow array in the detected format
+        ("1.234,5") as plain numbers ("1234.5"); other cells are unchanged.
+        """
+        if self.decimal == "." and self.thousands is None:
+            return arr
+
+        is_number, plain = self._plain_numbers(arr)
+        if not pc.any(is_number).as_py():
+            return arr
+        return pc.if_else(is_number, plain, arr)
+
+    @staticmethod
+    def _csv_sample_columns(text: str, sep: str) -> list:
+        """
+        Cells of the complete CSV records in `text`, as one list per column
+        (at most NUMBER_FORMAT_SAMPLE_CELLS cells; for number-format detection).
+        """
+        columns, n_cells = [], 0
+        for row in csv.reader(io.StringIO(text[: text.rfind("\n") + 1] or text, newline=""), delimiter=sep):
+            columns.extend([] for _ in range(len(row) - len(columns)))
+            for j, cell in enumerate(row):
+                columns[j].append(cell)
+            n_cells += len(row)
+            if n_cells >= NUMBER_FORMAT_SAMPLE_CELLS:
+                break
+        return columns
+
+    def _sample_csv_columns(self, data: bytes, offset: int, sep: str, encoding: str, sample_bytes: int = 65536) -> list:
+        """
+        Text cells of the first records of the tabular block, per column (for number-format detection).
+        """
+        raw = data[offset : offset + sample_bytes]
+        text = codecs.getincrementaldecoder(encoding)(errors="replace").decode(raw)
+        return self._csv_sample_columns(text, sep)
+
+    def _convert_excel_text_numbers(self, table: pd.DataFrame, sample_rows: int = 1000) -> pd.DataFrame:
+        """
+        Excel cells formatted as text that hold numbers in a decimal-comma / thousands
+        format become floats.
+
+        The format is detected from the text cells of the first / last `sample_rows`
+        rows of each object column. Only cells written with a decimal / thousands
+        mark are converted, in columns whose sample holds such numbers (Arrow kernels
+        on their text cells); digit-only text such as IDs ("0012345") stays text.
+        With the default format the table is returned untouched.
+        """
+        samples = {}
+        for j in range(table.shape[1]):
+            col = table.iloc[:, j]
+            if is_object_dtype(col.dtype):
+                values = col.to_numpy()
+                head_tail = values if len(values) <= 2 * sample_rows else np.concatenate(
+                    [values[:sample_rows], values[-sample_rows:]]
+                )
+                texts = [v for v in head_tail if type(v) is str]
+                if texts:
+                    samples[j] = texts
+
+        columns, n_cells = [], 0
+        for texts in samples.values():
+            columns.append(texts[: NUMBER_FORMAT_SAMPLE_CELLS - n_cells])
+            n_cells += len(columns[-1])
+        self.decimal, self.thousands = self._detect_number_format(columns)
+        if self.decimal == "." and self.thousands is None:
+            return table
+
+        marks = [m for m in (self.decimal, self.thousands) if m]
+        pattern = re.compile(self._number_pattern(self.decimal, self.thousands))
+        for j, texts in samples.items():
+            if not any(pattern.match(v.strip()) and any(m in v for m in marks) for v in texts):
+                continue
+
+            values = table.iloc[:, j].to_numpy()
+            if infer_dtype(values, skipna=True) == "string":
+                is_text = pd.notna(values)
+            else:
+                is_text = np.fromiter((type(v) is str for v in values), dtype=bool, count=len(values))
+
+            text = pa.array(values[is_text], type=pa.large_string())
+            is_number, plain = self._plain_numbers(text)
+            has_mark = pc.match_substring_regex(text, "[" + "".join(re.escape(m) for m in marks) + "]")
+            is_number = pc.and_(is_number, has_mark)
+            numbers = pc.cast(plain.filter(is_number), pa.float64())
+            positions = np.flatnonzero(is_text)[is_number.to_numpy(zero_copy_only=False)]
+
+            converted = values.copy()
+            converted[positions] = numbers.to_numpy(zero_copy_only=False)
+            table.isetitem(j, pd.Series(converted, index=table.index, dtype=object))
+        return table
+
+    def _read_csv_body(self, data: bytes, offset: int, sep: str, n_fields, encoding: str) -> pd.DataFrame:
+        """
+        Parse the tabular block (data[offset:]) with pyarrow's multithreaded CSV
+        reader, every column as string. Falls back to pandas' python engine if
+        Arrow rejects the block (e.g. ragged rows further down the file) or the
+        number of fields is unknown.
+
+        The header row is part of the block, so columns cannot be typed by the
+        parser; numbers in the detected decimal-comma / thousands format are
+        rewritten as plain numbers here (Arrow kernels, same pass), and the
+        numeric conversion happens as for any other CSV.
+        """
+        buf = pa.py_buffer(data).slice(offset)
+        try:
+            if n_fields is None:
+                raise pa.ArrowInvalid("unknown number of fields")
+
+            table = pacsv.read_csv(
+                pa.BufferReader(buf),
+                read_options=pacsv.ReadOptions(
+                    use_threads=True,
+                    autogenerate_column_names=True,
+                    encoding="utf8" if encoding.replace("-", "").lower() in ("utf8", "utf8sig") else encoding,
+                ),
+                parse_options=pacsv.ParseOptions(
+                    delimiter=sep,
+                    # Newlines can only appear inside quoted values
+                    newlines_in_values=data.find(b'"', offset) != -1,
+                ),
+                convert_options=pacsv.ConvertOptions(
+                    # Everything is read as text; numeric columns are inferred afterwards
+                    column_types={f"f{j}": pa.string() for j in range(n_fields)},
+                    null_values=CSV_NA_VALUES,
+                    strings_can_be_null=True,
+                ),
+            )
+            cols = [self._normalize_numbers(col) for col in table.columns]
+            if self.arrow_strings:
+                columns = {j: ARROW_STRING.__from_arrow__(col) for j, col in enumerate(cols)}
+            else:
+                columns = {j: col.to_numpy(zero_copy_only=False) for j, col in enumerate(cols)}
+            return pd.DataFrame(columns, index=pd.RangeIndex(table.num_rows))
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError, UnicodeError, LookupError):
+            body = pd.read_csv(
+                io.BytesIO(data[offset:]),
+                sep=sep,
+                header=None,
+                dtype=str,
+                encoding=encoding,
+                engine="python",
+            )
+            if self.decimal != "." or self.thousands is not None:
+                for j in range(body.shape[1]):
+                    arr = self._normalize_numbers(pa.array(body[j], type=pa.large_string(), from_pandas=True))
+                    body[j] = arr.to_numpy(zero_copy_only=False)
+            return body
+
+    @staticmethod
+    def _arrow_text_column(preamble: list, body: Optional[pd.Series], n_body: int):
+        """
+        One CSV column (preamble cells + body) as string[pyarrow], or numeric when
+        every value is a number (same rule as the object path).
+        """
+        if body is None:
+            body_arr = pa.nulls(n_body, pa.large_string())
+        elif body.dtype == ARROW_STRING:
+            body_arr = pa.array(body.array)
+        else:
+            body_arr = pa.array(body, type=pa.large_string(), from_pandas=True)
+
+        chunks = [pa.array(preamble, type=pa.large_string())]
+        chunks += body_arr.chunks if isinstance(body_arr, pa.ChunkedArray) else [body_arr]
+        arr = pa.chunked_array(chunks, type=pa.large_string())
+
+        # Only columns that can be numeric are handed to pandas (as Python objects)
+        if arr.null_count == len(arr) or pc.all(pc.match_substring_regex(arr, _NUMBER_LIKE)).as_py():
+            try:
+                return pd.to_numeric(arr.to_numpy(zero_copy_only=False))
+            except (ValueError, TypeError):
+                pass
+
+        return ARROW_STRING.__from_arrow__(arr)
+
+    @staticmethod
+    def _arrow_string_columns(table: pd.DataFrame) -> pd.DataFrame:
+        """
+        Convert object columns that hold only strings (and missing cells) to string[pyarrow].
+        """
+        for j in range(table.shape[1]):
+            col = table.iloc[:, j]
+            if is_object_dtype(col.dtype) and infer_dtype(col, skipna=True) == "string":
+                table.isetitem(j, col.astype(ARROW_STRING))
+        return table
+
+    def _read_csv_fast(self, data: bytes, sep: str, offset: int, n_fields, encoding: str) -> pd.DataFrame:
+        """
+        Read a CSV from raw bytes: preamble records (before `offset`) with the csv
+        module, the tabular block with Arrow. Returns the same layout as
+        `pd.read_csv(header=None)`: preamble rows on top, padded with NaN, and
+        numeric columns converted to numbers.
+        """
+        preamble_text = data[:offset].decode(encoding)
+        preamble = [
+            [None if v in CSV_NA_VALUES else v for v in row]
+            for row in csv.reader(io.StringIO(preamble_text, newline=""), delimiter=sep)
+            if row
+        ]
+
+        body = self._read_csv_body(data, offset, sep, n_fields, encoding)
+
+        n_cols = max([body.shape[1]] + [len(row) for row in preamble])
+        n_pre = len(preamble)
+
+        columns = {}
+        for j in range(n_cols):
+            if self.arrow_strings:
+                pre = [row[j] if j < len(row) else None for row in preamble]
+                columns[j] = self._arrow_text_column(pre, body[j] if j < body.shape[1] else None, len(body))
                 continue
 
-        return ","
+            col = np.empty(n_pre + len(body), dtype=object)
+            col[:n_pre] = [row[j] if j < len(row) else None for row in preamble]
+            col[n_pre:] = body[j].to_numpy(dtype=object) if j < body.shape[1] else None
+            col[pd.isna(col)] = np.nan
+
+            # Same rule as pandas: a column becomes numeric only if every value is numeric
+            try:
+                columns[j] = pd.to_numeric(col)
+            except (ValueError, TypeError):
+                columns[j] = col
 
-    def _get_excel_sheet_names(self) -> list:
+        return pd.DataFrame(columns, index=pd.RangeIndex(n_pre + len(body)))
+
+    def _detect_csv_separator(self, sample_bytes: int = 65536) -> str:
+        """
+        Detect CSV delimiter by sampling the file content.
+        Tries csv.Sniffer first; falls back to common delimiters.
+        The sample is read once, with the detected encoding; the number format
+        (`self.decimal` / `self.thousands`) is detected from the same sample.
+        """
+        try:
+            with open(self.file_path, "rb") as f:
+                raw = f.read(sample_bytes)
+
+            enc = self.encoding or self._detect_encoding(raw)
+            sample = codecs.getincrementaldecoder(enc)(errors="replace").decode(raw)
+        except Exception:
+            return ","
+
+        if not sample.strip():
+            return ","
+
+        try:
+            sep = csv.Sniffer().sniff(sample, delimiters=CSV_DELIMITERS).delimiter
+        except Exception:
+            counts = {d: sample.count(d) for d in CSV_DELIMITERS}
+            best = max(counts, key=counts.get)
+            sep = best if counts[best] > 0 else ","
+
+        self.decimal, self.thousands = self._detect_number_format(self._csv_sample_columns(sample, sep), sep)
+        return sep
+
+    def iter_excel_chunks(self, sheet_name=None, chunk_rows: int = None):
+        """
+        Stream an .xlsx sheet as DataFrame chunks of at most `chunk_rows` rows.
+
+        Rows are read with openpyxl (read_only=True, values_only=True) and every
+        chunk goes through the same cell conversion and pandas TextParser as
+        pd.read_excel(header=None): integral floats become ints, Excel error
+        values and empty cells become NaN, trailing empty rows are dropped.
+        Chunks carry a continuous RangeIndex; a chunk only has the columns it
+        needs (pd.concat aligns them).
+        """
+        from openpyxl import load_workbook
+        from openpyxl.cell.cell import ERROR_CODES
+        from pandas.io.parsers import TextParser
+
+        if self.file_extension != ".xlsx":
+            raise ValueError(f"Streaming is only supported for .xlsx files, got: {self.file_extension}")
+
+        sheet_name = self.sheet_name if sheet_name is None else sheet_name
+        sheet_name = 0 if sheet_name is None else sheet_name
+        chunk_rows = chunk_rows or self.excel_chunk_rows
+
+        def _convert(v):
+            if v is None:
+                return ""
+            if type(v) is float and v.is_integer():
+                return int(v)
+            if isinstance(v, str) and v in ERROR_CODES:
+                return np.nan
+            return v
+
+        def _chunk(rows, start):
+            width = max(len(r) for r in rows)
+            index = pd.RangeIndex(start, start + len(rows))
+            if width == 0:
+                return pd.DataFrame(index=index)
+            rows = [r + [""] * (width - len(r)) for r in rows]
+            df = TextParser(rows, header=None, skip_blank_lines=False).read()
+            df.index = index
+            return df
+
+        wb = load_workbook(self.file_path, read_only=True, data_only=True, keep_links=False)
+        try:
+            ws = wb[sheet_name] if isinstance(sheet_name, str) else wb.worksheets[sheet_name]
+
+            rows, start = [], 0
+            pending_empty = 0  # empty rows are only emitted once a non-empty row follows
+            for values in ws.iter_rows(values_only=True):
+                row = [_convert(v) for v in values]
+                while row and row[-1] == "":
+                    row.pop()
+
+                if not row:
+                    pending_empty += 1
+                    continue
+
+                while pending_empty:
+                    take = min(pending_empty, chunk_rows - len(rows))
+                    rows.extend([] for _ in range(take))
+                    pending_empty -= take
+                    if len(rows) >= chunk_rows:
+                        yield _chunk(rows, start)
+                        start, rows = start + len(rows), []
+
+                rows.append(row)
+                if len(rows) >= chunk_rows:
+                    yield _chunk(rows, start)
+                    start, rows = start + len(rows), []
+
+            if rows:
+                yield _chunk(rows, start)
+        finally:
+            wb.close()
+
+    def _read_excel_sheet(self, sheet_name) -> pd.DataFrame:
+        """
+        Read one sheet with header=None: streamed in chunks for .xlsx, pd.read_excel otherwise.
+        """
+        if self.stream_excel and self.file_extension == ".xlsx":
+            chunks = list(self.iter_excel_chunks(sheet_name))
+            if not chunks:
+                return pd.DataFrame()
+
+            if len(chunks) == 1:
+                return chunks[0]
+
+            # Columns are aligned only now that the final width is known. A column
+            # whose chunks were inferred differently (e.g. datetime in one chunk,
+            # text in another) is object in pd.read_excel, with NaN for missing cells.
+            width = max(c.shape[1] for c in chunks)
+            chunks = [c.reindex(columns=range(width)) if c.shape[1] < width else c for c in chunks]
+            for j in range(width):
+                dtypes = {c[j].dtype for c in chunks}
+                if len(dtypes) > 1 and not all(d.kind in "iuf" for d in dtypes):
+                    for c in chunks:
+                        col = c[j].astype(object)
+                        col[col.isna()] = np.nan
+                        c[j] = col
+            return pd.concat(chunks)
+
+        return pd.read_excel(
+            self.file_path,
+            sheet_name=sheet_name,
+            skiprows=0,
+            header=None,
+        )
+
+    def sheet_names(self) -> list:
+        """
+        Sheet names of an Excel file (ValueError if the workbook cannot be inspected).
+        """
         try:
             xls = pd.ExcelFile(self.file_path)
             return list(xls.sheet_names or [])
         except Exception as e:
             raise ValueError(f"Could not inspect Excel sheets: {e}")
 
+    def choose_sheet(self):
+        """
+        Settle the sheet before reading: `sheet_name` if given, None for CSV and
+        single-sheet workbooks, otherwise the user's choice in Streamlit
+        (ValueError outside Streamlit).
+        """
+        if self.file_extension not in (".xlsx", ".xls") or self.sheet_name is not None:
+            return self.sheet_name
+
+        sheet_names = self.sheet_names()
+        if len(sheet_names) > 1:
+            return self._maybe_streamlit_sheet_picker(sheet_names)
+        return None
+
+    @staticmethod
+    def _excel_tail_window(wb, ws, n_rows: int, window_bytes: int = 4 << 20):
+        """
+        Fast path for the sheet tail: decompress the worksheet XML keeping only the
+        last `window_bytes`, cut out the last <row> elements and parse just those
+        with openpyxl's row parser.
+
+        This uses openpyxl internals (worksheet source stream, WorkSheetParser,
+        workbook date formats) of the pinned openpyxl 3.1; when any of them is
+        missing it returns None and the caller uses the public iter_rows path.
+
+        Returns {row position: values} covering at least the last `n_rows` rows up
+        to the last non-empty one, or None if the layout does not allow it
+        (then the caller streams the whole sheet).
+        """
+        try:
+            from openpyxl.worksheet._reader import WorkSheetParser
+        except ImportError:
+            return None
+        wb_attrs = ("shared_strings", "epoch", "_date_formats", "_timedelta_formats")
+        if not hasattr(ws, "_get_source") or not all(hasattr(wb, a) for a in wb_attrs):
+            return None
+
+        buf = bytearray()
+        with ws._get_source() as src:
+            for chunk in iter(lambda: src.read(1 << 20), b""):
+                buf += chunk
+                del buf[:-window_bytes]
+        buf = bytes(buf)
+
+        end = buf.rfind(b"</sheetData>")
+        if end == -1:
+            return None
+        data_start = buf.find(b"<sheetData")
+        starts = [m.start() for m in _XLSX_ROW_TAG.finditer(buf, 0, end)]
+        if not starts or b' r="' not in buf[starts[-1] : starts[-1] + 64]:
+            return None
+
+        k = 4 * n_rows
+        while True:
+            k = min(k, len(starts))
+            xml = _XLSX_FRAGMENT_HEAD + buf[starts[-k] : end] + _XLSX_FRAGMENT_TAIL
+            parser = WorkSheetParser(
+                io.BytesIO(xml),
+                wb.shared_strings,
+                data_only=True,
+                epoch=wb.epoch,
+                date_formats=wb._date_formats,
+                timedelta_formats=wb._timedelta_formats,
+            )
+
+            rows = {}
+            for idx, cells in parser.parse():
+                values = {c["column"] - 1: c["value"] for c in cells if c["value"] is not None and c["value"] != ""}
+                if values:
+                    rows[idx - 1] = tuple(values.get(j) for j in range(max(values) + 1))
+
+            # n_rows non-empty rows in the fragment cover the whole tail window
+            whole_sheet = k == len(starts) and data_start != -1
+            if whole_sheet or len(rows) >= n_rows:
+                return rows
+            if k == len(starts):
+                return None
+            k *= 4
+
+    def _preview_excel_sheet(self, sheet_name, n_rows: int = 20):
+        """
+        Return (head, tail) DataFrames with the first / last `n_rows` rows of a sheet.
+
+        .xlsx sheets are read with openpyxl in read-only mode: the head is streamed
+        and only a bounded window at the end of the sheet is parsed for the tail
+        (falling back to streaming every row through a bounded tail buffer).
+        Trailing empty rows are ignored (like pd.read_excel) and the row labels are
+        the sheet row positions. Results are cached per (file, sheet), so
+        switching between sheets only parses each of them once.
+        """
+        stat = os.stat(self.file_path)
+        key = (os.path.realpath(self.file_path), stat.st_mtime_ns, stat.st_size, sheet_name, n_rows)
+        with _PREVIEW_CACHE_LOCK:
+            if key in _PREVIEW_CACHE:
+                _PREVIEW_CACHE.move_to_end(key)
+                return _PREVIEW_CACHE[key]
+
+        if self.file_extension != ".xlsx":
+            # openpyxl cannot stream legacy .xls files
+            df = pd.read_excel(self.file_path, sheet_name=sheet_name, skiprows=0, header=None)
+            result = (df.head(n_rows), df.tail(n_rows))
+        else:
+            from openpyxl import load_workbook
+
+            wb = load_workbook(self.file_path, read_only=True, data_only=True, keep_links=False)
+            try:
+                ws = wb[sheet_name] if isinstance(sheet_name, str) else wb.worksheets[sheet_name]
+                head = list(enumerate(ws.iter_rows(max_row=n_rows, values_only=True)))
+
+                try:
+                    filled = self._excel_tail_window(wb, ws, n_rows)
+                except Exception:
+                    filled = None
+
+                if filled is None:
+                    # Stream every row, keeping only the non-empty ones of a bounded window
+                    filled = {}
+                    for i, row in enumerate(ws.iter_rows(values_only=True)):
+                        if any(v is not None and v != "" for v in row):
+                            filled[i] = row
+                            if len(filled) > n_rows:
+                                del filled[next(iter(filled))]
+            finally:
+                wb.close()
+
+            # Rows up to and including the last non-empty one (empty rows inside are kept)
+            last = max(filled, default=-1)
+            head = [(i, r) for i, r in head if i <= last]
+            tail = [(i, filled.get(i, ())) for i in range(max(last - n_rows + 1, 0), last + 1)]
+
+            # Columns up to and including the last non-empty one
+            width = max(
+                [j + 1 for _, r in head + tail for j, v in enumerate(r) if v is not None and v != ""],
+                default=0,
+            )
+
+            def _frame(part):
+                rows = [(list(r) + [None] * width)[:width] for _, r in part]
+                return pd.DataFrame(rows, index=[i for i, _ in part], columns=range(width))
+
+            result = (_frame(head), _frame(tail))
+
+        with _PREVIEW_CACHE_LOCK:
+            _PREVIEW_CACHE[key] = result
+            _PREVIEW_CACHE.move_to_end(key)
+            while len(_PREVIEW_CACHE) > _PREVIEW_CACHE_SIZE:
+                _PREVIEW_CACHE.popitem(last=False)
+        return result
+
     def _maybe_streamlit_sheet_picker(self, sheet_names: list) -> str:
         """
         If Streamlit is available and there are multiple sheets, ask user to select one.
@@ -102,18 +848,13 @@ class DataReader:
             st.session_state[selected_key] = selected
             st.session_state[confirmed_key] = False
 
-        # Preview selected sheet (first 20 + last 20)
+        # Preview selected sheet (first 20 + last 20), streamed and cached per sheet
         try:
-            preview_df = pd.read_excel(
-                self.file_path,
-                sheet_name=st.session_state[selected_key],
-                skiprows=0,
-                header=None,
-            )
+            preview_head, preview_tail = self._preview_excel_sheet(st.session_state[selected_key], n_rows=20)
             st.write("### Preview (first 20 rows):")
-            st.dataframe(preview_df.head(20), use_container_width=True)
+            st.dataframe(preview_head, use_container_width=True)
             st.write("### Preview (last 20 rows):")
-            st.dataframe(preview_df.tail(20), use_container_width=True)
+            st.dataframe(preview_tail, use_container_width=True)
         except Exception as e:
             st.error(f"Could not preview the selected sheet: {e}")
             st.stop()
@@ -140,54 +881,56 @@ class DataReader:
         """
         if self.file_extension in [".xlsx", ".xls"]:
             if self.sheet_name is not None:
-                self.table = pd.read_excel(
-                    self.file_path,
-                    sheet_name=self.sheet_name,
-                    skiprows=0,
-                    header=None,
-                )
+                self.table = self._read_excel_sheet(self.sheet_name)
             else:
-                sheet_names = self._get_excel_sheet_names()
+                sheet_names = self.sheet_names()
                 if not sheet_names:
                     raise ValueError("No sheets found in the Excel file.")
 
                 if len(sheet_names) == 1:
-                    self.table = pd.read_excel(
-                        self.file_path,
-                        sheet_name=sheet_names[0],
-                        skiprows=0,
-                        header=None,
-                    )
+                    self.table = self._read_excel_sheet(sheet_names[0])
                 else:
                     chosen_sheet = self._maybe_streamlit_sheet_picker(sheet_names)
-                    self.table = pd.read_excel(
-                        self.file_path,
-                        sheet_name=chosen_sheet,
-                        skiprows=0,
-                        header=None,
-                    )
+                    self.table = self._read_excel_sheet(chosen_sheet)
 
         elif self.file_extension == ".csv":
-            sep = self._detect_csv_separator()
+            with open(self.file_path, "rb") as f:
+                data = f.read()
+
+            # Encoding is detected once, from a bounded sample
+            encoding = self._detect_encoding(data)
+
+            # Raw-bytes scan: delimiter + where the tabular block starts (after any preamble)
+            layout = self._scan_csv_layout(data)
+            if layout is not None:
+                sep, body_offset, n_fields = layout
+                # Number format ("1.234,56" vs "1,234.56") from the first records of the block
+                columns = self._sample_csv_columns(data, body_offset, sep, encoding)
+                self.decimal, self.thousands = self._detect_number_format(columns, sep)
+            else:
+                sep, body_offset, n_fields = self._detect_csv_separator(), 0, None
 
-            encodings_to_try = ["utf-8-sig", "utf-8", "cp1252", "latin1"]
+            # Parse once. Later candidates are only tried if the file stops
+            # decoding after the sampled part (e.g. a cp1252 byte deep into an ASCII file).
+            fallbacks = CSV_ENCODINGS[CSV_ENCODINGS.index(encoding) + 1 :]
             last_err = None
-            for enc in encodings_to_try:
+            for enc in [encoding] + fallbacks:
                 try:
-                    self.table = pd.read_csv(
-                        self.file_path,
-                        sep=sep,
-                        header=None,
-                        encoding=enc,
-                        engine="python",
-                    )
+                    self.table = self._read_csv_fast(data, sep, body_offset, n_fields, enc)
                     last_err = None
+                    if enc != encoding:
+                        self.encoding, self.encoding_confidence = enc, 0.0
                     break
+                except UnicodeError as e:
+                    last_err = e
                 except Exception as e:
                     last_err = e
+                    break
 
             if last_err is not None:
-                raise ValueError(f"CSV could not be read. Detected sep='{sep}'. Last error: {last_err}")
+                raise ValueError(
+                    f"CSV could not be read. Detected sep='{sep}', encoding='{self.encoding}'. Last error: {last_err}"
+                )
 
         else:
             raise ValueError(
@@ -197,4 +940,12 @@ class DataReader:
         if self.table is None or self.table.empty:
             raise ValueError("Data failed to load or the file is empty after reading.")
 
+        # Text-formatted numbers in decimal-comma / thousands format (CSVs are handled while parsing)
+        if self.file_extension != ".csv":
+            self.table = self._convert_excel_text_numbers(self.table)
+
+        # Excel text columns (CSV ones are built as string[pyarrow] while parsing)
+        if self.arrow_strings and self.file_extension != ".csv":
+            self.table = self._arrow_string_columns(self.table)
+
         return self.table
@@ -1,14 +1,49 @@
 # src/data_core/writer.py
 from __future__ import annotations
 
-from dataclasses import dataclass
+import os
+import stat
+import tempfile
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Literal
+from typing import Dict, Iterable, Literal, Optional
 
+import numpy as np
 import pandas as pd
 
 
-Format = Literal["xlsx", "csv"]
+Format = Literal["xlsx", "csv", "parquet", "feather"]
+
+FORMATS = ("xlsx", "csv", "parquet", "feather")
+
+# Excel sheet limit (header row included)
+EXCEL_MAX_ROWS = 1_048_576
+
+# Same datetime cell format as pandas' to_excel
+EXCEL_DATETIME_FORMAT = "YYYY-MM-DD HH:MM:SS"
+
+# Compressed CSV: compression -> file suffix (written through pyarrow's codecs)
+CSV_COMPRESSION_SUFFIX = {"gzip": ".gz", "zstd": ".zst"}
+
+# Process umask, read once at import (os.umask can only be read by setting it,
+# which is not safe once writer threads are running)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+# Shared pool for background saves (see TableWriter.save_async)
+_SAVE_POOL: Optional[ThreadPoolExecutor] = None
+_SAVE_POOL_LOCK = threading.Lock()
+
+
+def _save_pool() -> ThreadPoolExecutor:
+    global _SAVE_POOL
+    with _SAVE_POOL_LOCK:
+        if _SAVE_POOL is None:
+            _SAVE_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="table-writer")
+        return _SAVE_POOL
 
 
 @dataclass
@@ -17,11 +52,23 @@ class TableWriter:
     Save prepared tables into <project_root>/PreparedTables.
 
     - User provides ONLY base name (no extension).
-    - Default format is xlsx.
+    - Default format is xlsx; csv, parquet and feather (Arrow IPC) are also supported.
+      Parquet / feather keep dtypes (datetime64[ns] moment, float consumption) natively.
     - Always overwrites existing files (no versioning).
     - Does not modify the user's filename.
+    - xlsx is streamed with openpyxl's write-only mode (bounded memory) and split
+      over numbered sheets (Sheet1, Sheet2, ...) above Excel's row limit.
+    - Stats of the last write (rows, seconds, throughput) are in `last_write_stats`.
+    - Writes are atomic: the file is written to a temp file in the same directory
+      and renamed into place, so a crash never leaves a truncated output.
+    - CSV can be gzip / zstd compressed (<name>.csv.gz / <name>.csv.zst).
+    - `save_async` / `save_many_async` save in a background thread pool and
+      return futures (several formats can be written concurrently).
     """
     output_dir_name: str = "PreparedTables"
+    last_write_stats: Optional[dict] = field(default=None, init=False, repr=False)
+    write_stats: Dict[str, dict] = field(default_factory=dict, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
 
     def __post_init__(self):
         here = Path(__file__).resolve()
@@ -60,8 +107,8 @@ class TableWriter:
             raise ValueError("Filename must not contain '..'.")
 
         # since you said user won't write extension:
-        if name.lower().endswith((".xlsx", ".csv")):
-            raise ValueError("Please enter filename WITHOUT extension (no .xlsx / .csv).")
+        if name.lower().endswith(tuple(f".{fmt}" for fmt in FORMATS)):
+            raise ValueError("Please enter filename WITHOUT extension (no .xlsx / .csv / .parquet / .feather).")
 
     def save(
         self,
@@ -70,27 +117,241 @@ class TableWriter:
         fmt: Format = "xlsx",
         *,
         index: bool = False,
+        compression: Optional[str] = None,
+        row_group_size: Optional[int] = None,
     ) -> Path:
         """
         Save as PreparedTables/<name>.<fmt>. Always overwrites.
+
+        compression:    csv     -> None (default), "gzip", "zstd"
+                        parquet -> "snappy" (default), "zstd", "gzip", "brotli", "lz4", "none"
+                        feather -> "zstd" (default), "lz4", "uncompressed"
+        row_group_size: parquet only, rows per row group (pyarrow default if None).
         """
         self._validate_user_filename(name)
 
         fmt = fmt.lower().strip()  # type: ignore
-        if fmt not in ("xlsx", "csv"):
-            raise ValueError(f"Unsupported format: {fmt}. Use 'xlsx' or 'csv'.")
+        if fmt not in FORMATS:
+            raise ValueError(f"Unsupported format: {fmt}. Use one of {', '.join(FORMATS)}.")
 
-        out_path = self.output_dir / f"{name}.{fmt}"
+        suffix = f".{fmt}"
+        if fmt == "csv" and compression is not None:
+            if compression not in CSV_COMPRESSION_SUFFIX:
+                raise ValueError(f"Unsupported CSV compression: {compression}. Use 'gzip' or 'zstd'.")
+            suffix += CSV_COMPRESSION_SUFFIX[compression]
 
-        if fmt == "xlsx":
-            table.to_excel(out_path, index=index, engine="openpyxl")
-        else:
-            table.to_csv(out_path, index=index)
+        out_path = self.output_dir / f"{name}{suffix}"
+        t0 = time.perf_counter()
+        n_sheets = None
+
+        # Write next to the target, then rename over it (atomic on the same filesystem)
+        fd, tmp_name = tempfile.mkstemp(dir=self.output_dir, prefix=f".{name}{suffix}.", suffix=".tmp")
+        os.close(fd)
+        tmp_path = Path(tmp_name)
+
+        try:
+            if fmt == "xlsx":
+                n_sheets = self._write_xlsx_streaming(table, tmp_path, index=index)
+            elif fmt == "csv":
+                if compression is None:
+                    table.to_csv(tmp_path, index=index)
+                else:
+                    self._write_csv_compressed(table, tmp_path, compression, index=index)
+            elif fmt == "parquet":
+                table.to_parquet(
+                    tmp_path,
+                    engine="pyarrow",
+                    index=index,
+                    compression=None if compression == "none" else (compression or "snappy"),
+                    row_group_size=row_group_size,
+                )
+            else:
+                # Feather stores columns only: the index is dropped or written as a column
+                table.reset_index(drop=not index).to_feather(tmp_path, compression=compression or "zstd")
 
+            # mkstemp files are 0600: give the output the mode a plain open() would
+            # (the umask), or keep the mode of the file being replaced
+            try:
+                mode = stat.S_IMODE(out_path.stat().st_mode)
+            except FileNotFoundError:
+                mode = 0o666 & ~_UMASK
+            os.chmod(tmp_path, mode)
+
+            os.replace(tmp_path, out_path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+        seconds = time.perf_counter() - t0
+        n_bytes = out_path.stat().st_size
+        stats = {
+            "path": str(out_path),
+            "format": fmt,
+            "rows": len(table),
+            "sheets": n_sheets,
+            "seconds": round(seconds, 3),
+            "rows_per_sec": round(len(table) / seconds) if seconds > 0 else None,
+            "bytes": n_bytes,
+            "mb_per_sec": round(n_bytes / 1e6 / seconds, 2) if seconds > 0 else None,
+        }
+        with self._lock:
+            self.last_write_stats = stats
+            self.write_stats[str(out_path)] = stats
         return out_path
 
+    def save_async(self, table: pd.DataFrame, name: str, fmt: Format = "xlsx", **kwargs) -> Future:
+        """
+        Same as `save`, in a background thread. The future resolves to the output Path
+        (or raises the write error); stats are in `write_stats[str(path)]`.
+        """
+        # Validate now, so bad names fail in the caller and not in the pool
+        self._validate_user_filename(name)
+        return _save_pool().submit(self.save, table, name, fmt, **kwargs)
+
+    def save_many_async(self, table: pd.DataFrame, name: str, fmts: Iterable[str], **kwargs) -> Dict[str, Future]:
+        """
+        Write several formats of the same table concurrently: {fmt: future}.
+        """
+        return {fmt: self.save_async(table, name, fmt, **kwargs) for fmt in fmts}
+
+    @staticmethod
+    def _write_csv_compressed(
+        table: pd.DataFrame, path: Path, compression: str, *, index: bool = False, chunk_rows: int = 100_000
+    ) -> None:
+        """
+        CSV through pyarrow's gzip / zstd stream codecs, `chunk_rows` rows at a time
+        (same text as to_csv, without holding the whole file in memory).
+        """
+        import pyarrow as pa
+
+        with pa.CompressedOutputStream(str(path), compression) as out:
+            for start in range(0, max(len(table), 1), chunk_rows):
+                chunk = table.iloc[start : start + chunk_rows]
+                out.write(chunk.to_csv(index=index, header=start == 0).encode("utf-8"))
+
+    @staticmethod
+    def _excel_values(col: pd.Series) -> list:
+        """
+        Column values as Python objects for openpyxl (missing -> empty cell),
+        following pandas' to_excel: datetimes stay datetimes, +-inf -> "inf"/"-inf".
+        """
+        if pd.api.types.is_datetime64_any_dtype(col.dtype):
+            if getattr(col.dt, "tz", None) is not None:
+                raise ValueError(
+                    "Excel does not support datetimes with timezones. "
+                    "Please ensure that datetimes are timezone unaware before writing to Excel."
+                )
+            values = pd.DatetimeIndex(col).to_pydatetime().astype(object)
+        elif pd.api.types.is_float_dtype(col.dtype):
+            arr = col.to_numpy(dtype=float)
+            if col.dtype == np.float32:
+                # Shortest float32 text (as in to_csv), so 0.1 is not written as 0.10000000149
+                arr = col.to_numpy().astype(str).astype(float)
+            values = arr.astype(object)
+            values[np.isposinf(arr)] = "inf"
+            values[np.isneginf(arr)] = "-inf"
+        else:
+            values = col.to_numpy(dtype=object)
+
+        values[col.isna().to_numpy()] = None
+        return values.tolist()
+
+    def _write_xlsx_streaming(
+        self,
+        table: pd.DataFrame,
+        out_path: Path,
+        *,
+        index: bool = False,
+        chunk_rows: int = 100_000,
+        max_rows: int = EXCEL_MAX_ROWS,
+    ) -> int:
+        """
+        Write `table` with openpyxl's write-only workbook, converting `chunk_rows`
+        rows at a time. Starts a new sheet (Sheet1, Sheet2, ...) whenever a sheet
+        is full; every sheet repeats the header row. Returns the number of sheets.
+        """
+        from openpyxl import Workbook
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.styles import Alignment, Border, Font, Side
+
+        if index:
+            table = table.reset_index()
+
+        wb = Workbook(write_only=True)
+
+        # Header cells styled like pandas' to_excel
+        thin = Side(style="thin")
+        header_style = {
+            "font": Font(bold=True),
+            "border": Border(left=thin, right=thin, top=thin, bottom=thin),
+            "alignment": Alignment(horizontal="center", vertical="top"),
+        }
+
+        date_cols = [j for j, dtype in enumerate(table.dtypes) if pd.api.types.is_datetime64_any_dtype(dtype)]
+        date_cells = {}
+
+        rows_per_sheet = max_rows - 1
+        ws, n_sheets, rows_in_sheet = None, 0, rows_per_sheet
+
+        def new_sheet():
+            nonlocal ws, n_sheets, rows_in_sheet
+            n_sheets += 1
+            ws = wb.create_sheet(f"Sheet{n_sheets}")
+
+            # One styled cell per datetime column, reused row after row (rows are
+            # serialized on append), so dates keep a native Excel date format
+            for j in date_cols:
+                date_cells[j] = WriteOnlyCell(ws)
+                date_cells[j].number_format = EXCEL_DATETIME_FORMAT
+            header = []
+            for c in table.columns:
+                cell = WriteOnlyCell(ws, value=None if c is None else str(c))
+                cell.font, cell.border, cell.alignment = header_style["font"], header_style["border"], header_style["alignment"]
+                header.append(cell)
+            ws.append(header)
+            rows_in_sheet = 0
+
+        for start in range(0, max(len(table), 1), chunk_rows):
+            chunk = table.iloc[start : start + chunk_rows]
+            columns = [self._excel_values(chunk.iloc[:, j]) for j in range(chunk.shape[1])]
+
+            for row in zip(*columns):
+                if rows_in_sheet >= rows_per_sheet:
+                    new_sheet()
+
+                if date_cells:
+                    row = list(row)
+                    for j, cell in date_cells.items():
+                        if row[j] is not None:
+                            cell.value = row[j]
+                            row[j] = cell
+
+                ws.append(row)
+                rows_in_sheet += 1
+
+        if ws is None:
+            new_sheet()
+
+        wb.save(out_path)
+        return n_sheets
+
     def save_xlsx(self, table: pd.DataFrame, name: str, *, index: bool = False) -> Path:
         return self.save(table, name, fmt="xlsx", index=index)
 
-    def save_csv(self, table: pd.DataFrame, name: str, *, index: bool = False) -> Path:
-        return self.save(table, name, fmt="csv", index=index)
+    def save_csv(
+        self, table: pd.DataFrame, name: str, *, index: bool = False, compression: Optional[str] = None
+    ) -> Path:
+        return self.save(table, name, fmt="csv", index=index, compression=compression)
+
+    def save_parquet(
+        self,
+        table: pd.DataFrame,
+        name: str,
+        *,
+        index: bool = False,
+        compression: Optional[str] = None,
+        row_group_size: Optional[int] = None,
+    ) -> Path:
+        return self.save(table, name, fmt="parquet", index=index, compression=compression, row_group_size=row_group_size)
+
+    def save_feather(self, table: pd.DataFrame, name: str, *, index: bool = False, compression: Optional[str] = None) -> Path:
+        return self.save(table, name, fmt="feather", index=index, compression=compression)
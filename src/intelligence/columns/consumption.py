@@ -1,11 +1,42 @@
-from typing import Optional
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Tuple
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 from pandas.api.types import is_numeric_dtype
 
+from src.data_core.reader import ARROW_STRING
+
 from .base import BaseColumnDetector
 
 
+# Text that parses as a float (after trimming); everything else becomes NaN
+_NUMBER = r"^[+-]?(?:(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?|(?i:inf|infinity|nan))$"
+
+
+def _coerce_numeric(series: pd.Series) -> pd.Series:
+    """
+    pd.to_numeric(series, errors="coerce") as float64 (NaN for missing / invalid).
+
+    string[pyarrow] columns are parsed with Arrow kernels (trim, regex check,
+    cast) instead of going through Python objects.
+    """
+    if series.dtype == ARROW_STRING:
+        txt = pc.utf8_trim_whitespace(pa.array(series.array))
+        valid = pc.match_substring_regex(txt, _NUMBER)
+        values = pc.cast(pc.if_else(valid, txt, pa.scalar(None, txt.type)), pa.float64())
+        return pd.Series(values.to_numpy(zero_copy_only=False), index=series.index, name=series.name)
+
+    coerced = pd.to_numeric(series, errors="coerce")
+    if isinstance(coerced.dtype, np.dtype):
+        return coerced
+    # Nullable / Arrow numeric dtypes -> plain float64
+    return pd.Series(coerced.to_numpy(dtype="float64", na_value=np.nan), index=series.index, name=series.name)
+
+
 class ConsumptionColumnDetector(BaseColumnDetector):
     """
     Detect and normalize consumption-related columns in a table.
@@ -21,6 +52,12 @@ class ConsumptionColumnDetector(BaseColumnDetector):
         "kwh",
     ]
 
+    # Rows scored per column: equal head / middle / tail blocks (whole column when shorter)
+    SCORE_SAMPLE_ROWS = 3000
+
+    # Candidate columns from which numeric scoring runs in a thread pool
+    PARALLEL_MIN_COLUMNS = 16
+
     def __init__(self, table: pd.DataFrame):
         """
         Parameters
@@ -34,6 +71,9 @@ class ConsumptionColumnDetector(BaseColumnDetector):
         self.consumption_column: Optional[str] = None
         self.consumption_unit: Optional[str] = None  # "kwh", "kw", or None
 
+        # Full-length numeric values of columns scored exactly (reused by to_kwh)
+        self._coerced: Dict[str, pd.Series] = {}
+
     def _detect_consumption_unit_from_name(self, name: str) -> Optional[str]:
         """
         Try to infer the unit ("kwh" or "kw") from the column name.
@@ -52,6 +92,18 @@ class ConsumptionColumnDetector(BaseColumnDetector):
         n = self._norm(name)
         return any(keyword in n for keyword in self.CONSUMPTION_KEYWORDS)
 
+    def _score_sample(self, series: pd.Series) -> pd.Series:
+        """
+        Bounded stratified sample of a column: head, middle and tail blocks.
+        """
+        n = len(series)
+        if n <= self.SCORE_SAMPLE_ROWS:
+            return series
+
+        block = self.SCORE_SAMPLE_ROWS // 3
+        mid = (n - block) // 2
+        return pd.concat([series.iloc[:block], series.iloc[mid:mid + block], series.iloc[-block:]])
+
     def _numeric_likeness_score(self, series: pd.Series) -> int:
         """
         Score how numeric-like a column is.
@@ -66,7 +118,7 @@ class ConsumptionColumnDetector(BaseColumnDetector):
         if is_numeric_dtype(series):
             return 2
 
-        coerced = pd.to_numeric(series, errors="coerce")
+        coerced = _coerce_numeric(series)
         non_na_ratio = coerced.notna().mean()
 
         if non_na_ratio >= 0.8:  # threshold can be tuned
@@ -95,23 +147,32 @@ class ConsumptionColumnDetector(BaseColumnDetector):
         ValueError
             If no suitable consumption column can be found.
         """
-        best_col: Optional[str] = None
-        best_score = (-1, -1, -1)  # (has_keyword, unit_score, numeric_score)
-
+        # Name scores first: columns without keyword or unit can never be chosen,
+        # so only the others get a (sampled) numeric score.
+        name_scores: Dict[str, Tuple[int, int]] = {}
         for col in self.columns:
-            series = self.table[col]
-
             name_norm = self._norm(col)
             has_keyword = int(self._has_consumption_keyword(name_norm))
             unit = self._detect_consumption_unit_from_name(name_norm)
             unit_score = 2 if unit == "kwh" else 1 if unit == "kw" else 0
-            numeric_score = self._numeric_likeness_score(series)
+            name_scores[col] = (has_keyword, unit_score)
 
-            score = (has_keyword, unit_score, numeric_score)
+        candidates = [c for c, (kw, unit) in name_scores.items() if kw or unit]
+        numeric_scores = self._sampled_numeric_scores(candidates)
+        best_col, best_score = self._best_column(name_scores, numeric_scores)
 
-            if score > best_score:
-                best_score = score
-                best_col = col
+        # Name scores rank first, so only candidates with the winner's name score
+        # can win. Their sampled numeric scores may be off either way, so all of
+        # them are re-scored on the full column and the winner is picked again
+        # (same result as scoring every column in full).
+        if best_col in numeric_scores:
+            tied = [c for c in candidates if name_scores[c] == name_scores[best_col]]
+            for col in tied:
+                numeric_scores[col] = self._full_numeric_score(col)
+            best_col, best_score = self._best_column(name_scores, numeric_scores)
+
+            # Only the chosen column's coerced values are needed (by to_kwh)
+            self._coerced = {c: v for c, v in self._coerced.items() if c == best_col}
 
         # Require at least some consumption signal (keyword or unit),
         # not just "numeric-looking".
@@ -123,6 +184,45 @@ class ConsumptionColumnDetector(BaseColumnDetector):
 
         return best_col
 
+    def _best_column(self, name_scores: Dict[str, Tuple[int, int]], numeric_scores: Dict[str, int]):
+        """
+        First column with the highest (has_keyword, unit_score, numeric_score).
+        """
+        best_col: Optional[str] = None
+        best_score = (-1, -1, -1)
+        for col in self.columns:
+            score = (*name_scores[col], numeric_scores.get(col, 0))
+            if score > best_score:
+                best_score = score
+                best_col = col
+        return best_col, best_score
+
+    def _sampled_numeric_scores(self, columns: list) -> Dict[str, int]:
+        """
+        Numeric-likeness score of each column on its stratified sample;
+        threaded for wide tables (Arrow kernels release the GIL).
+        """
+        def score(col) -> int:
+            return self._numeric_likeness_score(self._score_sample(self.table[col]))
+
+        if len(columns) < self.PARALLEL_MIN_COLUMNS:
+            return {col: score(col) for col in columns}
+
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as pool:
+            return dict(zip(columns, pool.map(score, columns)))
+
+    def _full_numeric_score(self, col: str) -> int:
+        """
+        Numeric-likeness score over the whole column; the coerced values are kept.
+        """
+        series = self.table[col]
+        if is_numeric_dtype(series):
+            return 2
+
+        coerced = _coerce_numeric(series)
+        self._coerced[col] = coerced
+        return 1 if coerced.notna().mean() >= 0.8 else 0
+
     def to_kwh(self, new_column_name: str = "consumption_kwh") -> pd.Series:
         """
         Return a consumption series in kWh and store it as a new column.
@@ -153,7 +253,9 @@ class ConsumptionColumnDetector(BaseColumnDetector):
         col = self.consumption_column
         unit = self.consumption_unit
 
-        series = pd.to_numeric(self.table[col], errors="coerce")
+        series = self._coerced.pop(col, None)
+        if series is None:
+            series = _coerce_numeric(self.table[col])
 
         if series.isna().all():
             raise ValueError(
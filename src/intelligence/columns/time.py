@@ -1,13 +1,15 @@
 from __future__ import annotations
 
-from typing import List
+from typing import List, Optional, Sequence, Tuple
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 import re
 
-from .base import BaseColumnDetector
-
+from src.data_core.reader import ARROW_STRING
 
-from typing import Optional
+from .base import BaseColumnDetector
 
 
 # ==============================================================================
@@ -44,6 +46,261 @@ class TimeColumnDetector(BaseColumnDetector):
         return [col for col in self.columns if self._has_time_keyword(col)]
 
 
+# ==============================================================================
+# Shared vectorized helpers (Arrow compute kernels, no Python call per row)
+# ==============================================================================
+# Up to three ':'-separated digit groups (H, M, S) of a normalized time string
+_TIME_PARTS = re.compile(r"^(?P<a>\d+)(?::(?P<b>\d+))?(?::(?P<c>\d+))?")
+
+# Digit groups longer than this can never be a valid date/time component
+_MAX_DIGITS = 9
+_OUT_OF_RANGE = 10**_MAX_DIGITS
+
+# Python's `\s` (str.isspace) spelled out, so RE2 (Arrow) matches exactly like `re`
+_WS_CLASS = "[\t\n\x0b\x0c\r\x1c-\x1f \x85\xa0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000]"
+
+
+def _to_re2(pattern: str, ascii_only: bool = False) -> str:
+    """
+    Translate a Python `re` pattern used in this module into an equivalent RE2
+    pattern for Arrow: Unicode `\d` / `\s` semantics are made explicit.
+
+    With `ascii_only=True` the pattern is only valid for ASCII input, where
+    RE2's own (much faster) `\d` already matches exactly what `re` matches.
+    """
+    if not ascii_only:
+        pattern = pattern.replace(r"\d", r"\p{Nd}")
+    return pattern.replace(r"\s", _WS_CLASS)
+
+
+def _digits_to_int(arr: pa.Array) -> np.ndarray:
+    """
+    Convert an Arrow array of digit strings (null where missing) to int64.
+    Missing values (null, or "" for an unmatched optional group) become -1,
+    which is never valid for any date/time component.
+    """
+    null = pa.scalar(None, pa.string())
+    arr = pc.if_else(pc.equal(pc.utf8_length(arr), 0), null, arr)
+
+    # Leading zeros carry no value ("0023" -> 23); longer numbers than
+    # _MAX_DIGITS are out of range for every component, so they get a sentinel.
+    arr = pc.utf8_ltrim(arr, characters="0")
+    arr = pc.if_else(pc.equal(pc.utf8_length(arr), 0), pa.scalar("0"), arr)
+    too_long = pc.fill_null(pc.greater(pc.utf8_length(arr), _MAX_DIGITS), False)
+    arr = pc.if_else(too_long, pa.scalar(str(_OUT_OF_RANGE)), arr)
+
+    is_ascii = pc.fill_null(pc.string_is_ascii(arr), True)
+    nums = pc.cast(pc.if_else(is_ascii, arr, null), pa.int64())
+    out = nums.fill_null(-1).to_numpy(zero_copy_only=False).astype(np.int64, copy=True)
+
+    # Rare: non-ASCII decimal digits (e.g. Arabic-Indic) -> same as Python int()
+    non_ascii = np.flatnonzero(~is_ascii.to_numpy(zero_copy_only=False))
+    for i in non_ascii:
+        out[i] = int(arr[int(i)].as_py())
+
+    return out
+
+
+def _unique_strings(txt: pa.Array) -> Tuple[pa.Array, np.ndarray]:
+    """
+    Factorize an Arrow string array: returns (unique values, integer codes).
+    Nulls get code -1. Parsing then only has to touch the unique values.
+    """
+    encoded = pc.dictionary_encode(txt)
+    codes = encoded.indices.fill_null(-1).to_numpy(zero_copy_only=False).astype(np.intp, copy=False)
+    return encoded.dictionary, codes
+
+
+def _broadcast(values: np.ndarray, codes: np.ndarray, fill) -> np.ndarray:
+    """
+    Expand per-unique results back to rows; code -1 (missing) gets `fill`.
+    """
+    # -1 indexes the appended fill value
+    return np.append(values, np.array([fill], dtype=values.dtype))[codes]
+
+
+def _take_indices(codes: np.ndarray) -> pa.Array:
+    """
+    Arrow take-indices for per-unique results (code -1 -> null row).
+    """
+    return pa.array(codes, mask=codes == -1)
+
+
+def _string_array(s: pd.Series) -> pa.Array:
+    """
+    Column as an Arrow string array (string[pyarrow] columns without a round trip through Python).
+    """
+    if s.dtype == ARROW_STRING:
+        arr = pa.array(s.array)
+        if isinstance(arr, pa.ChunkedArray):
+            arr = arr.combine_chunks()
+        return arr.cast(pa.string())
+    return pa.array(s.astype("string"), type=pa.string(), from_pandas=True)
+
+
+def _parse_time_of_day_codes(s: pd.Series) -> Tuple[Tuple[np.ndarray, ...], np.ndarray]:
+    """
+    Like `_parse_time_of_day`, but returns the per-unique results
+    ((hour, minute, second, valid), codes) without broadcasting them.
+    """
+    txt = _string_array(s)
+    uniques, codes = _unique_strings(txt)
+    return _parse_time_strings(uniques), codes
+
+
+def _parse_time_of_day(s: pd.Series) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Vectorized time-of-day parser shared by the Preference_* classes.
+
+    Accepts (after str() + strip, any run of non-digits acting as separator):
+      - "0:15", "00:15", "00:15:00", "9.30", "00-15-00"  (H:M or H:M:S)
+      - "001500" (HHMMSS), "0015" (HHMM), "930" (HMM), "9" / "09" (H)
+
+    Only the unique values are parsed; results are broadcast back to rows.
+
+    Returns
+    -------
+    (hour, minute, second, valid)
+        int64 arrays (0 where invalid) and a boolean validity mask.
+    """
+    (h, m, sec, valid), codes = _parse_time_of_day_codes(s)
+    return (
+        _broadcast(h, codes, 0),
+        _broadcast(m, codes, 0),
+        _broadcast(sec, codes, 0),
+        _broadcast(valid, codes, False),
+    )
+
+
+def _parse_time_strings(txt: pa.Array) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Parse an Arrow string array row by row (column-wise kernels); see `_parse_time_of_day`.
+    """
+    n = len(txt)
+    h = np.zeros(n, dtype=np.int64)
+    m = np.zeros(n, dtype=np.int64)
+    sec = np.zeros(n, dtype=np.int64)
+    valid = np.zeros(n, dtype=bool)
+
+    is_ascii = pc.fill_null(pc.string_is_ascii(txt), True).to_numpy(zero_copy_only=False)
+
+    for idx, ascii_only in ((np.flatnonzero(is_ascii), True), (np.flatnonzero(~is_ascii), False)):
+        if len(idx) == 0:
+            continue
+        sub = txt.take(pa.array(idx))
+
+        # normalize separators: every run of non-digits -> ':' (strip outer ones)
+        norm = pc.replace_substring_regex(sub, pattern=_to_re2(r"[^\d]+", ascii_only), replacement=":")
+        norm = pc.utf8_trim(norm, characters=":")
+
+        parts = pc.extract_regex(norm, _to_re2(_TIME_PARTS.pattern, ascii_only))
+        first = pc.struct_field(parts, "a")
+        p0 = _digits_to_int(first)
+        p1 = _digits_to_int(pc.struct_field(parts, "b"))
+        p2 = _digits_to_int(pc.struct_field(parts, "c"))
+
+        # no separators -> HHMMSS / HHMM / HMM / HH / H (by digit count)
+        n_digits = pc.fill_null(pc.utf8_length(first), 0).to_numpy(zero_copy_only=False)
+        single = parts.is_valid().to_numpy(zero_copy_only=False) & (p1 == -1)
+
+        # separators -> H:M(:S)
+        hh = p0
+        mm = np.where(p1 == -1, 0, p1)
+        ss = np.where(p2 == -1, 0, p2)
+
+        six, four_or_three = single & (n_digits == 6), single & ((n_digits == 4) | (n_digits == 3))
+        hh = np.where(six, p0 // 10000, np.where(four_or_three, p0 // 100, hh))
+        mm = np.where(six, p0 // 100 % 100, np.where(four_or_three, p0 % 100, mm))
+        ss = np.where(six, p0 % 100, np.where(four_or_three, 0, ss))
+
+        ok = parts.is_valid().to_numpy(zero_copy_only=False)
+        ok &= ~(single & ((n_digits == 5) | (n_digits > 6)))
+        ok &= (0 <= hh) & (hh <= 23) & (0 <= mm) & (mm <= 59) & (0 <= ss) & (ss <= 59)
+
+        h[idx] = np.where(ok, hh, 0)
+        m[idx] = np.where(ok, mm, 0)
+        sec[idx] = np.where(ok, ss, 0)
+        valid[idx] = ok
+
+    return h, m, sec, valid
+
+
+def _pad(values: np.ndarray, width: int) -> pa.Array:
+    return pc.utf8_lpad(pc.cast(pa.array(values), pa.string()), width=width, padding="0")
+
+
+def _format_dates(y: np.ndarray, m: np.ndarray, d: np.ndarray, ok: np.ndarray) -> pa.Array:
+    """
+    Format integer components as "YYYY-MM-DD" strings (null where not ok).
+    """
+    txt = pc.binary_join_element_wise(_pad(y, 4), _pad(m, 2), _pad(d, 2), "-")
+    return pc.if_else(pa.array(ok), txt, pa.scalar(None, pa.string()))
+
+
+def _format_times(h: np.ndarray, mi: np.ndarray, sec: np.ndarray, ok: np.ndarray) -> pa.Array:
+    """
+    Format integer components as "HH:MM:SS" strings (null where not ok).
+    """
+    txt = pc.binary_join_element_wise(_pad(h, 2), _pad(mi, 2), _pad(sec, 2), ":")
+    return pc.if_else(pa.array(ok), txt, pa.scalar(None, pa.string()))
+
+
+# datetime64[ns] limits, in whole seconds since the epoch
+_MIN_SECONDS = -((-pd.Timestamp.min.value) // 10**9)
+_MAX_SECONDS = pd.Timestamp.max.value // 10**9
+_NAT = np.iinfo(np.int64).min
+
+_DAYS_IN_MONTH = np.array([31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31], dtype=np.int64)
+
+
+def _days_from_civil(y: np.ndarray, m: np.ndarray, d: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Days since 1970-01-01 for proleptic Gregorian (year, month, day) arrays,
+    plus a mask of valid calendar dates (e.g. 2023-02-29 / 2024-04-31 are invalid).
+    """
+    mm = np.clip(m, 1, 12)
+    leap = (y % 4 == 0) & ((y % 100 != 0) | (y % 400 == 0))
+    month_len = _DAYS_IN_MONTH[mm - 1] + (leap & (mm == 2))
+    valid = (m >= 1) & (m <= 12) & (d >= 1) & (d <= month_len)
+
+    # Howard Hinnant's days_from_civil (March-based years, 400-year eras)
+    yy = y - (mm <= 2)
+    era = np.floor_divide(yy, 400)
+    yoe = yy - era * 400
+    doy = (153 * np.where(mm > 2, mm - 3, mm + 9) + 2) // 5 + d - 1
+    doe = yoe * 365 + yoe // 4 - yoe // 100 + doy
+    return era * 146097 + doe - 719468, valid
+
+
+def _compose_moment(days: np.ndarray, date_ok: np.ndarray, seconds: np.ndarray, time_ok: np.ndarray) -> np.ndarray:
+    """
+    Build datetime64[ns] values from day numbers + seconds of day by epoch arithmetic.
+    NaT where a part is invalid or the result is outside the datetime64[ns] range.
+    """
+    total = days * 86400 + seconds
+    ok = date_ok & time_ok & (total >= _MIN_SECONDS) & (total <= _MAX_SECONDS)
+    return np.where(ok, total * 10**9, _NAT).view("M8[ns]")
+
+
+# Numeric dates with the year last ("01.02.2024", "1/2/24", "01-02-2024"):
+# day-first or month-first depending on the export
+_NUMERIC_DATE = re.compile(r"^\s*\d{1,2}(?P<sep>[./-])\d{1,2}(?P=sep)\d{2,4}\s*$")
+
+
+def _keep_columns(table: pd.DataFrame, keep: Sequence[str]) -> pd.DataFrame:
+    missing = [c for c in keep if c not in table.columns]
+    if missing:
+        raise KeyError(f"Missing required columns: {missing}")
+    return table[list(keep)].copy()
+
+
+def _string_series(arr: pa.Array, index) -> pd.Series:
+    """
+    Wrap an Arrow string array as a pandas "string" Series (no per-row Python objects).
+    """
+    return pd.Series(pd.arrays.ArrowStringArray(arr), index=index)
+
+
 # ==============================================================================
 # 2) Date + Hour -> Single timestamp
 # ==============================================================================
@@ -58,9 +315,13 @@ class Preference_Date_And_Hour:
       - HOUR column (hour/minute/seconds)
 
     Goal:
-      - Normalize DATE -> "YYYY-MM-DD" (string)
-      - Normalize HOUR -> "HH:MM:SS" (string)
+      - Parse DATE -> year / month / day
+      - Parse HOUR -> hour / minute / second
       - Combine into a single datetime column named "moment"
+
+    Parsed components are kept as integer arrays (per distinct value + codes);
+    the normalized "YYYY-MM-DD" / "HH:MM:SS" strings are only written back
+    into the DATE / HOUR columns when asked for (`write_strings=True`).
     """
 
     def __init__(self, table: pd.DataFrame, date_col: str, hour_col: str):
@@ -68,41 +329,88 @@ class Preference_Date_And_Hour:
         self.date_col = date_col
         self.hour_col = hour_col
 
-    def detect_date_dtype(self) -> str:
+        # {"y", "m", "d", "ok"} / {"h", "m", "s", "ok"} per distinct value, plus "codes" per row
+        self._date_parts: Optional[dict] = None
+        self._hour_parts: Optional[dict] = None
+
+    @staticmethod
+    def _parse_dates(values: pd.Index) -> pd.DatetimeIndex:
+        """
+        pd.to_datetime(values, errors="coerce"), except for numeric dates with the
+        year last ("13.01.2024", "1/2/24"): pandas reads those month-first, so
+        German "%d.%m.%Y" days 1-12 would come out as wrong dates and 13-31 as NaT.
+        Such values are read day-first when that parses more of them, or on a
+        tie when they all use "." (the day-first convention).
+        """
+        parsed = pd.DatetimeIndex(pd.to_datetime(values, errors="coerce"))
+
+        seps = pd.Series(values, dtype=object).astype("string").str.extract(_NUMERIC_DATE)["sep"]
+        numeric = seps.notna().to_numpy()
+        if not numeric.any():
+            return parsed
+
+        sub = values[numeric]
+        month_first = parsed if numeric.all() else pd.DatetimeIndex(pd.to_datetime(sub, errors="coerce"))
+        day_first = pd.DatetimeIndex(pd.to_datetime(sub, errors="coerce", dayfirst=True))
+
+        n_month, n_day = month_first.notna().sum(), day_first.notna().sum()
+        if n_day > n_month or (n_day == n_month and (seps[numeric] == ".").all()):
+            merged = parsed.to_numpy(copy=True)
+            merged[numeric] = day_first.to_numpy()
+            return pd.DatetimeIndex(merged)
+        return parsed
+
+    def detect_date_dtype(self, *, write_strings: bool = False) -> str:
         """
-        Normalizes DATE column into "YYYY-MM-DD" (string). Returns "string".
+        Parses the DATE column into year/month/day components. Returns "string".
+
+        With `write_strings=True` the column is also normalized into
+        "YYYY-MM-DD" (string).
         """
         if self.date_col not in self.table.columns:
             raise KeyError(f"Date column not found: {self.date_col}")
 
         s = self.table[self.date_col]
 
-        # datetime-like -> normalize -> YYYY-MM-DD string
+        # datetime-like -> calendar components (time of day is dropped)
         if pd.api.types.is_datetime64_any_dtype(s):
-            norm = s.dt.normalize()
-            self.table[self.date_col] = norm.dt.strftime("%Y-%m-%d").astype("string")
-            return "string"
-
-        # string/object -> parse -> normalize -> YYYY-MM-DD string
-        if pd.api.types.is_string_dtype(s) or pd.api.types.is_object_dtype(s):
-            parsed = pd.to_datetime(s, errors="coerce")
-            if parsed.notna().sum() == 0 and s.dropna().shape[0] > 0:
+            ok = s.notna().to_numpy()
+            y, m, d = (getattr(s.dt, f).fillna(0).to_numpy(dtype=np.int64) for f in ("year", "month", "day"))
+            codes = np.arange(len(s), dtype=np.intp)
+
+        # string/object -> parse -> calendar components
+        # (each distinct value is parsed once and broadcast back through the codes)
+        elif pd.api.types.is_string_dtype(s) or pd.api.types.is_object_dtype(s):
+            codes, uniques = pd.factorize(s)
+            parsed = self._parse_dates(uniques)
+            if parsed.notna().sum() == 0 and len(uniques) > 0:
                 raise ValueError(
                     f"Could not parse any values in DATE column '{self.date_col}' as datetime."
                 )
 
-            norm = parsed.dt.normalize()
-            self.table[self.date_col] = norm.dt.strftime("%Y-%m-%d").astype("string")
-            return "string"
+            ok = parsed.notna()
+            y, m, d = (getattr(parsed, f).fillna(0).to_numpy(dtype=np.int64) for f in ("year", "month", "day"))
 
-        raise TypeError(
-            f"Preference_Date_And_Hour expects DATE column to be datetime or string/object, "
-            f"but got dtype={s.dtype} for column '{self.date_col}'."
-        )
+        else:
+            raise TypeError(
+                f"Preference_Date_And_Hour expects DATE column to be datetime or string/object, "
+                f"but got dtype={s.dtype} for column '{self.date_col}'."
+            )
+
+        self._date_parts = {"y": y, "m": m, "d": d, "ok": ok, "codes": codes}
+
+        if write_strings:
+            dates = pc.take(_format_dates(y, m, d, ok), _take_indices(codes))
+            self.table[self.date_col] = _string_series(dates, self.table.index)
 
-    def normalize_hour_column(self) -> str:
+        return "string"
+
+    def normalize_hour_column(self, *, write_strings: bool = False) -> str:
         """
-        Normalizes HOUR column into "HH:MM:SS" (string). Returns "string".
+        Parses the HOUR column into hour/minute/second components. Returns "string".
+
+        With `write_strings=True` the column is also normalized into
+        "HH:MM:SS" (string).
         """
         if self.hour_col not in self.table.columns:
             raise KeyError(f"Hour column not found: {self.hour_col}")
@@ -111,75 +419,33 @@ class Preference_Date_And_Hour:
 
         # datetime-like -> take time-of-day
         if pd.api.types.is_datetime64_any_dtype(s):
-            self.table[self.hour_col] = s.dt.strftime("%H:%M:%S").astype("string")
-            return "string"
-
-        # string/object -> parse by rules
-        if pd.api.types.is_string_dtype(s) or pd.api.types.is_object_dtype(s):
-
-            def _to_hhmmss(v):
-                if pd.isna(v):
-                    return pd.NA
-
-                txt = str(v).strip()
-                if txt == "":
-                    return pd.NA
-
-                # normalize separators to ':'
-                txt2 = re.sub(r"[^\d]+", ":", txt)
-                txt2 = re.sub(r":+", ":", txt2).strip(":")
-
-                parts = txt2.split(":") if ":" in txt2 else [txt2]
-
-                # no separators -> HHMMSS / HHMM / HMM / H / HH
-                if len(parts) == 1:
-                    digits = parts[0]
-                    if not digits.isdigit():
-                        return pd.NA
-
-                    if len(digits) == 6:      # HHMMSS
-                        hh, mm, ss = digits[:2], digits[2:4], digits[4:6]
-                    elif len(digits) == 4:    # HHMM
-                        hh, mm, ss = digits[:2], digits[2:4], "00"
-                    elif len(digits) == 3:    # HMM -> 9:30
-                        hh, mm, ss = digits[:1], digits[1:3], "00"
-                    elif len(digits) == 2:    # HH
-                        hh, mm, ss = digits, "00", "00"
-                    elif len(digits) == 1:    # H
-                        hh, mm, ss = digits, "00", "00"
-                    else:
-                        return pd.NA
-                else:
-                    # separators -> H:M(:S)
-                    if len(parts) == 2:
-                        hh, mm = parts
-                        ss = "00"
-                    else:
-                        hh, mm, ss = parts[0], parts[1], parts[2]
-
-                try:
-                    h = int(hh)
-                    m = int(mm)
-                    sec = int(ss)
-                except Exception:
-                    return pd.NA
-
-                if not (0 <= h <= 23 and 0 <= m <= 59 and 0 <= sec <= 59):
-                    return pd.NA
-
-                return f"{h:02d}:{m:02d}:{sec:02d}"
-
-            self.table[self.hour_col] = s.map(_to_hhmmss).astype("string")
-            return "string"
-
-        raise TypeError(
-            f"Preference_Date_And_Hour expects HOUR column to be datetime or string/object, "
-            f"but got dtype={s.dtype} for column '{self.hour_col}'."
-        )
+            ok = s.notna().to_numpy()
+            h, m, sec = (getattr(s.dt, f).fillna(0).to_numpy(dtype=np.int64) for f in ("hour", "minute", "second"))
+            codes = np.arange(len(s), dtype=np.intp)
+
+        # string/object -> parse by rules (HHMMSS, HHMM, HMM, H, separated forms)
+        elif pd.api.types.is_string_dtype(s) or pd.api.types.is_object_dtype(s):
+            (h, m, sec, ok), codes = _parse_time_of_day_codes(s)
+
+        else:
+            raise TypeError(
+                f"Preference_Date_And_Hour expects HOUR column to be datetime or string/object, "
+                f"but got dtype={s.dtype} for column '{self.hour_col}'."
+            )
+
+        self._hour_parts = {"h": h, "m": m, "s": sec, "ok": ok, "codes": codes}
+
+        if write_strings:
+            hours = pc.take(_format_times(h, m, sec, ok), _take_indices(codes))
+            self.table[self.hour_col] = _string_series(hours, self.table.index)
+
+        return "string"
 
     def create_moment_column(self, out_col: str = "moment") -> float:
         """
-        Combines normalized DATE + HOUR into a datetime column named `out_col`.
+        Combines the parsed DATE + HOUR components into a datetime64[ns] column
+        named `out_col` (epoch arithmetic, no intermediate strings).
+        Parses the columns first if that has not happened yet.
         Returns parse success rate (0..1).
         """
         if self.date_col not in self.table.columns:
@@ -187,15 +453,38 @@ class Preference_Date_And_Hour:
         if self.hour_col not in self.table.columns:
             raise KeyError(f"Hour column not found: {self.hour_col}")
 
-        date_s = self.table[self.date_col].astype("string")
-        hour_s = self.table[self.hour_col].astype("string")
+        if self._date_parts is None:
+            self.detect_date_dtype()
+        if self._hour_parts is None:
+            self.normalize_hour_column()
 
-        combined = (date_s + " " + hour_s).astype("string")
-        dt = pd.to_datetime(combined, errors="coerce", format="%Y-%m-%d %H:%M:%S")
+        dp, hp = self._date_parts, self._hour_parts
 
+        days, date_ok = _days_from_civil(dp["y"], dp["m"], dp["d"])
+        date_ok &= dp["ok"]
+        seconds = hp["h"] * 3600 + hp["m"] * 60 + hp["s"]
+
+        moment = _compose_moment(
+            _broadcast(days, dp["codes"], 0),
+            _broadcast(date_ok, dp["codes"], False),
+            _broadcast(seconds, hp["codes"], 0),
+            _broadcast(hp["ok"], hp["codes"], False),
+        )
+
+        dt = pd.Series(moment, index=self.table.index)
         self.table[out_col] = dt
         return float(dt.notna().mean()) if len(dt) else 0.0
 
+    def drop_helpers(self, keep: Sequence[str] = ("moment", "consumption_kwh")) -> pd.DataFrame:
+        """
+        Compact mode: once the moment column is built, keep only the `keep` columns
+        (the DATE / HOUR columns and every other source column are dropped) and
+        release the parsed components.
+        """
+        self._date_parts = self._hour_parts = None
+        self.table = _keep_columns(self.table, keep)
+        return self.table
+
 # ==============================================================================
 # 3) Together
 # ==============================================================================
@@ -206,8 +495,7 @@ class Preference_SingleDateTime:
 
     Goal (same spirit as Preference_Date_And_Hour):
       - Extract DATE and HOUR parts from the single column
-      - Normalize DATE  -> "YYYY-MM-DD" (string)
-      - Normalize HOUR  -> "HH:MM:SS" (string)
+      - Optionally write them as DATE -> "YYYY-MM-DD" / HOUR -> "HH:MM:SS" (string)
       - Combine into a single datetime column named "moment" (datetime64[ns], tz-naive)
     """
 
@@ -218,6 +506,10 @@ class Preference_SingleDateTime:
     # Time like 00:15 or 0:15 or 00:15:00 (also allows '.' as separator)
     _TIME = re.compile(r"(?P<h>\d{1,2})[:.](?P<mi>\d{2})(?:[:.](?P<s>\d{2}))?")
 
+    # Same date patterns, also capturing the text before/after the first match
+    _DMY_SPLIT = re.compile(r"(?s)^(?P<pre>.*?)" + _DMY.pattern + r"(?P<post>.*)$")
+    _YMD_SPLIT = re.compile(r"(?s)^(?P<pre>.*?)" + _YMD.pattern + r"(?P<post>.*)$")
+
     def __init__(
         self,
         table: pd.DataFrame,
@@ -232,73 +524,110 @@ class Preference_SingleDateTime:
         self.hour_col_out = hour_col_out
         self.out_col = out_col
 
-    @staticmethod
-    def _century_fix(y: int) -> int:
-        # 2-digit years heuristic: 00-69 -> 2000-2069, 70-99 -> 1970-1999
-        if y < 100:
-            return 2000 + y if y <= 69 else 1900 + y
-        return y
+        # Parsed components per distinct value + "codes" per row (see extract_date_and_hour)
+        self._parts: Optional[dict] = None
 
-    @staticmethod
-    def _to_hhmmss(txt: str) -> Optional[str]:
+    def _split_date_time(self, txt: pa.Array, ascii_only: bool) -> dict:
         """
-        Normalize time-ish text to HH:MM:SS.
-        Accepts:
-          - "0:15", "00:15", "00:15:00"
-          - "0015", "015", "000000" (digits only)
-          - "00-15-00" (non-digits treated as separators)
-        Returns None if cannot parse/validate.
+        Vectorized equivalent of the per-value date/time extraction rules
+        (see `extract_date_and_hour`), for an Arrow array of stripped strings.
+
+        Returns integer components (-1 where missing), validity masks and the
+        remainder text (needed for the digits-only fallback).
         """
-        if txt is None:
-            return None
-        t = str(txt).strip()
-        if t == "":
-            return None
-
-        # normalize any non-digit to ':'
-        t2 = re.sub(r"[^\d]+", ":", t)
-        t2 = re.sub(r":+", ":", t2).strip(":")
-        parts = t2.split(":") if ":" in t2 else [t2]
-
-        if len(parts) == 1:
-            digits = parts[0]
-            if not digits.isdigit():
-                return None
-            if len(digits) == 6:      # HHMMSS
-                hh, mm, ss = digits[:2], digits[2:4], digits[4:6]
-            elif len(digits) == 4:    # HHMM
-                hh, mm, ss = digits[:2], digits[2:4], "00"
-            elif len(digits) == 3:    # HMM
-                hh, mm, ss = digits[:1], digits[1:3], "00"
-            elif len(digits) == 2:    # HH
-                hh, mm, ss = digits, "00", "00"
-            elif len(digits) == 1:    # H
-                hh, mm, ss = digits, "00", "00"
-            else:
-                return None
-        else:
-            if len(parts) == 2:
-                hh, mm = parts
-                ss = "00"
-            else:
-                hh, mm, ss = parts[0], parts[1], parts[2]
+        def re2(pattern: str) -> str:
+            return _to_re2(pattern, ascii_only=ascii_only)
+
+        # find date (prefer YMD if present, else DMY); `pre`/`post` hold the
+        # text around the match so the remainder can be rebuilt column-wise
+        ymd = pc.extract_regex(txt, re2(self._YMD_SPLIT.pattern))
+        dmy = pc.extract_regex(txt, re2(self._DMY_SPLIT.pattern))
+        has_ymd = ymd.is_valid()
+
+        def _part(name: str) -> pa.Array:
+            return pc.if_else(has_ymd, pc.struct_field(ymd, name), pc.struct_field(dmy, name))
 
-        try:
-            h = int(hh); m = int(mm); s = int(ss)
-        except Exception:
-            return None
+        y = _digits_to_int(_part("y"))
+        # 2-digit years heuristic: 00-69 -> 2000-2069, 70-99 -> 1970-1999
+        y = np.where(y < 100, np.where(y <= 69, 2000 + y, 1900 + y), y)
+
+        # remove date part, then find time in the remainder
+        rest = pc.binary_join_element_wise(_part("pre"), _part("post"), " ")
+        # generic separators between date/time (comma, T, semicolon, multiple spaces...);
+        # one pass: a run of separators and/or whitespace collapses to a single space,
+        # exactly as `[T,;|]+ -> " "` followed by `\s+ -> " "` would
+        rest = pc.replace_substring_regex(rest, pattern=re2(r"(?:[T,;|]|\s)+"), replacement=" ")
+        rest = pc.utf8_trim_whitespace(rest)
+
+        tm = pc.extract_regex(rest, re2(self._TIME.pattern))
+        sec = _digits_to_int(pc.struct_field(tm, "s"))
+
+        return {
+            "date_ok": pc.or_(has_ymd, dmy.is_valid()).to_numpy(zero_copy_only=False),
+            "y": y,
+            "m": _digits_to_int(_part("m")),
+            "d": _digits_to_int(_part("d")),
+            "time_found": tm.is_valid().to_numpy(zero_copy_only=False),
+            "h": _digits_to_int(pc.struct_field(tm, "h")),
+            "mi": _digits_to_int(pc.struct_field(tm, "mi")),
+            "s": np.where(sec == -1, 0, sec),  # optional seconds group
+            "rest": rest,
+        }
+
+    def _parse_values(self, txt: pa.Array) -> dict:
+        """
+        Parse an Arrow array of stripped (typically unique) strings into date/time
+        components: {"y", "m", "d", "h", "mi", "s"} int64 arrays plus the
+        "date_ok" / "hour_ok" masks.
+        """
+        n = len(txt)
 
-        if not (0 <= h <= 23 and 0 <= m <= 59 and 0 <= s <= 59):
-            return None
+        is_ascii = pc.fill_null(pc.string_is_ascii(txt), True).to_numpy(zero_copy_only=False)
+        groups = [(np.flatnonzero(is_ascii), True), (np.flatnonzero(~is_ascii), False)]
 
-        return f"{h:02d}:{m:02d}:{s:02d}"
+        parts = {k: np.zeros(n, dtype=bool) for k in ("date_ok", "time_found")}
+        parts.update({k: np.full(n, -1, dtype=np.int64) for k in ("y", "m", "d", "h", "mi", "s")})
+        rest = np.full(n, None, dtype=object)
 
-    def extract_date_and_hour(self) -> float:
+        for idx, ascii_only in groups:
+            if len(idx) == 0:
+                continue
+            sub = self._split_date_time(txt.take(pa.array(idx)), ascii_only)
+            for key, values in sub.items():
+                if key != "rest":
+                    parts[key][idx] = values
+
+            # remainder text is only needed where the fallback below applies
+            need = sub["date_ok"] & ~sub["time_found"]
+            if need.any():
+                rest[idx[need]] = sub["rest"].filter(pa.array(need)).to_numpy(zero_copy_only=False)
+
+        h, mi, sec = parts["h"], parts["mi"], parts["s"]
+        time_found = parts.pop("time_found")
+        hour_ok = time_found & (0 <= h) & (h <= 23) & (0 <= mi) & (mi <= 59) & (0 <= sec) & (sec <= 59)
+
+        # fallback: attempt to normalize whatever is left (digits-only etc.)
+        fallback = parts["date_ok"] & ~time_found
+        if fallback.any():
+            fh, fmi, fsec, fok = _parse_time_of_day(pd.Series(rest[fallback], dtype=object))
+            h[fallback], mi[fallback], sec[fallback] = fh, fmi, fsec
+            hour_ok[fallback] = fok
+
+        parts["hour_ok"] = parts["date_ok"] & hour_ok
+        return parts
+
+    def extract_date_and_hour(self, *, write_strings: bool = False) -> float:
         """
-        Extract date+time from the single column into two columns:
+        Extract date+time components from the single column.
+        With `write_strings=True` also writes them into two columns:
           - self.date_col_out (string): YYYY-MM-DD
           - self.hour_col_out (string): HH:MM:SS
         Returns extraction success rate (both date+hour present).
+
+        Extraction runs column-wise on Arrow compute kernels. ASCII values use
+        RE2's fast ASCII classes; the (rare) non-ASCII values use the Unicode
+        translation of the same patterns, so results match Python's `re`.
+        Each distinct value is parsed once and broadcast back to its rows.
         """
         if self.datetime_col not in self.table.columns:
             raise KeyError(f"Datetime column not found: {self.datetime_col}")
@@ -307,80 +636,62 @@ class Preference_SingleDateTime:
 
         # If already datetime-like: easy split
         if pd.api.types.is_datetime64_any_dtype(s):
-            self.table[self.date_col_out] = s.dt.strftime("%Y-%m-%d").astype("string")
-            self.table[self.hour_col_out] = s.dt.strftime("%H:%M:%S").astype("string")
-            ok = self.table[self.date_col_out].notna() & self.table[self.hour_col_out].notna()
-            return float(ok.mean()) if len(s) else 0.0
+            ok = s.notna().to_numpy()
+            parts = {
+                k: getattr(s.dt, f).fillna(0).to_numpy(dtype=np.int64)
+                for k, f in (("y", "year"), ("m", "month"), ("d", "day"), ("h", "hour"), ("mi", "minute"), ("s", "second"))
+            }
+            parts.update(date_ok=ok, hour_ok=ok)
+            codes = np.arange(len(s), dtype=np.intp)
 
         # string/object expected
-        if not (pd.api.types.is_string_dtype(s) or pd.api.types.is_object_dtype(s)):
+        elif pd.api.types.is_string_dtype(s) or pd.api.types.is_object_dtype(s):
+            txt = pc.utf8_trim_whitespace(_string_array(s))
+            uniques, codes = _unique_strings(txt)
+            parts = self._parse_values(uniques)
+
+        else:
             raise TypeError(
                 f"Preference_SingleDateTime expects datetime or string/object, got dtype={s.dtype} for '{self.datetime_col}'."
             )
 
-        s_str = s.astype("string")
-        dates = []
-        hours = []
+        parts["codes"] = codes
+        self._parts = parts
 
-        for v in s_str.tolist():
-            if pd.isna(v):
-                dates.append(pd.NA)
-                hours.append(pd.NA)
-                continue
+        if write_strings:
+            rows = _take_indices(codes)
+            dates = pc.take(_format_dates(parts["y"], parts["m"], parts["d"], parts["date_ok"]), rows)
+            hours = pc.take(_format_times(parts["h"], parts["mi"], parts["s"], parts["hour_ok"]), rows)
+            self.table[self.date_col_out] = _string_series(dates, self.table.index)
+            self.table[self.hour_col_out] = _string_series(hours, self.table.index)
 
-            txt = str(v).strip()
-
-            # find date (prefer YMD if present, else DMY)
-            dm = self._YMD.search(txt) or self._DMY.search(txt)
-            if not dm:
-                dates.append(pd.NA)
-                hours.append(pd.NA)
-                continue
-
-            d = int(dm.group("d"))
-            mo = int(dm.group("m"))
-            y = self._century_fix(int(dm.group("y")))
-            date_norm = f"{y:04d}-{mo:02d}-{d:02d}"
-
-            # remove date part, then find time in the remainder
-            rest = (txt[: dm.start()] + " " + txt[dm.end() :]).strip()
-            # generic separators between date/time (comma, T, semicolon, multiple spaces...)
-            rest = re.sub(r"[T,;|]+", " ", rest)
-            rest = re.sub(r"\s+", " ", rest).strip()
-
-            tm = self._TIME.search(rest)
-            if tm:
-                h = tm.group("h")
-                mi = tm.group("mi")
-                sec = tm.group("s") or "00"
-                hour_norm = self._to_hhmmss(f"{h}:{mi}:{sec}")
-            else:
-                # fallback: attempt to normalize whatever is left (digits-only etc.)
-                hour_norm = self._to_hhmmss(rest)
-
-            dates.append(date_norm if date_norm else pd.NA)
-            hours.append(hour_norm if hour_norm else pd.NA)
-
-        self.table[self.date_col_out] = pd.Series(dates, index=self.table.index, dtype="string")
-        self.table[self.hour_col_out] = pd.Series(hours, index=self.table.index, dtype="string")
-
-        ok = self.table[self.date_col_out].notna() & self.table[self.hour_col_out].notna()
-        return float(ok.mean()) if len(s_str) else 0.0
+        ok = _broadcast(parts["hour_ok"], codes, False)
+        return float(ok.mean()) if len(s) else 0.0
 
     def create_moment_column(self) -> float:
         """
-        Combine date_norm + hour_norm into self.out_col as datetime64[ns] (tz-naive).
+        Combine the extracted components into self.out_col as datetime64[ns] (tz-naive),
+        by epoch arithmetic (no intermediate strings).
         Returns parse success rate (0..1).
         """
-        if self.date_col_out not in self.table.columns or self.hour_col_out not in self.table.columns:
+        if self._parts is None:
             _ = self.extract_date_and_hour()
 
-        date_s = self.table[self.date_col_out].astype("string")
-        hour_s = self.table[self.hour_col_out].astype("string")
-
-        combined = (date_s + " " + hour_s).astype("string")
-        dt = pd.to_datetime(combined, errors="coerce", format="%Y-%m-%d %H:%M:%S")
+        p = self._parts
+        days, date_ok = _days_from_civil(p["y"], p["m"], p["d"])
+        seconds = p["h"] * 3600 + p["mi"] * 60 + p["s"]
+        moment = _compose_moment(days, date_ok & p["date_ok"], seconds, p["hour_ok"])
 
+        dt = pd.Series(_broadcast(moment, p["codes"], np.datetime64("NaT", "ns")), index=self.table.index)
         self.table[self.out_col] = dt
         return float(dt.notna().mean()) if len(dt) else 0.0
 
+    def drop_helpers(self, keep: Sequence[str] = ("moment", "consumption_kwh")) -> pd.DataFrame:
+        """
+        Compact mode: once the moment column is built, keep only the `keep` columns
+        (the datetime column, date_norm / hour_norm and every other source column
+        are dropped) and release the extracted components.
+        """
+        self._parts = None
+        self.table = _keep_columns(self.table, keep)
+        return self.table
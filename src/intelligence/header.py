@@ -1,6 +1,11 @@
+import re
+
+import numpy as np
 import pandas as pd
 from typing import Optional
 
+from src.data_core.reader import ARROW_STRING
+
 
 class HeaderDetector:
     """
@@ -8,6 +13,10 @@ class HeaderDetector:
 
     The detector looks for rows that contain both time-related and
     consumption-related keywords and treats the best matching row as the header.
+
+    Only the first `max_scan_rows` rows are searched (None = all rows), in
+    blocks of `scan_window` rows with vectorized per-column keyword matching;
+    the search stops at the first row with the maximum score of 2.
     """
 
     # Keywords used to identify time-related columns
@@ -24,14 +33,24 @@ class HeaderDetector:
         "wirkleistung",
     ]
 
-    def __init__(self, table: pd.DataFrame) -> None:
+    def __init__(self, table: pd.DataFrame, max_scan_rows: Optional[int] = None, scan_window: int = 50) -> None:
         """
         Parameters
         ----------
         table : pd.DataFrame
             Raw table where the header row may not yet be set as column names.
+        max_scan_rows : int, optional
+            Number of leading rows searched for the header (None = all rows;
+            a full scan still stops at the first row with both kinds of keywords).
+        scan_window : int
+            Number of rows scored per vectorized block.
         """
         self.table = table
+        self.max_scan_rows = max_scan_rows
+        self.scan_window = scan_window
+
+        # Position of the detected header row in the original table (set by apply_header)
+        self.header_row: Optional[int] = None
 
     @staticmethod
     def _norm(x) -> str:
@@ -46,13 +65,44 @@ class HeaderDetector:
             return ""
         return str(x).strip().lower()
 
+    def _score_rows(self, block: pd.DataFrame) -> np.ndarray:
+        """
+        Score every row of `block`: +1 if any cell contains a time keyword,
+        +1 if any cell contains a consumption keyword.
+
+        Keywords never contain whitespace or "|", so matching cell by cell
+        (column-wise, vectorized) is the same as searching the joined row text.
+        """
+        time_pat = "|".join(re.escape(k) for k in self.TIME_KEYS)
+        cons_pat = "|".join(re.escape(k) for k in self.CONS_KEYS)
+
+        time_hit = np.zeros(len(block), dtype=bool)
+        cons_hit = np.zeros(len(block), dtype=bool)
+
+        for j in range(block.shape[1]):
+            col = block.iloc[:, j]
+            if col.dtype == ARROW_STRING:
+                # Arrow kernels (lower + RE2 match); missing cells never match
+                text = col.str.lower()
+                time_hit |= text.str.contains(time_pat, regex=True).fillna(False).to_numpy(dtype=bool)
+                cons_hit |= text.str.contains(cons_pat, regex=True).fillna(False).to_numpy(dtype=bool)
+                continue
+
+            text = col.astype(str).str.lower().where(col.notna(), "")
+            time_hit |= text.str.contains(time_pat, regex=True).to_numpy(dtype=bool)
+            cons_hit |= text.str.contains(cons_pat, regex=True).to_numpy(dtype=bool)
+
+        return time_hit.astype(int) + cons_hit.astype(int)
+
     def find_header_row(self) -> int:
         """
-        Scan all rows and return the index of the row
-        that looks most like a header.
+        Scan the leading rows (up to `max_scan_rows`) and return the index of
+        the row that looks most like a header.
 
         A row is scored based on whether it contains any
         time-related and/or consumption-related keywords.
+        The first row with the best score wins; the scan stops as soon as
+        a row reaches the maximum score of 2.
 
         Returns
         -------
@@ -67,25 +117,29 @@ class HeaderDetector:
         best_row: Optional[int] = None
         best_score = 0
 
-        for i in range(len(self.table)):
-            # Normalize all values in this row
-            row_vals = [self._norm(v) for v in self.table.iloc[i]]
-
-            # Join them into a single string for simple substring search
-            row_text = " | ".join(row_vals)
+        n_rows = len(self.table)
+        if self.max_scan_rows is not None:
+            n_rows = min(n_rows, self.max_scan_rows)
 
-            # Check if any time keyword appears anywhere in this row
-            time_hit = any(k in row_text for k in self.TIME_KEYS)
-            # Check if any consumption keyword appears anywhere in this row
-            cons_hit = any(k in row_text for k in self.CONS_KEYS)
+        for start in range(0, n_rows, self.scan_window):
+            scores = self._score_rows(self.table.iloc[start : min(start + self.scan_window, n_rows)])
 
-            score = int(time_hit) + int(cons_hit)
+            # First row with the highest score in this block
+            i = int(np.argmax(scores))
+            if scores[i] > best_score:
+                best_score = int(scores[i])
+                best_row = start + i
 
-            if score > best_score:
-                best_score = score
-                best_row = i
+            # Nothing can beat a row with both time and consumption keywords
+            if best_score == 2:
+                break
 
         if best_row is None:
+            if n_rows < len(self.table):
+                raise ValueError(
+                    f"Header row could not be detected in the first {n_rows} rows; "
+                    "pass max_scan_rows=None to search the whole table."
+                )
             raise ValueError("Header row could not be detected in the DataFrame.")
 
         return best_row
@@ -121,5 +175,6 @@ class HeaderDetector:
 
         # Update internal state
         self.table = new_table
+        self.header_row = hdr_idx
 
         return new_table
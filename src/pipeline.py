@@ -0,0 +1,237 @@
+# src/pipeline.py
+"""
+UI-free processing chain, shared by the Streamlit app and the batch CLI:
+
+    DataReader -> TableRefiner -> HeaderDetector -> TableRefiner
+    -> ConsumptionColumnDetector -> TimeColumnDetector
+    -> time preference (single datetime / date + hour) -> final cleanup
+"""
+from __future__ import annotations
+
+from typing import Optional, Tuple
+
+import pandas as pd
+
+from src.data_core.reader import DataReader
+from src.data_core.adjustments import TableRefiner
+from src.data_core.cache import PipelineCache
+from src.profiling import PipelineProfiler
+from src.intelligence.header import HeaderDetector
+from src.intelligence.columns import ConsumptionColumnDetector, TimeColumnDetector
+from src.intelligence.columns.time import (
+    Preference_Date_And_Hour,
+    Preference_SingleDateTime,
+)
+
+
+# Supported time interpretations (same options as the app)
+TIME_MODES = ("single", "date_hour")
+
+
+def run_automatic_pipeline(
+    file_path: str,
+    cache: Optional[PipelineCache] = None,
+    sheet_name=None,
+    profiler: Optional[PipelineProfiler] = None,
+    arrow_strings: bool = False,
+) -> dict:
+    """
+    Read + clean + detect header / consumption / time candidates.
+
+    `sheet_name` must be settled by the caller for multi-sheet workbooks
+    (otherwise DataReader asks in the Streamlit UI).
+    With a `cache`, the same bytes + sheet return the stored result.
+    Per-stage timing / memory records are in summary["stages"] (see src/profiling.py).
+    With `arrow_strings`, text columns stay Arrow-backed (string[pyarrow]) from
+    reading through detection (see DataReader).
+    """
+    profiler = profiler if profiler is not None else PipelineProfiler()
+    reader = DataReader(file_path, sheet_name=sheet_name, arrow_strings=arrow_strings)
+
+    # Same bytes + same sheet -> reuse the stored result (no re-read / re-detect)
+    cache_key = None
+    if cache is not None:
+        with profiler.stage("cache_lookup"):
+            cache_key = cache.file_key(
+                file_path, reader.sheet_name, variant="arrow_strings" if arrow_strings else None
+            )
+            cached = cache.get(cache_key)
+        if cached is not None:
+            summary = cached.setdefault("summary", {})
+            summary["cached"] = True
+            summary["stages"] = profiler.as_dicts()
+            summary["total_seconds"] = profiler.total_wall_s()
+            return cached
+
+    with profiler.stage("read") as stage:
+        df_processed = reader.read_data()
+
+        table = getattr(reader, "table", None)
+        if table is None:
+            table = df_processed
+        stage.output(table)
+
+    raw_table = table.copy()
+    raw_shape = raw_table.shape
+
+    with profiler.stage("clean1", table) as stage:
+        refiner1 = TableRefiner(table)
+        refiner1.clean_table()
+        table = refiner1.table
+        stage.output(table)
+    clean1_shape = table.shape
+
+    with profiler.stage("header", table) as stage:
+        header_det = HeaderDetector(table)
+        header_det.apply_header()
+        table = header_det.table
+        stage.output(table)
+    header_shape = table.shape
+
+    # Reuse the cell masks from the first pass: only the rows/columns touched
+    # by the header change are re-evaluated.
+    with profiler.stage("clean2", table) as stage:
+        refiner2 = refiner1.rebase_after_header(table, header_det.header_row)
+        refiner2.clean_table()
+        table = refiner2.table
+        stage.output(table)
+    clean2_shape = table.shape
+
+    with profiler.stage("consumption", table) as stage:
+        cons_det = ConsumptionColumnDetector(table)
+        consumption_col = cons_det.detect_consumption_column()
+        _cons_kwh_series = cons_det.to_kwh()
+        final_table = cons_det.table
+        stage.output(final_table)
+    final_shape = final_table.shape
+
+    with profiler.stage("time_detect", final_table) as stage:
+        time_det = TimeColumnDetector(final_table)
+        time_candidates = time_det.detect_time_columns()
+        stage.output(final_table)
+
+    summary = {
+        "raw_shape": raw_shape,
+        "clean1_shape": clean1_shape,
+        "header_shape": header_shape,
+        "clean2_shape": clean2_shape,
+        "final_shape": final_shape,
+        "consumption_col": consumption_col,
+        "time_candidates_count": len(time_candidates) if time_candidates else 0,
+        "cached": False,
+        "stages": profiler.as_dicts(),
+        "total_seconds": profiler.total_wall_s(),
+    }
+
+    results = {
+        "df_raw": raw_table,
+        "df_processed": final_table,
+        "consumption_col": consumption_col,
+        "consumption_unit": cons_det.consumption_unit,
+        "time_candidates": time_candidates,
+        "summary": summary,
+    }
+
+    if cache is not None:
+        try:
+            cache.put(cache_key, results)
+        except Exception:
+            pass  # caching is best-effort
+
+    return results
+
+
+def apply_time_preference(
+    table: pd.DataFrame,
+    mode: str,
+    *,
+    datetime_col: Optional[str] = None,
+    date_col: Optional[str] = None,
+    hour_col: Optional[str] = None,
+    profiler: Optional[PipelineProfiler] = None,
+    compact: bool = False,
+    float32: bool = False,
+) -> Tuple[pd.DataFrame, float]:
+    """
+    Build the "moment" column from the chosen time interpretation and keep
+    only moment + consumption_kwh.
+
+    Returns (table, nat_rate): nat_rate is the share of rows (0..1) whose
+    moment could not be parsed (NaT); it is also in the "time_parse" stage notes.
+
+    mode:
+      - "single":    one column with date and hour (`datetime_col`)
+      - "date_hour": a DATE column + an HOUR column (`date_col`, `hour_col`)
+
+    With a `profiler`, the "time_parse" and "keep_columns" stages are recorded.
+
+    compact: drop every column but moment + consumption_kwh as soon as "moment"
+             is built, and report the table memory before / after (in the
+             "keep_columns" stage notes, in MB).
+    float32: (compact only) store consumption_kwh as float32 when that keeps the
+             meter resolution (see TableRefiner.compact_dtypes).
+    """
+    if mode not in TIME_MODES:
+        raise ValueError(f"Unknown time mode: {mode!r}. Expected one of {TIME_MODES}.")
+    profiler = profiler if profiler is not None else PipelineProfiler(sample_interval=None)
+
+    with profiler.stage("time_parse", table) as stage:
+        if mode == "single":
+            if datetime_col is None:
+                raise ValueError("Time mode 'single' needs `datetime_col`.")
+            pref = Preference_SingleDateTime(table, datetime_col=datetime_col)
+            pref.extract_date_and_hour()
+            parsed_rate = pref.create_moment_column()
+
+        else:
+            if date_col is None or hour_col is None:
+                raise ValueError("Time mode 'date_hour' needs `date_col` and `hour_col`.")
+            pref = Preference_Date_And_Hour(table, date_col=date_col, hour_col=hour_col)
+            pref.detect_date_dtype()
+            pref.normalize_hour_column()
+            parsed_rate = pref.create_moment_column(out_col="moment")
+
+        nat_rate = 1.0 - parsed_rate if len(table) else 0.0
+        stage.notes["nat_rate"] = round(nat_rate, 4)
+
+        if compact:
+            bytes_in_flight = TableRefiner.memory_bytes(pref.table)
+            pref.drop_helpers(keep=("moment", "consumption_kwh"))
+        stage.output(pref.table)
+
+    with profiler.stage("keep_columns", pref.table) as stage:
+        refiner = TableRefiner(pref.table)
+        refiner.keep_only_moment_and_consumption(
+            moment_col="moment",
+            consumption_col="consumption_kwh",
+        )
+        refiner.drop_trailing_empty_rows()
+        refiner.drop_empty_columns()
+
+        if compact:
+            report = refiner.compact_dtypes(consumption_col="consumption_kwh", float32=float32)
+            stage.notes.update(
+                memory_before_mb=round(bytes_in_flight / 1024**2, 2),
+                memory_after_mb=round(report["bytes_after"] / 1024**2, 2),
+                float32=report["float32"],
+            )
+            if report["reason"]:
+                stage.notes["float32_refused"] = report["reason"]
+        stage.output(refiner.table)
+    return refiner.table, nat_rate
+
+
+def finalize_table(table: pd.DataFrame, profiler: Optional[PipelineProfiler] = None) -> pd.DataFrame:
+    """
+    Final touches on the moment + consumption_kwh table (as in the app's final step):
+    the "first :15 / last :00 -> minus 15 minutes" rule, then empty row/column cleanup.
+    """
+    profiler = profiler if profiler is not None else PipelineProfiler(sample_interval=None)
+
+    with profiler.stage("finalize", table) as stage:
+        refiner = TableRefiner(table)
+        refiner.shift_moment_minus_15_if_first15_last00(moment_col="moment")
+        refiner.drop_trailing_empty_rows()
+        refiner.drop_empty_columns()
+        stage.output(refiner.table)
+    return refiner.table
@@ -14,11 +14,20 @@ class DataPlotter:
       - plot_full() -> matplotlib Figure
       - total_weeks() -> int
       - plot_last_week() -> dict(fig, week_index, start, end, total_weeks)
+      - plot_week(week_index) -> dict(fig, week_index, start, end, total_weeks)
       - plot_random_week() -> dict(fig, week_index, start, end, total_weeks)
+
+    plot_full() decimates long series to about one bucket per horizontal pixel
+    of the rendered image (first/last/min/max of each bucket, so peaks and
+    troughs stay visible); pixels are counted at `render_dpi`, the dpi the
+    figure is saved / shown with (200, as st.pyplot and PlotRenderCache).
+    `decimate=False` draws every point.
     """
 
-    def __init__(self, dataframe: pd.DataFrame):
+    def __init__(self, dataframe: pd.DataFrame, decimate: bool = True, render_dpi: float = 200):
         self.df = dataframe.copy()
+        self.decimate = decimate
+        self.render_dpi = render_dpi
         self._prepare()
 
     def _prepare(self) -> None:
@@ -30,18 +39,68 @@ class DataPlotter:
 
         self.df = self.df.dropna(subset=["moment", "consumption_kwh"]).sort_values("moment")
 
-        # Week grouping: Monday->Sunday weeks (pandas default 'W' ends on Sunday)
-        self.df["_week_start"] = self.df["moment"].dt.to_period("W").apply(lambda p: p.start_time)
+        # Week grouping: Monday->Sunday weeks (floor to Monday 00:00)
+        moment = self.df["moment"]
+        self.df["_week_start"] = moment.dt.normalize() - pd.to_timedelta(moment.dt.dayofweek, unit="D")
 
-        self._weeks_sorted = sorted(self.df["_week_start"].dropna().unique().tolist())
-        self._week_to_index = {ws: i + 1 for i, ws in enumerate(self._weeks_sorted)}
+        # Data is sorted by moment, so each week is one contiguous block of rows:
+        # week i spans rows _week_offsets[i] : _week_offsets[i + 1]
+        week_values = self.df["_week_start"].values
+        is_new_week = np.r_[True, week_values[1:] != week_values[:-1]] if len(week_values) else np.array([], bool)
+        self._weeks_sorted = pd.DatetimeIndex(self.df["_week_start"][is_new_week])
+        self._week_offsets = np.r_[
+            np.searchsorted(self.df["moment"].values, self._weeks_sorted.values, side="left"),
+            len(self.df),
+        ]
 
     def total_weeks(self) -> int:
         return len(self._weeks_sorted)
 
-    def plot_full(self):
+    @staticmethod
+    def _minmax_indices(x: np.ndarray, y: np.ndarray, n_buckets: int) -> np.ndarray:
+        """
+        Indices to keep from a sorted series: split the x range into `n_buckets`
+        equal-width buckets and keep the first, last, min and max point of each.
+        The line drawn through them covers the same pixels as the full series.
+        """
+        xi = x.view("i8") if x.dtype.kind == "M" else x.astype("f8")
+        edges = np.linspace(xi[0], xi[-1], n_buckets + 1)[1:-1]
+        starts = np.unique(np.r_[0, np.searchsorted(xi, edges, side="left")])
+        starts = starts[starts < len(xi)]
+        ends = np.r_[starts[1:], len(xi)] - 1
+
+        # Bucket id of every point, then the first min / max position per bucket
+        bucket = np.repeat(np.arange(len(starts)), np.diff(np.r_[starts, len(xi)]))
+        mins = np.minimum.reduceat(y, starts)
+        maxs = np.maximum.reduceat(y, starts)
+
+        hit_min = np.flatnonzero(y == mins[bucket])
+        hit_max = np.flatnonzero(y == maxs[bucket])
+        i_min = hit_min[np.unique(bucket[hit_min], return_index=True)[1]]
+        i_max = hit_max[np.unique(bucket[hit_max], return_index=True)[1]]
+
+        return np.unique(np.concatenate([starts, ends, i_min, i_max]))
+
+    def plot_full(self, decimate: bool = None, render_dpi: float = None):
+        """
+        Full time range. `decimate` / `render_dpi` override the instance settings for this plot.
+        """
+        decimate = self.decimate if decimate is None else decimate
+        render_dpi = self.render_dpi if render_dpi is None else render_dpi
+
         fig, ax = plt.subplots(figsize=(10, 5))
-        ax.plot(self.df["moment"], self.df["consumption_kwh"], label="Full Data")
+        x = self.df["moment"].to_numpy()
+        y = self.df["consumption_kwh"].to_numpy(dtype="f8")
+
+        # About one bucket per output pixel of the axes width (4 points per bucket at most);
+        # the figure's own dpi (100) would give half the pixels of a 200 dpi render
+        axes_inches = ax.get_position().width * fig.get_figwidth()
+        n_buckets = max(int(axes_inches * render_dpi), 1)
+        if decimate and len(x) > 4 * n_buckets:
+            keep = self._minmax_indices(x, y, n_buckets)
+            x, y = x[keep], y[keep]
+
+        ax.plot(x, y, label="Full Data")
         ax.set_xlabel("Moment")
         ax.set_ylabel("Consumption (kWh)")
         ax.set_title("Full time range")
@@ -49,8 +108,12 @@ class DataPlotter:
         fig.autofmt_xdate()
         return fig
 
-    def _plot_week_start(self, week_start: pd.Timestamp):
-        week_data = self.df[self.df["_week_start"] == week_start].copy()
+    def _plot_week(self, i: int):
+        """
+        Plot week i (0-based position in `_weeks_sorted`); the rows are a slice, not a copy.
+        """
+        a, b = self._week_offsets[i], self._week_offsets[i + 1]
+        week_data = self.df.iloc[a:b]
         if week_data.empty:
             raise ValueError("Selected week has no data to plot.")
 
@@ -59,32 +122,55 @@ class DataPlotter:
         ax.set_xlabel("Moment")
         ax.set_ylabel("Consumption (kWh)")
 
-        week_index = self._week_to_index.get(week_start, None)
+        week_index = i + 1
         ax.set_title(f"Week {week_index} / {self.total_weeks()}")
         ax.legend()
         fig.autofmt_xdate()
 
-        start = week_data["moment"].min()
-        end = week_data["moment"].max()
+        # Rows are sorted by moment: first / last row are the week's bounds
+        start = week_data["moment"].iloc[0]
+        end = week_data["moment"].iloc[-1]
 
         info = {
             "fig": fig,
-            "week_index": int(week_index) if week_index is not None else None,
+            "week_index": int(week_index),
             "start": str(start),
             "end": str(end),
             "total_weeks": self.total_weeks(),
         }
         return info
 
+    def _plot_week_start(self, week_start: pd.Timestamp):
+        i = self._weeks_sorted.searchsorted(pd.Timestamp(week_start))
+        if i >= self.total_weeks() or self._weeks_sorted[i] != week_start:
+            raise ValueError("Selected week has no data to plot.")
+        return self._plot_week(int(i))
+
     def plot_last_week(self):
-        if not self._weeks_sorted:
+        if not self.total_weeks():
             raise ValueError("No weekly segments found in the dataset.")
-        last_week_start = self._weeks_sorted[-1]
-        return self._plot_week_start(last_week_start)
-
-    def plot_random_week(self):
-        if not self._weeks_sorted:
+        return self._plot_week(self.total_weeks() - 1)
+
+    def plot_week(self, week_index: int):
+        """
+        Plot the week with 1-based `week_index` (as shown in the titles).
+        """
+        if not 1 <= week_index <= self.total_weeks():
+            raise ValueError(f"Week index must be between 1 and {self.total_weeks()}.")
+        return self._plot_week(int(week_index) - 1)
+
+    @staticmethod
+    def pick_random_week(total_weeks: int) -> int:
+        """
+        Random 1-based week index out of `total_weeks` (no plotter needed).
+        """
+        if not total_weeks:
             raise ValueError("No weekly segments found in the dataset.")
         rng = np.random.default_rng()
-        random_week_start = rng.choice(self._weeks_sorted)
-        return self._plot_week_start(random_week_start)
+        return int(rng.integers(total_weeks)) + 1
+
+    def random_week_index(self) -> int:
+        return self.pick_random_week(self.total_weeks())
+
+    def plot_random_week(self):
+        return self.plot_week(self.random_week_index())
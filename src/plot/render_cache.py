@@ -0,0 +1,81 @@
+# src/plot/render_cache.py
+from __future__ import annotations
+
+import hashlib
+import io
+import threading
+from collections import OrderedDict
+from typing import Callable, Optional, Tuple
+
+import matplotlib.pyplot as plt
+import pandas as pd
+
+
+class PlotRenderCache:
+    """
+    Bounded LRU cache of rendered plots as PNG bytes.
+
+    - Key: (data hash, view, week index), e.g. (key, "full", None) or (key, "week", 12).
+    - A miss calls `build()`, rasterizes the figure and closes it right away,
+      so no matplotlib figure outlives a render.
+    - Safe to share between Streamlit sessions (one lock around the LRU).
+    """
+
+    def __init__(self, max_entries: int = 64, dpi: int = 200):
+        self.max_entries = max_entries
+        self.dpi = dpi
+        self._entries: "OrderedDict[tuple, Tuple[bytes, dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def data_key(table: pd.DataFrame, columns=("moment", "consumption_kwh")) -> str:
+        """
+        Content hash of the plotted columns (row order matters, the index does not).
+        """
+        cols = [c for c in columns if c in table.columns]
+        row_hashes = pd.util.hash_pandas_object(table[cols], index=False).to_numpy()
+        h = hashlib.blake2b(row_hashes.tobytes(), digest_size=16)
+        h.update(repr((cols, table.shape)).encode())
+        return h.hexdigest()
+
+    def get(self, key: tuple) -> Optional[Tuple[bytes, dict]]:
+        with self._lock:
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def put(self, key: tuple, png: bytes, info: dict) -> None:
+        with self._lock:
+            self._entries[key] = (png, info)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def render(self, key: tuple, build: Callable) -> Tuple[bytes, dict]:
+        """
+        (png_bytes, info) for `key`. `build()` returns a Figure or a DataPlotter
+        info dict with a "fig" entry; the returned info never holds the figure.
+        """
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+
+        result = build()
+        info = dict(result) if isinstance(result, dict) else {"fig": result}
+        fig = info.pop("fig")
+
+        try:
+            buf = io.BytesIO()
+            # Same output as st.pyplot (tight box, 200 dpi)
+            fig.savefig(buf, format="png", dpi=self.dpi, bbox_inches="tight")
+        finally:
+            plt.close(fig)
+
+        png = buf.getvalue()
+        self.put(key, png, info)
+        return png, info
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,162 @@
+# src/profiling.py
+"""
+Lightweight per-stage instrumentation for the processing chain.
+
+    profiler = PipelineProfiler()
+    with profiler.stage("read") as stage:
+        table = reader.read_data()
+        stage.output(table)
+
+Each stage records wall time, CPU time (process-wide), rows/columns in and out,
+and RSS before/after/peak (psutil; the peak comes from a background sampler
+thread). Records go into the pipeline summary as plain dicts and can be
+appended to a JSON-lines file for monitoring.
+"""
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import List, Optional
+
+import psutil
+
+_MB = 1024 * 1024
+
+
+@dataclass
+class StageRecord:
+    stage: str
+    wall_s: float = 0.0
+    cpu_s: float = 0.0
+    rows_in: Optional[int] = None
+    cols_in: Optional[int] = None
+    rows_out: Optional[int] = None
+    cols_out: Optional[int] = None
+    rss_start_mb: float = 0.0
+    rss_end_mb: float = 0.0
+    rss_delta_mb: float = 0.0
+    rss_peak_mb: float = 0.0
+    notes: dict = field(default_factory=dict)  # stage-specific extras (e.g. memory report)
+
+    def input(self, table) -> None:
+        self.rows_in, self.cols_in = _shape(table)
+
+    def output(self, table) -> None:
+        self.rows_out, self.cols_out = _shape(table)
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    def text(self) -> str:
+        shape_in = f"{self.rows_in}x{self.cols_in}" if self.rows_in is not None else "-"
+        shape_out = f"{self.rows_out}x{self.cols_out}" if self.rows_out is not None else "-"
+        notes = "".join(f", {k}={v}" for k, v in self.notes.items())
+        return (
+            f"{self.stage}: {self.wall_s:.3f}s wall, {self.cpu_s:.3f}s cpu, "
+            f"{shape_in} -> {shape_out}, RSS {self.rss_delta_mb:+.1f} MB (peak {self.rss_peak_mb:.1f} MB){notes}"
+        )
+
+
+def _shape(table):
+    shape = getattr(table, "shape", None)
+    if shape is None:
+        return None, None
+    return int(shape[0]), int(shape[1]) if len(shape) > 1 else 1
+
+
+class _RssSampler(threading.Thread):
+    """
+    Polls the process RSS every `interval` seconds and keeps the maximum.
+    """
+
+    def __init__(self, process: psutil.Process, interval: float):
+        super().__init__(name="rss-sampler", daemon=True)
+        self.process = process
+        self.interval = interval
+        self.peak = process.memory_info().rss
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            rss = self.process.memory_info().rss
+            if rss > self.peak:
+                self.peak = rss
+
+    def stop(self) -> None:
+        self._stop_event.set()
+
+
+@dataclass
+class PipelineProfiler:
+    """
+    Collects one StageRecord per `stage(...)` block (stages are not nested).
+    `sample_interval=None` disables the peak sampler (peak = max(start, end) RSS).
+    """
+    sample_interval: Optional[float] = 0.01
+    records: List[StageRecord] = field(default_factory=list)
+
+    def __post_init__(self):
+        self._process = psutil.Process(os.getpid())
+
+    @contextmanager
+    def stage(self, name: str, table=None):
+        record = StageRecord(stage=name)
+        if table is not None:
+            record.input(table)
+
+        rss_start = self._process.memory_info().rss
+        sampler = None
+        if self.sample_interval:
+            sampler = _RssSampler(self._process, self.sample_interval)
+            sampler.start()
+
+        wall0, cpu0 = time.perf_counter(), time.process_time()
+        try:
+            yield record
+        finally:
+            record.wall_s = round(time.perf_counter() - wall0, 4)
+            record.cpu_s = round(time.process_time() - cpu0, 4)
+
+            rss_end = self._process.memory_info().rss
+            peak = max(rss_start, rss_end)
+            if sampler is not None:
+                sampler.stop()
+                sampler.join()
+                peak = max(peak, sampler.peak)
+
+            record.rss_start_mb = round(rss_start / _MB, 2)
+            record.rss_end_mb = round(rss_end / _MB, 2)
+            record.rss_delta_mb = round((rss_end - rss_start) / _MB, 2)
+            record.rss_peak_mb = round(peak / _MB, 2)
+            self.records.append(record)
+
+    def as_dicts(self) -> List[dict]:
+        return [r.to_dict() for r in self.records]
+
+    def total_wall_s(self) -> float:
+        return round(sum(r.wall_s for r in self.records), 4)
+
+    def lines(self) -> List[str]:
+        return [r.text() for r in self.records]
+
+    @staticmethod
+    def record_text(record: dict) -> str:
+        """
+        One-line text for a stage record stored as a dict (e.g. summary["stages"]).
+        """
+        return StageRecord(**record).text()
+
+    @staticmethod
+    def write_jsonl(path: str, stages: List[dict], **context) -> None:
+        """
+        Append one JSON object per stage to `path`, each with `context` (e.g. file, run id)
+        and a timestamp.
+        """
+        ts = time.strftime("%Y-%m-%dT%H:%M:%S%z")
+        with open(path, "a", encoding="utf-8") as f:
+            for stage in stages:
+                f.write(json.dumps({"ts": ts, **context, **stage}, default=str) + "\n")
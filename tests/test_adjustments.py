@@ -0,0 +1,112 @@
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data_core.adjustments import TableRefiner, _cell_masks
+from src.data_core.reader import ARROW_STRING
+
+
+def _reference_empty(x) -> bool:
+    # The original per-cell rule
+    if pd.isna(x):
+        return True
+    return isinstance(x, str) and x.strip() == ""
+
+
+def _reference_mask(table: pd.DataFrame) -> np.ndarray:
+    return table.map(_reference_empty).to_numpy(dtype=bool)
+
+
+def _raw_sheet() -> pd.DataFrame:
+    """
+    A raw Excel-like read: preamble + header strings above numbers, blank cells,
+    an all-blank column and trailing blank rows.
+    """
+    return pd.DataFrame(
+        {
+            0: ["Zählpunkt", None, "Datum", "01.01.2024", "01.01.2024", "   ", None, ""],
+            1: ["DE000123", None, "Verbrauch", 1.25, 0.0, np.nan, None, None],
+            2: [None, None, "Zähler", 7, 8, "", None, "\t"],
+            3: [None, " ", "", None, "　", None, None, None],
+            4: [None, None, "Zeit", datetime(2024, 1, 1, 0, 15), pd.Timestamp("2024-01-01 00:30"), None, None, None],
+        }
+    )
+
+
+@pytest.mark.parametrize("dtype", [object, ARROW_STRING])
+def test_cell_masks_match_reference(dtype):
+    table = _raw_sheet()
+    if dtype is ARROW_STRING:
+        table[0] = table[0].astype(ARROW_STRING)
+
+    nan_mask, empty_mask = _cell_masks(table)
+
+    np.testing.assert_array_equal(nan_mask, table.isna().to_numpy())
+    np.testing.assert_array_equal(empty_mask, _reference_mask(table))
+
+
+def test_cell_masks_mixed_numbers_are_never_blank():
+    # Header string above floats: the numbers must not be stringified or flagged
+    values = np.empty(1001, dtype=object)
+    values[0] = "Verbrauch (kWh)"
+    values[1:] = np.linspace(0.0, 1.0, 1000)
+    values[10] = "  "
+    values[20] = np.nan
+    table = pd.DataFrame({"c": values})
+
+    _, empty_mask = _cell_masks(table)
+
+    assert empty_mask[:, 0].nonzero()[0].tolist() == [10, 20]
+
+
+def test_clean_table_drops_blank_columns_and_trailing_rows():
+    table = _raw_sheet()
+
+    cleaned = TableRefiner(table).clean_table()
+
+    assert list(cleaned.columns) == [0, 1, 2, 4]
+    assert cleaned.index.tolist() == [0, 2, 3, 4]
+
+
+def _final_table() -> pd.DataFrame:
+    moments = pd.date_range("2024-01-01 00:15", periods=8, freq="15min")
+    return pd.DataFrame({"moment": moments, "consumption_kwh": np.arange(8) / 4, "note": ""})
+
+
+@pytest.mark.parametrize(
+    "edit",
+    [
+        lambda r: r.keep_only_moment_and_consumption(),
+        lambda r: r.compact_dtypes(float32=True),
+        lambda r: r.shift_moment_minus_15_if_first15_last00(),
+    ],
+    ids=["keep_only", "compact_dtypes", "shift_moment"],
+)
+def test_table_edits_invalidate_cached_masks(edit):
+    refiner = TableRefiner(_final_table())
+    refiner.table.iloc[-1, 1] = np.nan
+    refiner._get_masks()
+
+    edit(refiner)
+
+    assert refiner._empty_mask is None
+    nan_mask, empty_mask = refiner._get_masks()
+    expected_nan, expected_empty = _cell_masks(refiner.table)
+    np.testing.assert_array_equal(nan_mask, expected_nan)
+    np.testing.assert_array_equal(empty_mask, expected_empty)
+
+
+def test_take_keeps_cached_masks_aligned():
+    table = _final_table()
+    table.loc[6:, "consumption_kwh"] = np.nan
+    table.loc[6:, "moment"] = pd.NaT
+    refiner = TableRefiner(table)
+
+    refiner.drop_trailing_empty_rows()
+    refiner.drop_empty_columns()
+
+    assert list(refiner.table.columns) == ["moment", "consumption_kwh"]
+    assert len(refiner.table) == 6
+    np.testing.assert_array_equal(refiner._get_masks()[1], _cell_masks(refiner.table)[1])
@@ -0,0 +1,32 @@
+from src.cli import process_file
+
+
+def _write_export(path, bad_rows: int) -> str:
+    lines = ["Datum;Uhrzeit;Verbrauch (kWh)"]
+    lines += [f"01.01.2024;{i // 4:02d}:{i % 4 * 15:02d};1,5" for i in range(96)]
+    lines += ["xx;yy;1,5"] * bad_rows
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return str(path)
+
+
+def test_process_file_reports_nat_rate(tmp_path):
+    src = _write_export(tmp_path / "good.csv", bad_rows=0)
+
+    summary = process_file(src, {}, "csv", str(tmp_path / "out"), use_cache=False)
+
+    assert summary["status"] == "ok", summary["error"]
+    assert summary["nat_rate"] == 0.0
+    assert summary["rows"] == 96
+
+
+def test_process_file_fails_above_max_nat_rate(tmp_path):
+    src = _write_export(tmp_path / "bad.csv", bad_rows=20)
+
+    failed = process_file(src, {}, "csv", str(tmp_path / "out"), use_cache=False)
+    allowed = process_file(src, {}, "csv", str(tmp_path / "out"), use_cache=False, max_nat_rate=1.0)
+
+    assert failed["status"] == "error"
+    assert failed["output"] is None
+    assert "could not be parsed" in failed["error"]
+    assert failed["nat_rate"] == round(20 / 116, 4)
+    assert allowed["status"] == "ok"
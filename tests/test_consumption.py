@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+
+from src.intelligence.columns.consumption import ConsumptionColumnDetector, _coerce_numeric
+
+
+def _full_scores(table: pd.DataFrame) -> str:
+    """
+    Reference: every column scored on its full length (no sampling).
+    """
+    det = ConsumptionColumnDetector(table)
+    best, best_score = None, (-1, -1, -1)
+    for col in table.columns:
+        name = det._norm(col)
+        unit = det._detect_consumption_unit_from_name(name)
+        numeric = 2 if pd.api.types.is_numeric_dtype(table[col]) else int(_coerce_numeric(table[col]).notna().mean() >= 0.8)
+        score = (int(det._has_consumption_keyword(name)), 2 if unit == "kwh" else 1 if unit == "kw" else 0, numeric)
+        if score > best_score:
+            best, best_score = col, score
+    return best
+
+
+def _sampled_blocks(n: int) -> np.ndarray:
+    """
+    Rows in the head / middle / tail blocks scored by the sample.
+    """
+    block = ConsumptionColumnDetector.SCORE_SAMPLE_ROWS // 3
+    mid = (n - block) // 2
+    mask = np.zeros(n, dtype=bool)
+    mask[:block] = mask[mid : mid + block] = mask[-block:] = True
+    return mask
+
+
+def test_sample_misjudged_candidates_are_confirmed_on_full_data():
+    n = 20_000
+    sampled = _sampled_blocks(n)
+    numbers = np.round(np.linspace(0, 10, n), 3).astype(str).astype(object)
+
+    # Numeric in the sampled blocks only (sample: 1, full: 0)
+    looks_numeric = np.where(sampled, numbers, "n/a").astype(object)
+    # Text in the sampled blocks only (sample: 0, full: 1)
+    looks_text = np.where(sampled, "n/a", numbers).astype(object)
+
+    table = pd.DataFrame({"verbrauch a (kwh)": looks_numeric, "verbrauch b (kwh)": looks_text})
+
+    det = ConsumptionColumnDetector(table)
+    assert det.detect_consumption_column() == "verbrauch b (kwh)" == _full_scores(table)
+    assert list(det._coerced) == ["verbrauch b (kwh)"]
+
+
+def test_numeric_column_beats_text_column_with_same_name_score():
+    table = pd.DataFrame(
+        {
+            "verbrauch (kwh)": ["n/a"] * 10,
+            "energie kwh": np.arange(10, dtype=float),
+            "status": ["W"] * 10,
+        }
+    )
+
+    assert ConsumptionColumnDetector(table).detect_consumption_column() == "energie kwh" == _full_scores(table)
@@ -0,0 +1,24 @@
+import pandas as pd
+import pytest
+
+from src.intelligence.header import HeaderDetector
+
+
+def _table_with_header_at(row: int) -> pd.DataFrame:
+    cells = [["note", str(i)] for i in range(row)]
+    cells.append(["Datum", "Verbrauch (kWh)"])
+    cells += [["01.01.2024", "1,5"]] * 3
+    return pd.DataFrame(cells)
+
+
+def test_header_below_first_thousand_rows_is_found():
+    detector = HeaderDetector(_table_with_header_at(1500))
+
+    assert detector.find_header_row() == 1500
+
+
+def test_capped_scan_names_the_limit():
+    detector = HeaderDetector(_table_with_header_at(1500), max_scan_rows=1000)
+
+    with pytest.raises(ValueError, match="first 1000 rows; pass max_scan_rows=None"):
+        detector.find_header_row()
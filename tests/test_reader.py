@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data_core.reader import DataReader
+
+
+@pytest.mark.parametrize(
+    "columns, sep, expected",
+    [
+        # Decisive cells
+        ([["1.234,56", "7,5"]], ";", (",", ".")),
+        ([["1,234.56", "7.5"]], ",", (".", ",")),
+        ([["0,5", "12,25"]], "\t", (",", None)),
+        ([["1,234,567", "850"]], "\t", (".", ",")),
+        # "12,375" alone: decimal comma only with file / column context
+        ([["Verbrauch", "12,375", "40,650"]], ";", (",", None)),
+        ([["Verbrauch", "12,375", "40,650"]], "\t", (",", None)),
+        ([["Verbrauch", "12,375", "40,650"]], None, (",", None)),
+        ([["12,375", "1.500"]], "\t", (".", None)),
+        ([["12,375", "40,650"], ["12.25"]], "\t", (".", None)),
+        # Nothing number-like with separators
+        ([["Datum", "01.01.2024"], ["Wert", "12"]], ";", (".", None)),
+    ],
+)
+def test_detect_number_format(columns, sep, expected):
+    assert DataReader._detect_number_format(columns, sep) == expected
+
+
+def test_csv_decimal_comma_with_three_decimals(tmp_path):
+    lines = ["Datum;Uhrzeit;Verbrauch (kWh)"]
+    lines += [f"01.01.2024;00:{15 * i:02d};{12 + i},375" for i in range(4)]
+    path = tmp_path / "export.csv"
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    table = DataReader(str(path)).read_data()
+
+    values = pd.to_numeric(table.iloc[1:, 2]).to_numpy()
+    np.testing.assert_allclose(values, [12.375, 13.375, 14.375, 15.375])
+
+
+def test_excel_text_numbers_keep_digit_only_ids(tmp_path):
+    from openpyxl import Workbook
+
+    wb = Workbook()
+    ws = wb.active
+    ws.append(["Zählpunkt", "Verbrauch (kWh)", "Menge"])
+    for i in range(5):
+        ws.append([f"00123{i:02d}", f"1.234,{i}5", f"{i}"])
+    path = tmp_path / "export.xlsx"
+    wb.save(path)
+
+    table = DataReader(str(path)).read_data()
+
+    assert table.iloc[1:, 0].tolist() == [f"00123{i:02d}" for i in range(5)]
+    assert table.iloc[1:, 1].tolist() == [1234.05, 1234.15, 1234.25, 1234.35, 1234.45]
+    assert table.iloc[1:, 2].tolist() == [str(i) for i in range(5)]
@@ -0,0 +1,237 @@
+"""
+The vectorized date/time parsers must give the same results as the original
+per-row implementation (regex search + `pd.to_datetime` per value), kept below
+as the reference.
+"""
+import re
+import warnings
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data_core.reader import ARROW_STRING
+from src.intelligence.columns.time import Preference_Date_And_Hour, Preference_SingleDateTime
+
+
+# ==============================================================================
+# Reference: the original per-row loop
+# ==============================================================================
+_DMY = re.compile(r"(?P<d>\d{1,2})[.\-/](?P<m>\d{1,2})[.\-/](?P<y>\d{2,4})")
+_YMD = re.compile(r"(?P<y>\d{4})[.\-/](?P<m>\d{1,2})[.\-/](?P<d>\d{1,2})")
+_TIME = re.compile(r"(?P<h>\d{1,2})[:.](?P<mi>\d{2})(?:[:.](?P<s>\d{2}))?")
+
+
+def _reference_hhmmss(txt):
+    if txt is None or pd.isna(txt):
+        return None
+    t = str(txt).strip()
+    if t == "":
+        return None
+
+    t2 = re.sub(r"[^\d]+", ":", t)
+    t2 = re.sub(r":+", ":", t2).strip(":")
+    parts = t2.split(":") if ":" in t2 else [t2]
+
+    if len(parts) == 1:
+        digits = parts[0]
+        if not digits.isdigit():
+            return None
+        if len(digits) == 6:
+            hh, mm, ss = digits[:2], digits[2:4], digits[4:6]
+        elif len(digits) in (3, 4):
+            hh, mm, ss = digits[:-2], digits[-2:], "00"
+        elif len(digits) in (1, 2):
+            hh, mm, ss = digits, "00", "00"
+        else:
+            return None
+    elif len(parts) == 2:
+        (hh, mm), ss = parts, "00"
+    else:
+        hh, mm, ss = parts[0], parts[1], parts[2]
+
+    try:
+        h, m, s = int(hh), int(mm), int(ss)
+    except Exception:
+        return None
+    if not (0 <= h <= 23 and 0 <= m <= 59 and 0 <= s <= 59):
+        return None
+    return f"{h:02d}:{m:02d}:{s:02d}"
+
+
+def _reference_single(values: pd.Series) -> pd.Series:
+    dates, hours = [], []
+    for v in values.astype("string").tolist():
+        if pd.isna(v):
+            dates.append(pd.NA)
+            hours.append(pd.NA)
+            continue
+
+        txt = str(v).strip()
+        dm = _YMD.search(txt) or _DMY.search(txt)
+        if not dm:
+            dates.append(pd.NA)
+            hours.append(pd.NA)
+            continue
+
+        y = int(dm.group("y"))
+        if y < 100:
+            y = 2000 + y if y <= 69 else 1900 + y
+        dates.append(f"{y:04d}-{int(dm.group('m')):02d}-{int(dm.group('d')):02d}")
+
+        rest = (txt[: dm.start()] + " " + txt[dm.end():]).strip()
+        rest = re.sub(r"[T,;|]+", " ", rest)
+        rest = re.sub(r"\s+", " ", rest).strip()
+
+        tm = _TIME.search(rest)
+        if tm:
+            hour = _reference_hhmmss(f"{tm.group('h')}:{tm.group('mi')}:{tm.group('s') or '00'}")
+        else:
+            hour = _reference_hhmmss(rest)
+        hours.append(hour if hour else pd.NA)
+
+    combined = pd.Series(dates, dtype="string") + " " + pd.Series(hours, dtype="string")
+    return pd.to_datetime(combined, errors="coerce", format="%Y-%m-%d %H:%M:%S")
+
+
+def _reference_date_and_hour(dates: pd.Series, hours: pd.Series) -> pd.Series:
+    date_s = pd.to_datetime(dates, errors="coerce").dt.normalize().dt.strftime("%Y-%m-%d").astype("string")
+    hour_s = pd.Series([_reference_hhmmss(v) for v in hours], dtype="string")
+    combined = date_s.reset_index(drop=True) + " " + hour_s
+    return pd.to_datetime(combined, errors="coerce", format="%Y-%m-%d %H:%M:%S")
+
+
+def _assert_same_moments(actual: pd.Series, expected: pd.Series) -> None:
+    np.testing.assert_array_equal(
+        actual.to_numpy(dtype="datetime64[ns]"),
+        expected.to_numpy(dtype="datetime64[ns]"),
+    )
+
+
+# ==============================================================================
+# Single date+time column
+# ==============================================================================
+SINGLE_CASES = {
+    "german": ["01.01.2024 00:15", "31.12.2023 23:45:30", "1.2.2024 9.30", "29.02.2024 12:00"],
+    "iso": ["2024-01-01 00:15:00", "2024-01-01T00:15", "2024/3/5 7:05", "2024-06-30;18:00"],
+    "two_digit_years": ["01.01.24 00:15", "15.06.69 10:00", "15.06.70 10:00", "31/12/99 23:59"],
+    "hour_24": ["01.01.2024 24:00", "2024-01-01 24:00:00", "01.01.2024 23:60", "01.01.2024 00:00:60"],
+    "am_pm": ["01.01.2024 1:15 PM", "01.01.2024 12:00 AM", "2024-01-01 11:59:59 pm", "01.01.2024 1 PM"],
+    "digits_only_time": ["01.01.2024 0015", "01.01.2024 930", "01.01.2024 001500", "01.01.2024 12345"],
+    "invalid_dates": ["31.04.2024 10:00", "29.02.2023 10:00", "00.01.2024 10:00", "15.13.2024 10:00"],
+    "blank_and_nan": ["", "   ", None, np.nan, "01.01.2024 00:15", "no date here"],
+    "repeated": ["01.01.2024 00:15"] * 3 + ["01.01.2024 00:30"] * 2 + [None],
+    "non_ascii": ["٠١.٠١.٢٠٢٤ ١٠:٣٠", "01.01.2024 10:30", "01.01.2024 10:30 Uhr"],
+}
+
+
+@pytest.mark.parametrize("values", list(SINGLE_CASES.values()), ids=list(SINGLE_CASES))
+@pytest.mark.parametrize("dtype", [object, "string", ARROW_STRING])
+def test_single_datetime_matches_reference(values, dtype):
+    s = pd.Series(values, dtype=dtype)
+    table = pd.DataFrame({"ts": s})
+
+    pref = Preference_SingleDateTime(table, datetime_col="ts")
+    rate = pref.create_moment_column()
+
+    expected = _reference_single(s)
+    _assert_same_moments(table["moment"], expected)
+    assert rate == pytest.approx(float(expected.notna().mean()))
+
+
+def test_single_datetime_mixed_object_column():
+    s = pd.Series(
+        [
+            "01.01.2024 00:15",
+            pd.Timestamp("2024-01-01 00:30"),
+            datetime(2024, 1, 1, 0, 45),
+            20240101,
+            1.5,
+            None,
+            "",
+        ],
+        dtype=object,
+    )
+    table = pd.DataFrame({"ts": s})
+
+    Preference_SingleDateTime(table, datetime_col="ts").create_moment_column()
+
+    _assert_same_moments(table["moment"], _reference_single(s))
+
+
+def test_single_datetime_written_strings_match_reference():
+    values = SINGLE_CASES["german"] + SINGLE_CASES["blank_and_nan"]
+    table = pd.DataFrame({"ts": pd.Series(values, dtype=object)})
+
+    Preference_SingleDateTime(table, datetime_col="ts").extract_date_and_hour(write_strings=True)
+
+    expected = _reference_single(table["ts"])
+    moment = pd.to_datetime(
+        table["date_norm"] + " " + table["hour_norm"], errors="coerce", format="%Y-%m-%d %H:%M:%S"
+    )
+    _assert_same_moments(moment, expected)
+
+
+# ==============================================================================
+# Separate date + hour columns
+# ==============================================================================
+HOUR_CASES = {
+    "separated": ["0:15", "00:15", "00:15:00", "9.30", "00-15-00", "23:59:59"],
+    "digits_only": ["001500", "0015", "930", "9", "09", "12345"],
+    "hour_24": ["24:00", "24:00:00", "2400", "23:60", "00:00:60", "-1:00"],
+    "am_pm": ["1:15 PM", "12:00 AM", "11:59:59 pm", "1 PM", "10 Uhr", "10:30 h"],
+    "blank_and_nan": ["", "   ", None, np.nan, "n/a", "10:30"],
+}
+
+
+@pytest.mark.parametrize("hours", list(HOUR_CASES.values()), ids=list(HOUR_CASES))
+@pytest.mark.parametrize("dtype", [object, "string", ARROW_STRING])
+def test_date_and_hour_matches_reference(hours, dtype):
+    dates = pd.Series(["2024-01-01"] * (len(hours) - 1) + ["2024-02-29"], dtype=dtype)
+    hours = pd.Series(hours, dtype=dtype)
+    table = pd.DataFrame({"date": dates, "hour": hours})
+
+    rate = Preference_Date_And_Hour(table, "date", "hour").create_moment_column()
+
+    expected = _reference_date_and_hour(dates, hours)
+    _assert_same_moments(table["moment"], expected)
+    assert rate == pytest.approx(float(expected.notna().mean()))
+
+
+def test_date_and_hour_mixed_object_columns():
+    dates = pd.Series(
+        ["2024-01-01", pd.Timestamp("2024-01-02"), datetime(2024, 1, 3), None, "not a date"],
+        dtype=object,
+    )
+    hours = pd.Series(["00:15", 930, 7.0, "10:00", pd.Timestamp("2024-01-01 11:00")], dtype=object)
+    table = pd.DataFrame({"date": dates, "hour": hours})
+
+    Preference_Date_And_Hour(table, "date", "hour").create_moment_column()
+
+    _assert_same_moments(table["moment"], _reference_date_and_hour(dates, hours))
+
+
+@pytest.mark.parametrize(
+    "dates, expected",
+    [
+        # German "%d.%m.%Y": day-first, also when no day is above 12
+        (["01.01.2024", "02.01.2024", "13.01.2024"], ["2024-01-01", "2024-01-02", "2024-01-13"]),
+        (["01.02.2024", "03.04.2024"], ["2024-02-01", "2024-04-03"]),
+        (["1.2.24", None, ""], ["2024-02-01", None, None]),
+        # Slashes: month-first unless only day-first parses
+        (["01/02/2024", "12/31/2024"], ["2024-01-02", "2024-12-31"]),
+        (["13/01/2024", "01/02/2024"], ["2024-01-13", "2024-02-01"]),
+        # ISO dates are never read day-first
+        (["2024-01-02", "2024-01-13"], ["2024-01-02", "2024-01-13"]),
+    ],
+)
+def test_date_and_hour_numeric_dates(dates, expected):
+    table = pd.DataFrame({"date": pd.Series(dates, dtype=object), "hour": "10:00"})
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", UserWarning)
+        Preference_Date_And_Hour(table, "date", "hour").create_moment_column()
+
+    expected = pd.to_datetime(pd.Series(expected, dtype=object)) + pd.Timedelta(hours=10)
+    _assert_same_moments(table["moment"], expected)